@@ -75,6 +75,21 @@ BEHAVEX_ARGS = [
     'order_tests',
     'order_tests_strict',
     'order_tag_prefix',
+    'schedule_by_duration',
+    'default_duration',
+    'persistent_workers',
+    'worker_scoped_hooks',
+    'scenario_chunk_size',
+    'feature_cache_dir',
+    'scenario_timeout',
+    'max_tasks_per_worker',
+    'max_worker_rss_mb',
+    'serial_strict',
+    'shard_index',
+    'shard_count',
+    'journal_fsync_interval',
+    'resume',
+    'html_report_mode',
 ]
 
 
@@ -394,9 +409,191 @@ def parse_arguments(args):
         required=False,
     )
 
+    parser.add_argument(
+        '--schedule-by-duration',
+        '--schedule_by_duration',
+        nargs='+',
+        metavar='REPORT_JSON',
+        help="Submits the longest features/scenarios first in parallel executions, based on the durations "
+             "stored in one or more BehaveX JSON reports (report.json) from previous executions.",
+        required=False,
+    )
+
+    parser.add_argument(
+        '--default-duration',
+        '--default_duration',
+        type=float,
+        help="Estimated duration (in seconds) for the features/scenarios that are not found in the reports provided "
+             "by --schedule-by-duration. By default, the average scenario duration from those reports is used.",
+        required=False,
+    )
+
+    parser.add_argument(
+        '--persistent-workers',
+        '--persistent_workers',
+        help="Reuses the behave hooks (environment.py) and step definitions loaded by each parallel process, "
+             "instead of loading them again for every feature/scenario executed by the process.",
+        default=False,
+        action='store_true',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--worker-scoped-hooks',
+        '--worker_scoped_hooks',
+        help="Executes the before_all hook once per parallel process (instead of once per feature/scenario), "
+             "and the after_all hook when the process finishes. Objects to share between the "
+             "features/scenarios executed by a process can be stored in context.worker_scope.",
+        default=False,
+        action='store_true',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--scenario-chunk-size',
+        '--scenario_chunk_size',
+        type=int,
+        help="Maximum number of scenarios from the same feature submitted as a single task when running in "
+             "parallel by scenario. The scenarios of each task are executed by a single behave run.",
+        metavar='N',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--feature-cache-dir',
+        '--feature_cache_dir',
+        help="Directory used to cache the parsed feature files between executions. Cached features are "
+             "validated by modification time, size and content hash, and are also reused by the parallel processes.",
+        required=False,
+    )
+
+    parser.add_argument(
+        '--scenario-timeout',
+        '--scenario_timeout',
+        type=float,
+        help="Maximum time (in seconds) a scenario can run in parallel executions, for scenarios with no "
+             "@TIMEOUT_<seconds> tag. The parallel process running a timed out scenario is terminated and "
+             "replaced, and the scenario is reported as an error.",
+        metavar='SECONDS',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--max-tasks-per-worker',
+        '--max_tasks_per_worker',
+        type=int,
+        help="Maximum number of tasks (features/scenarios) executed by each parallel process. When reached, the "
+             "process is retired after finishing its task, and replaced by a new one.",
+        metavar='N',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--max-worker-rss-mb',
+        '--max_worker_rss_mb',
+        type=float,
+        help="Maximum resident memory (in MB) of each parallel process. Processes exceeding it are retired after "
+             "finishing their task, and replaced by new ones.",
+        metavar='MB',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--serial-strict',
+        '--serial_strict',
+        help="Executes the features/scenarios tagged as @SERIAL before the parallel ones, instead of executing "
+             "them in the main process while the parallel processes execute the rest.",
+        default=False,
+        action='store_true',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--shard-index',
+        '--shard_index',
+        type=int,
+        help="Index of the shard to execute (from 0 to --shard-count - 1), to split the features/scenarios to run "
+             "across several machines. Shards are balanced by the durations from the reports provided by "
+             "--schedule-by-duration (or by number of scenarios), and each feature/scenario is always assigned "
+             "to the same shard unless the suite changes significantly.",
+        metavar='INDEX',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--shard-count',
+        '--shard_count',
+        type=int,
+        help="Number of shards the features/scenarios to run are split into (see --shard-index).",
+        metavar='N',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--journal-fsync-interval',
+        '--journal_fsync_interval',
+        type=float,
+        help="Minimum time (in seconds) between syncs to disk of the results journal (results.ndjson in the "
+             "output folder), where the result of each feature/scenario is written as soon as it finishes. "
+             "Use 0 to sync every result. Default: 1 second.",
+        metavar='SECONDS',
+        required=False,
+    )
+
+    parser.add_argument(
+        '--resume',
+        help="Output folder of an interrupted execution to resume. The features/scenarios with results in its "
+             "results journal are not executed again, and the reports include their results as if the "
+             "execution was never interrupted. It can be the same output folder of the new execution.",
+        metavar='OUTPUT_FOLDER',
+        required=False,
+    )
+
+    _add_html_report_mode_argument(parser)
+
+    parsed_args = parser.parse_args(args)
+    if (parsed_args.shard_index is None) != (parsed_args.shard_count is None):
+        parser.error('--shard-index and --shard-count must be provided together')
+    if parsed_args.shard_count is not None and not 0 <= parsed_args.shard_index < parsed_args.shard_count:
+        parser.error('--shard-index must be between 0 and --shard-count - 1')
+    return parsed_args
+
+
+def parse_merge_arguments(args):
+    """Process the command line arguments of the merge command (behavex merge)"""
+    parser = argparse.ArgumentParser(
+        prog='behavex merge',
+        description='BehaveX - merges the outputs of several executions (e.g. shards) into a single output'
+    )
+    parser.add_argument("reports", nargs="+", metavar='OUTPUT',
+                        help="Output folders (or report.json files) of the executions to merge")
+    parser.add_argument(
+        '-o',
+        '--output-folder',
+        '--output_folder',
+        default='output',
+        help='Output folder where the merged reports are generated.',
+        required=False,
+    )
+
+    _add_html_report_mode_argument(parser)
     return parser.parse_args(args)
 
 
+def _add_html_report_mode_argument(parser):
+    """Add the --html-report-mode argument (shared by the executions and the merge command)"""
+    parser.add_argument(
+        '--html-report-mode',
+        '--html_report_mode',
+        choices=['single', 'sharded'],
+        help="Layout of the HTML report. 'single' writes all the features and scenarios to report.html, and "
+             "'sharded' writes a small report.html with the summary of the features, and the scenarios of each "
+             "feature to a separate file that is loaded when the feature is expanded or filtered "
+             "(recommended for very large test suites). Default: single.",
+        required=False,
+    )
+
+
 def get_behavex_version():
     """Get BehaveX version from package metadata."""
     try:
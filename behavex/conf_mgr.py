@@ -12,7 +12,10 @@ This module process the configuration required by the framework. Default values
 
 from __future__ import absolute_import
 
+import argparse
+import copy
 import os
+from collections import namedtuple
 
 from configobj import ConfigObj
 from validate import Validator
@@ -22,6 +25,10 @@ from behavex.execution_singleton import ExecutionSingleton
 CONFIG = None
 CONFIG_PATH = None
 
+# Copy of the resolved configuration (plain dictionaries), sent once to each parallel process.
+# The processes install their own copy (see ConfigRun.from_snapshot), so it is never modified
+ConfigSnapshot = namedtuple('ConfigSnapshot', ['config', 'args', 'environ'])
+
 
 def get_config():
     """Returns a dictionary containing
@@ -129,6 +136,24 @@ class ConfigRun(metaclass=ExecutionSingleton):
     def get_env(self, key, optional=None):
         return self.environ.get(key.lower(), optional)
 
+    def snapshot(self):
+        """Returns a compact copy of the resolved configuration (plain
+        dictionaries instead of the ConfigObj tree and argparse namespace),
+        to be sent to the parallel processes"""
+        config = self.config.dict() if hasattr(self.config, 'dict') else dict(self.config)
+        args = dict(vars(self.args)) if self.args is not None else None
+        return ConfigSnapshot(config, args, dict(self.environ))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Returns a ConfigRun instance with a copy of the configuration
+        snapshot (changes performed through the instance do not modify it)"""
+        config_run = cls.__new__(cls)
+        config_run.config = copy.deepcopy(snapshot.config)
+        config_run.args = argparse.Namespace(**copy.deepcopy(snapshot.args)) if snapshot.args is not None else None
+        config_run.environ = dict(snapshot.environ)
+        return config_run
+
 
 def get_param(key_chain, arg=None):
     return ConfigRun().get_param(key_chain, arg)
@@ -140,3 +165,9 @@ def get_env(key, optional=None):
 
 def set_env(key, value):
     ConfigRun().set_env(key, value)
+
+
+def install_config_snapshot(snapshot):
+    """Use the configuration snapshot received from the main process as the
+    ConfigRun instance of the current process"""
+    ExecutionSingleton._instances[ConfigRun] = ConfigRun.from_snapshot(snapshot)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Dependencies between the features/scenarios executed in parallel.
+
+Scenarios can declare the tests they depend on using @DEPENDS_ON_<tag> tags
+(they wait for all the tests tagged as @<tag>), or @AFTER_ORDER_<n> tags (they
+wait for all the tests with an order tag lower or equal than <n>, e.g.
+@ORDER_001). Each feature/scenario starts as soon as the tests it depends on
+were executed, and if any of them fails, it is reported as untested instead.
+
+When strict execution ordering is enabled (--order-tests-strict), each test
+also waits for the tests with a lower order, so tests with the same order run
+at the same time, without waiting for the rest of the tests.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import re
+
+DEPENDS_ON_TAG_PREFIX = 'DEPENDS_ON_'
+AFTER_ORDER_TAG_PREFIX = 'AFTER_ORDER_'
+DEPENDS_ON_TAG_REGEX = re.compile(r'^@?{}(.+)$'.format(DEPENDS_ON_TAG_PREFIX))
+AFTER_ORDER_TAG_REGEX = re.compile(r'^@?{}(\d+)$'.format(AFTER_ORDER_TAG_PREFIX))
+
+# States of the tasks in the dependency graph
+READY = 'ready'
+WAITING = 'waiting'
+BLOCKED = 'blocked'
+
+
+def get_task_dependencies(tags_list, order):
+    """Return the dependencies of a task (feature, scenario or chunk of scenarios).
+
+    Args:
+        tags_list (list): Tags of each scenario executed by the task (including the feature tags).
+        order (int): Execution order of the task (from its order tags).
+
+    Returns:
+        dict: Tags of the task, tags it depends on, order it should be executed after, and its order.
+    """
+    tags = set()
+    depends_on = set()
+    after_order = None
+    for scenario_tags in tags_list:
+        for tag in scenario_tags:
+            tag = str(tag)
+            tags.add(tag)
+            match = DEPENDS_ON_TAG_REGEX.match(tag)
+            if match:
+                depends_on.add(match.group(1))
+                continue
+            match = AFTER_ORDER_TAG_REGEX.match(tag)
+            if match:
+                after_order = max(int(match.group(1)), after_order or 0)
+    return {'tags': tags, 'depends_on': depends_on, 'after_order': after_order, 'order': order}
+
+
+def has_dependencies(task_dependencies):
+    """Check whether a task declares dependencies (with @DEPENDS_ON_<tag> or @AFTER_ORDER_<n> tags)."""
+    return bool(task_dependencies and (task_dependencies['depends_on'] or
+                                       task_dependencies['after_order'] is not None))
+
+
+def merge_dependencies(dependencies_list):
+    """Return the dependencies of a task executing several scenarios."""
+    orders = [dependencies['order'] for dependencies in dependencies_list]
+    after_orders = [dependencies['after_order'] for dependencies in dependencies_list
+                    if dependencies['after_order'] is not None]
+    return {'tags': set().union(*[dependencies['tags'] for dependencies in dependencies_list]),
+            'depends_on': set().union(*[dependencies['depends_on'] for dependencies in dependencies_list]),
+            'after_order': max(after_orders) if after_orders else None,
+            'order': min(orders) if orders else None}
+
+
+def get_referenced_tags(dependencies_list):
+    """Return the tags that tasks depend on (using @DEPENDS_ON_<tag> tags)."""
+    return set().union(*[dependencies['depends_on'] for dependencies in dependencies_list])
+
+
+def get_dependencies_key(dependencies, referenced_tags):
+    """Return a key identifying the dependencies of a task, so tasks with the same
+    dependencies (which are executed at the same moment) can be grouped."""
+    return (dependencies['order'],
+            dependencies['after_order'],
+            tuple(sorted(dependencies['depends_on'])),
+            tuple(sorted(dependencies['tags'] & referenced_tags)))
+
+
+class DependencyGraph(object):
+    """Tracks the tasks that were executed, to determine which tasks can be executed.
+
+    Tasks are grouped by tag (only the tags other tasks depend on) and by
+    order, and each group keeps the tasks that were not executed yet, so
+    checking the dependencies of a task does not require going through all
+    the tasks it depends on. Tasks do not depend on themselves.
+    """
+
+    def __init__(self, tasks, get_dependencies, strict_order=False, executed_first=()):
+        """
+        Args:
+            tasks (list): All the tasks to execute (including the ones executed by the main process).
+            get_dependencies (callable): Returns the dependencies of a task (see get_task_dependencies).
+            strict_order (bool): Whether each task should wait for the tasks with a lower order.
+            executed_first (list): Tasks executed before the rest of the tasks are submitted (e.g. the
+                serial ones), which do not wait for the tasks with a lower order.
+        """
+        self.strict_order = strict_order
+        self._executed_first = set(id(task) for task in executed_first)
+        self._dependencies = {}
+        self._pending_by_tag = {}
+        self._pending_by_order = {}
+        self._failed_tags = set()
+        self._failed_orders = set()
+        dependencies_list = [(task, get_dependencies(task)) for task in tasks]
+        referenced_tags = get_referenced_tags([dependencies for _, dependencies in dependencies_list])
+        for task, dependencies in dependencies_list:
+            self._dependencies[id(task)] = dependencies
+            for tag in dependencies['tags'] & referenced_tags:
+                self._pending_by_tag.setdefault(tag, set()).add(id(task))
+            self._pending_by_order.setdefault(dependencies['order'], set()).add(id(task))
+        self.missing_tags = sorted(tag for tag in referenced_tags if tag not in self._pending_by_tag)
+
+    def get_state(self, task):
+        """Return the state of a task: READY if it can be executed, WAITING if the tasks it
+        depends on were not executed yet, or BLOCKED if any of them failed."""
+        dependencies = self._dependencies[id(task)]
+        waiting = False
+        for tag in dependencies['depends_on']:
+            if tag in self._failed_tags:
+                return BLOCKED
+            waiting = waiting or _has_other_tasks(self._pending_by_tag.get(tag, ()), id(task))
+        if dependencies['after_order'] is not None:
+            for order, pending_tasks in self._pending_by_order.items():
+                if order <= dependencies['after_order']:
+                    if order in self._failed_orders:
+                        return BLOCKED
+                    waiting = waiting or _has_other_tasks(pending_tasks, id(task))
+        if self.strict_order and not waiting and id(task) not in self._executed_first:
+            # Failures do not prevent the execution of tests with a higher order
+            waiting = any(pending_tasks for order, pending_tasks in self._pending_by_order.items()
+                          if order < dependencies['order'])
+        return WAITING if waiting else READY
+
+    def task_done(self, task, failed):
+        """Register that a task was executed (or reported as untested)."""
+        dependencies = self._dependencies[id(task)]
+        for tag in dependencies['tags']:
+            if tag in self._pending_by_tag:
+                self._pending_by_tag[tag].discard(id(task))
+                if failed:
+                    self._failed_tags.add(tag)
+        self._pending_by_order[dependencies['order']].discard(id(task))
+        if failed:
+            self._failed_orders.add(dependencies['order'])
+
+
+def _has_other_tasks(tasks, task_id):
+    return len(tasks) > (1 if task_id in tasks else 0)
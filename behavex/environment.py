@@ -22,12 +22,13 @@ from behave.runner import Context, ModelRunner
 from behavex import conf_mgr
 from behavex.conf_mgr import get_env, get_param
 from behavex.global_vars import global_vars
-from behavex.outputs import report_json, report_xml
+from behavex.outputs import report_xml
 from behavex.outputs.report_utils import (create_log_path, get_string_hash,
                                           strip_ansi_codes)
 from behavex.utils import (LOGGING_CFG, create_custom_log_when_called,
                            get_autoretry_attempts, get_logging_level,
                            get_scenario_tags, get_scenarios_instances)
+from behavex.worker import defer_worker_after_all, run_worker_before_all
 
 Context.__getattribute__ = create_custom_log_when_called
 
@@ -59,6 +60,7 @@ def extend_behave_hooks():
     behave_run_hook = ModelRunner.run_hook
     behavex_env = sys.modules[__name__]
     is_dry_run = get_param('dry_run')
+    worker_scoped_hooks = get_param('worker_scoped_hooks')
 
     def run_hook(self, name, context=None, *args):
 
@@ -110,7 +112,12 @@ def extend_behave_hooks():
                 # noinspection PyUnresolvedReferences
                 if not is_dry_run:
                     try:
-                        behave_run_hook(self, name, context, *args)
+                        if name == 'before_all' and worker_scoped_hooks:
+                            # before_all is executed only once by each process
+                            run_worker_before_all(self, actual_context,
+                                                  lambda: behave_run_hook(self, name, context, *args))
+                        else:
+                            behave_run_hook(self, name, context, *args)
                     except Exception as hook_error:
                         # Log but don't fail - some hooks might not be implemented in all versions
                         _log_exception_and_continue(f'behave_run_hook({name}) - before/tag', hook_error)
@@ -166,7 +173,11 @@ def extend_behave_hooks():
                 # noinspection PyUnresolvedReferences
                 if not is_dry_run:
                     try:
-                        behave_run_hook(self, name, context, *args)
+                        if name == 'after_all' and worker_scoped_hooks:
+                            # after_all is executed when the process finishes
+                            defer_worker_after_all(self, lambda: behave_run_hook(self, name, context, *args))
+                        else:
+                            behave_run_hook(self, name, context, *args)
                     except Exception as hook_error:
                         # Log but don't fail - some hooks might not be implemented in all versions
                         _log_exception_and_continue(f'behave_run_hook({name}) - after', hook_error)
@@ -358,13 +369,10 @@ def after_feature(context, feature):  # pyright: ignore[reportUnusedParameter]
         _log_exception_and_continue('after_feature (behavex)', exception)
 
 
-def after_all(context):
-    try:
-        # noinspection PyProtectedMember
-        feature_list = report_json.generate_execution_info(context._runner.features)
-        report_json.generate_json_report(feature_list)
-    except Exception as exception:
-        _log_exception_and_continue('after_all (json_report)', exception)
+def after_all(context):  # pyright: ignore[reportUnusedParameter]
+    # The JSON report is not written here, as the runner builds it from the executed features
+    # once behave finishes (see _launch_behave), and merges the reports of all the executions
+    pass
 
 
 
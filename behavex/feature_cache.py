@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Persistent cache of parsed feature files.
+
+Each feature file is parsed once, and the resulting behave model is stored in
+the cache directory together with a compact index (the tags of each scenario),
+keyed by the feature path and validated using its modification time, size and
+content hash. The main process uses the index to discard the features that do
+not match the tags filter without loading their model, and the parallel
+processes reuse the cached models instead of parsing the feature files again.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import copyreg
+import gc
+import hashlib
+import io
+import logging
+import os
+import pickle
+import tempfile
+
+import behave
+from behave import parser as gherkin
+from behave.model import Tag
+from behave.parser import parse_feature
+
+from behavex.conf_mgr import get_param
+
+CACHE_VERSION = 1
+
+_feature_caches = {}
+_original_parse_file = gherkin.parse_file
+
+
+def _reduce_tag(tag):
+    return Tag, (str(tag), tag.line)
+
+
+def dumps_feature(feature):
+    """Serialize a behave feature model (behave tags cannot be pickled by default)."""
+    model_stream = io.BytesIO()
+    pickler = pickle.Pickler(model_stream, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[Tag] = _reduce_tag
+    pickler.dump(feature)
+    return model_stream.getvalue()
+
+
+def loads_feature(model_data):
+    """Deserialize a behave feature model serialized by dumps_feature."""
+    # The garbage collector is disabled while loading the model, as it
+    # would be triggered many times by the large number of objects created
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(model_data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+class FeatureCacheEntry(object):
+    """Cached feature: header (file signature and scenario tags) and the
+    pickled behave model, which is only deserialized when requested."""
+
+    def __init__(self, header, model_data, feature=None):
+        self.header = header
+        self.model_data = model_data
+        # Model just parsed (returned by the first load, instead of deserializing it)
+        self._feature = feature
+
+    @property
+    def scenarios_tags(self):
+        return self.header['scenarios_tags']
+
+    def load_feature(self):
+        if self._feature is not None:
+            feature, self._feature = self._feature, None
+            return feature
+        return loads_feature(self.model_data)
+
+
+class FeatureCache(object):
+    """On-disk cache of parsed feature files, shared by all the processes of
+    a BehaveX execution (and by consecutive executions)."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def parse_file(self, filename, language=None):
+        """Return the behave model of a feature file (None if the file does
+        not contain a feature), the same way behave.parser.parse_file does."""
+        return self.get_entry(filename, language).load_feature()
+
+    def get_scenarios_tags(self, filename, language=None):
+        """Return the tags of each scenario (including outline examples) of a feature file."""
+        return self.get_entry(filename, language).scenarios_tags
+
+    def get_entry(self, filename, language=None):
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get((filename, language))
+        if entry and entry.header['signature'] == signature:
+            return entry
+        entry_path = self._get_entry_path(filename, language)
+        entry = self._read_entry(entry_path)
+        if entry and entry.header['signature'] == signature:
+            self.hits += 1
+        else:
+            with open(filename, 'rb') as feature_file:
+                data = feature_file.read()
+            content_hash = hashlib.sha1(data).hexdigest()  # nosec
+            if entry and entry.header['content_hash'] == content_hash:
+                # Only the file signature changed (e.g. the file was checked out again)
+                self.hits += 1
+                entry.header['signature'] = signature
+            else:
+                self.misses += 1
+                entry = self._parse(filename, data, language)
+                entry.header['content_hash'] = content_hash
+                entry.header['signature'] = signature
+            self._write_entry(entry_path, entry)
+        self._entries[(filename, language)] = entry
+        return entry
+
+    def _get_entry_path(self, filename, language):
+        key = '{}|{}'.format(filename, language or '')
+        entry_name = hashlib.sha1(key.encode('utf-8')).hexdigest()  # nosec
+        return os.path.join(self.cache_dir, entry_name + '.pickle')
+
+    @staticmethod
+    def _parse(filename, data, language):
+        # Imported here, as the utils module imports this one
+        from behavex.utils import get_scenario_tags, get_scenarios_instances
+
+        feature = parse_feature(data.decode('utf8'), language, filename)
+        scenarios_tags = []
+        if feature and hasattr(feature, 'scenarios'):
+            for scenario in get_scenarios_instances(feature.scenarios):
+                scenarios_tags.append([str(tag) for tag in get_scenario_tags(scenario)])
+        header = {'version': CACHE_VERSION,
+                  'behave_version': behave.__version__,
+                  'scenarios_tags': scenarios_tags}
+        return FeatureCacheEntry(header, dumps_feature(feature), feature)
+
+    @staticmethod
+    def _read_entry(entry_path):
+        try:
+            with open(entry_path, 'rb') as entry_file:
+                header = pickle.load(entry_file)
+                model_data = entry_file.read()
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return None
+        if (not isinstance(header, dict) or header.get('version') != CACHE_VERSION or
+                header.get('behave_version') != behave.__version__):
+            return None
+        return FeatureCacheEntry(header, model_data)
+
+    def _write_entry(self, entry_path, entry):
+        # The entry is written to a temporary file and then renamed, as other
+        # processes could be reading the same entry
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'wb') as entry_file:
+                pickle.dump(entry.header, entry_file, protocol=pickle.HIGHEST_PROTOCOL)
+                entry_file.write(entry.model_data)
+            os.replace(temp_path, entry_path)
+        except OSError as ex:
+            logging.warning('Feature cache entry could not be written to "{}": {}'.format(entry_path, ex))
+
+
+def get_feature_cache():
+    """Return the feature cache of the current execution, or None if it is disabled."""
+    cache_dir = get_param('feature_cache_dir')
+    if not cache_dir:
+        return None
+    if cache_dir not in _feature_caches:
+        _feature_caches[cache_dir] = FeatureCache(cache_dir)
+    return _feature_caches[cache_dir]
+
+
+def install_feature_cache():
+    """Make behave parse the feature files through the feature cache (if enabled),
+    so the behave runners executed by the current process reuse the cached models."""
+    feature_cache = get_feature_cache()
+    if feature_cache is None:
+        gherkin.parse_file = _original_parse_file
+        return
+
+    def parse_file(filename, language=None):
+        return feature_cache.parse_file(filename, language)
+
+    gherkin.parse_file = parse_file
@@ -24,11 +24,15 @@ class GlobalVars:
             'xml': 'xml.jinja2',
             'xml_json': 'xml_json.jinja2',
             'manifest': 'manifest.jinja2',
+            'feature_fragment': 'feature_fragment.jinja2',
+            'feature_shard': 'feature_shard.jinja2',
         }
         self._retried_scenarios = {}
         self._steps_definitions = {}
         self._rerun_failures = False
         self._progress_bar_instance = None
+        self._results_journal = None
+        self._resumed_execution = None
         self._execution_start_time = time.time()
         self._execution_end_time = None
 
@@ -81,6 +85,22 @@ class GlobalVars:
     def progress_bar_instance(self, progress_bar_instance):
         self._progress_bar_instance = progress_bar_instance
 
+    @property
+    def results_journal(self):
+        return self._results_journal
+
+    @results_journal.setter
+    def results_journal(self, results_journal):
+        self._results_journal = results_journal
+
+    @property
+    def resumed_execution(self):
+        return self._resumed_execution
+
+    @resumed_execution.setter
+    def resumed_execution(self, resumed_execution):
+        self._resumed_execution = resumed_execution
+
     @property
     def execution_start_time(self):
         return self._execution_start_time
@@ -99,6 +119,10 @@ class GlobalVars:
             self._execution_end_time = time.time()
         return self._execution_end_time
 
+    @execution_end_time.setter
+    def execution_end_time(self, execution_end_time):
+        self._execution_end_time = execution_end_time
+
 
 
 global_vars = GlobalVars()
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Merge of the outputs generated by several executions (e.g. the shards of a
+test suite executed in different machines) into a single output, using
+"behavex merge <output folder or report.json>... -o <output folder>".
+
+The JSON reports are read one feature at a time: the first pass locates the
+features in each report (by byte offset), and the second one reads the parts
+of each feature from the reports it was executed in, merges them and writes
+the merged feature to the output report and its JUnit report. The scenario
+logs and evidence are copied to the output folder, and the HTML report is
+generated from the merged report.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import codecs
+import json
+import logging
+import os
+import shutil
+from collections import OrderedDict
+
+from behavex import serializer
+from behavex.arguments import parse_merge_arguments
+from behavex.conf_mgr import get_env, set_env
+from behavex.global_vars import global_vars
+from behavex.outputs import report_html
+from behavex.outputs.report_utils import get_status
+from behavex.outputs.report_xml import export_feature_to_xml
+from behavex.utils import (copy_bootstrap_html_generator,
+                           join_scenario_reports, print_parallel)
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class ReportReader(object):
+    """Reads the features of a report.json file one at a time, so the memory used
+    is bounded by the largest feature instead of the whole report."""
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, report_path):
+        self.report_path = report_path
+        # Top level values of the report, other than the features (environment, steps definitions)
+        self.sections = {}
+        self._file = None
+        self._decoder = None
+        self._buffer = ''
+        self._offset = 0
+        self._eof = False
+
+    def iter_features(self):
+        """Yield the features of the report.
+
+        Yields:
+            tuple: Byte offset and size of the feature in the report, and the feature.
+        """
+        with open(self.report_path, 'rb') as report_file:
+            self._file = report_file
+            self._decoder = codecs.getincrementaldecoder('utf-8')()
+            self._buffer = ''
+            self._offset = 0
+            self._eof = False
+            self._expect('{')
+            while not self._consume('}'):
+                key = self._decode()[0]
+                self._expect(':')
+                if key == 'features':
+                    self._expect('[')
+                    while not self._consume(']'):
+                        self._skip_whitespaces()
+                        offset = self._offset
+                        feature, size = self._decode()
+                        yield offset, size, feature
+                        self._consume(',')
+                else:
+                    self.sections[key] = self._decode()[0]
+                self._consume(',')
+
+    def read_feature(self, offset, size):
+        """Read a feature located by iter_features."""
+        with open(self.report_path, 'rb') as report_file:
+            report_file.seek(offset)
+            return serializer.loads(report_file.read(size))
+
+    def _read(self, size):
+        data = self._file.read(size)
+        self._eof = not data
+        self._buffer += self._decoder.decode(data, final=self._eof)
+
+    def _skip_whitespaces(self):
+        while True:
+            stripped_buffer = self._buffer.lstrip()
+            # Whitespaces are single byte characters
+            self._offset += len(self._buffer) - len(stripped_buffer)
+            self._buffer = stripped_buffer
+            if self._buffer or self._eof:
+                return
+            self._read(self.CHUNK_SIZE)
+
+    def _consume(self, char):
+        self._skip_whitespaces()
+        if not self._buffer:
+            raise ValueError('Unexpected end of the report "{}"'.format(self.report_path))
+        if self._buffer[0] != char:
+            return False
+        self._buffer = self._buffer[1:]
+        self._offset += 1
+        return True
+
+    def _expect(self, char):
+        if not self._consume(char):
+            raise ValueError('Invalid report "{}": "{}" expected at byte {}'.format(self.report_path,
+                                                                                   char,
+                                                                                   self._offset))
+
+    def _decode(self):
+        """Decode the next JSON value, returning it together with its size in bytes."""
+        self._skip_whitespaces()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer)
+                # Values at the end of the buffer (e.g. numbers) may continue in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    break
+            except ValueError:
+                if self._eof:
+                    raise
+            # The buffer is doubled when reading large values, so they are decoded a few times at most
+            self._read(max(self.CHUNK_SIZE, len(self._buffer)))
+        size = len(self._buffer[:end].encode('utf-8'))
+        self._buffer = self._buffer[end:]
+        self._offset += size
+        return value, size
+
+
+def main(args):
+    """Merge the outputs provided in the command line arguments.
+
+    Args:
+        args (list): Command-line arguments (after "behavex merge").
+
+    Returns:
+        int: Exit code.
+    """
+    args_parsed = parse_merge_arguments(args)
+    # Logging is not configured by the merge command, so the messages are displayed explicitly
+    logging.getLogger('bhx_parallel').setLevel(logging.INFO)
+    report_paths = []
+    for path in args_parsed.reports:
+        report_path = os.path.join(path, global_vars.report_filenames['report_json']) if os.path.isdir(path) else path
+        if not os.path.isfile(report_path):
+            print_parallel('merge.not_found', report_path)
+            return EXIT_ERROR
+        report_paths.append(report_path)
+    merge_reports(report_paths, args_parsed.output_folder, args_parsed.html_report_mode)
+    return EXIT_OK
+
+
+def merge_reports(report_paths, output_folder, html_report_mode=None):
+    """Merge several report.json files (and their logs) into the output folder,
+    generating the merged JSON, JUnit and HTML reports.
+
+    Features executed in more than one report (e.g. features whose scenarios
+    were split across shards) are merged as the scenarios executed in parallel.
+
+    Args:
+        report_paths (list): Paths of the report.json files to merge.
+        output_folder (str): Folder where the merged outputs are generated.
+        html_report_mode (str): Layout of the HTML report ('single' or 'sharded').
+
+    Returns:
+        dict: Totals of the merged report (features, split features, and scenarios by status).
+    """
+    _prepare_output_folder(report_paths, output_folder)
+    readers = [ReportReader(report_path) for report_path in report_paths]
+    feature_locations = OrderedDict()
+    environment = []
+    steps_definition = {}
+    # Scenario start and stop times (in milliseconds)
+    start_time = stop_time = None
+    for reader_index, reader in enumerate(readers):
+        for offset, size, feature in reader.iter_features():
+            feature_locations.setdefault(feature['filename'], []).append((reader_index, offset, size))
+            for scenario in feature['scenarios']:
+                if 'start' in scenario and 'stop' in scenario:
+                    start_time = min(scenario['start'], start_time if start_time is not None else scenario['start'])
+                    stop_time = max(scenario['stop'], stop_time if stop_time is not None else scenario['stop'])
+        environment.extend(item for item in reader.sections.get('environment') or [] if item not in environment)
+        steps_definition.update(reader.sections.get('steps_definition') or {})
+        _copy_logs(os.path.dirname(reader.report_path), output_folder)
+    print_parallel('merge.reading', len(readers), len(feature_locations))
+
+    totals = {'features': 0, 'split_features': 0, 'scenarios': {}}
+    feature_statuses = set()
+    failures = []
+    report_path = os.path.join(output_folder, global_vars.report_filenames['report_json'])
+    with codecs.open(report_path, 'w', 'utf8') as report_file:
+        report_file.write('{{"environment": {}, "steps_definition": {}, "features": ['.format(
+            json.dumps(environment), json.dumps(steps_definition)))
+        for feature_index, locations in enumerate(feature_locations.values()):
+            feature = _merge_feature([readers[reader_index].read_feature(offset, size)
+                                      for reader_index, offset, size in locations])
+            report_file.write((', ' if feature_index else '') + serializer.dumps(feature))
+            export_feature_to_xml(feature, False)
+            totals['features'] += 1
+            totals['split_features'] += 1 if len(locations) > 1 else 0
+            feature_statuses.add(feature['status'])
+            for scenario in feature['scenarios']:
+                totals['scenarios'][scenario['status']] = totals['scenarios'].get(scenario['status'], 0) + 1
+                if scenario['status'] in ('failed', 'error', 'undefined'):
+                    failures.append('{}:{}'.format(feature['filename'], scenario['line']))
+        report_file.write(']}')
+
+    status_path = os.path.join(output_folder, global_vars.report_filenames['report_overall'])
+    with open(status_path, 'w') as status_file:
+        overall_status = get_status({status: status for status in feature_statuses}) if feature_statuses \
+            else 'skipped'
+        status_file.write(json.dumps({'status': overall_status}))
+    if failures:
+        failures_path = os.path.join(output_folder, global_vars.report_filenames['report_failures'])
+        with open(failures_path, 'w') as failures_file:
+            failures_file.write(','.join(failures))
+
+    if start_time is not None:
+        global_vars.execution_start_time = start_time / 1000.0
+        global_vars.execution_end_time = stop_time / 1000.0
+    report_html.generate_report(serializer.load(report_path), html_report_mode=html_report_mode)
+    print_parallel('merge.summary',
+                   len(report_paths),
+                   totals['features'],
+                   totals['split_features'],
+                   sum(totals['scenarios'].values()),
+                   ', '.join('{} {}'.format(total, status) for status, total in sorted(totals['scenarios'].items())))
+    print_parallel('merge.html', os.path.join(output_folder, 'report.html'))
+    return totals
+
+
+def _merge_feature(feature_parts):
+    """Merge the parts of a feature executed in different reports, the same way
+    the reports of the scenarios executed in parallel are merged."""
+    if len(feature_parts) == 1:
+        return feature_parts[0]
+    return join_scenario_reports([{'features': [feature_part]} for feature_part in feature_parts])[0]['features'][0]
+
+
+def _prepare_output_folder(report_paths, output_folder):
+    """Create the output folder structure, and the environment used to generate the reports."""
+    output_folder = os.path.abspath(output_folder)
+    for report_path in report_paths:
+        if os.path.abspath(os.path.dirname(report_path)) == output_folder:
+            raise ValueError('The output folder cannot be one of the merged outputs: {}'.format(output_folder))
+    set_env('output', output_folder)
+    set_env('temp', os.path.join(output_folder, 'temp'))
+    set_env('logs', os.path.join(output_folder, 'outputs', 'logs'))
+    for folder in [get_env('temp'), get_env('logs'), os.path.join(output_folder, 'behave')]:
+        os.makedirs(folder, exist_ok=True)
+    copy_bootstrap_html_generator()
+    # The JUnit reports only include the scenarios matching the tags used in the executions
+    behave_tags_path = os.path.join(output_folder, global_vars.behave_tags_file)
+    source_tags_paths = [os.path.join(os.path.dirname(report_path), global_vars.behave_tags_file)
+                         for report_path in report_paths]
+    source_tags_path = next((path for path in source_tags_paths if os.path.isfile(path)), None)
+    if source_tags_path:
+        shutil.copyfile(source_tags_path, behave_tags_path)
+    else:
+        with open(behave_tags_path, 'w') as behave_tags_file:
+            behave_tags_file.write('')
+
+
+def _copy_logs(source_output_folder, output_folder):
+    """Copy the logs and evidence of the scenarios of a report (stored by scenario
+    identifier hash, so they are the same in the merged report)."""
+    source_logs = os.path.join(source_output_folder, 'outputs', 'logs')
+    if os.path.isdir(source_logs):
+        shutil.copytree(source_logs, os.path.join(output_folder, 'outputs', 'logs'), dirs_exist_ok=True)
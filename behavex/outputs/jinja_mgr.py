@@ -5,13 +5,22 @@
 */
 
 Jinja template handler.
+
+The compiled templates are stored in a bytecode cache on disk (in the
+temporary folder of the user by default), so the processes rendering the
+reports (e.g. the parallel processes exporting the JUnit reports of the
+features) load them instead of compiling the templates again. The cache
+folder can be set with the BEHAVEX_TEMPLATES_CACHE_DIR environment variable
+("none" disables the cache).
 """
 # __future__ has been added to maintain compatibility
 from __future__ import absolute_import
 
+import logging
 import os
 import re
 import sys
+import tempfile
 import traceback
 from xml.sax.saxutils import quoteattr  # nosec
 
@@ -26,6 +35,53 @@ from behavex.outputs.report_utils import (calculate_status, gather_errors,
                                           normalize_filename,
                                           pretty_print_time, resolving_type)
 
+TEMPLATES_CACHE_ENV_VARIABLE = 'BEHAVEX_TEMPLATES_CACHE_DIR'
+TEMPLATES_CACHE_PATTERN = 'behavex_%s.cache'
+
+
+class TemplatesBytecodeCache(jinja2.FileSystemBytecodeCache):
+    """Bytecode cache of the compiled templates, shared by all the processes.
+
+    The compiled templates are written to a temporary file that is renamed
+    afterwards (whatever the Jinja version), so processes never read
+    incomplete templates, and the cache entries are invalidated when the
+    template sources change. Errors writing to the cache (e.g. a read-only
+    folder) are ignored.
+    """
+
+    def dump_bytecode(self, bucket):
+        cache_filename = self._get_cache_filename(bucket)
+        temp_filename = None
+        try:
+            file_descriptor, temp_filename = tempfile.mkstemp(prefix=os.path.basename(cache_filename),
+                                                              suffix='.tmp',
+                                                              dir=os.path.dirname(cache_filename))
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                bucket.write_bytecode(temp_file)
+            os.replace(temp_filename, cache_filename)
+        except OSError as ex:
+            logging.debug('The compiled template could not be cached: {}'.format(ex))
+            if temp_filename and os.path.exists(temp_filename):
+                os.remove(temp_filename)
+
+
+def create_bytecode_cache():
+    """Create the bytecode cache of the compiled templates.
+
+    Returns:
+        TemplatesBytecodeCache: Bytecode cache, or None if it is disabled or the cache folder is not available.
+    """
+    cache_dir = os.environ.get(TEMPLATES_CACHE_ENV_VARIABLE) or None
+    if cache_dir and cache_dir.lower() == 'none':
+        return None
+    try:
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        return TemplatesBytecodeCache(cache_dir, TEMPLATES_CACHE_PATTERN)
+    except (OSError, RuntimeError) as ex:
+        logging.debug('The compiled templates will not be cached: {}'.format(ex))
+        return None
+
 
 class TemplateHandler(metaclass=ExecutionSingleton):
     """Handler to manage all jinja templates"""
@@ -33,7 +89,7 @@ class TemplateHandler(metaclass=ExecutionSingleton):
     def __init__(self, template_path):
         self.template_loader = jinja2.FileSystemLoader(searchpath=template_path)
         self.template_env = jinja2.Environment(
-            loader=self.template_loader, autoescape=True
+            loader=self.template_loader, autoescape=True, bytecode_cache=create_bytecode_cache()
         )
         self.dictionary_texts = TEXTS
         self.add_filter(_path_exist_in_output, 'path_exist_in_output')
@@ -272,8 +328,8 @@ def _resolving_color_class(status):
 
 
 def create_tags_set(feature):
-    result = {str(tag) for scenario in feature['scenarios'] for tag in scenario['tags']}
-    return list(result)
+    # Tags are de-duplicated preserving their order, so the report does not depend on the hash seed
+    return list(dict.fromkeys(str(tag) for scenario in feature['scenarios'] for tag in scenario['tags']))
 
 
 # to_string_list has been forced to return a list
@@ -287,53 +343,56 @@ def _print_error(line):
     return line.replace('/n', os.linesep)
 
 
+# stackoverflow: questions/1707890/fast-way-to-filter-illegal-xml-unicode-chars-in-python
+_ILLEGAL_UNICHRS = [
+    (0x00, 0x08),
+    (0x0B, 0x0C),
+    (0x0E, 0x1F),
+    (0x7F, 0x84),
+    (0x86, 0x9F),
+    (0xFDD0, 0xFDDF),
+    (0xFFFE, 0xFFFF),
+]
+if sys.maxunicode >= 0x10000:  # not narrow build
+    _ILLEGAL_UNICHRS.extend([(plane + 0xFFFE, plane + 0xFFFF) for plane in range(0x10000, 0x110000, 0x10000)])
+
+_ILLEGAL_XML_CHARS_RE = re.compile(
+    u'[%s]' % u''.join('%s-%s' % (chr(low), chr(high)) for (low, high) in _ILLEGAL_UNICHRS if low < sys.maxunicode)
+)
+_ANSI_ESCAPE_RE = re.compile('\x1b[^m]*m')
+_CHAR_REPLACEMENTS = {
+    u'\u201c': '"',
+    u'\u201d': '"',
+    u'\u001B': ' ',  # http://www.fileformat.info/info/unicode/char/1b/index.htm
+    u'\u0019': ' ',  # http://www.fileformat.info/info/unicode/char/19/index.htm
+    u'\u0016': ' ',  # http://www.fileformat.info/info/unicode/char/16/index.htm
+    u'\u001C': ' ',  # http://www.fileformat.info/info/unicode/char/1c/index.htm
+    u'\u0003': ' ',  # http://www.utf8-chartable.de/unicode-utf8-table.pl?utf8=0x
+    u'\u000C': ' ',
+}
+
+
 def clean_invalid_xml_chars(xml_content):
+    """Replace the characters that are not valid in XML documents with spaces,
+    and the typographic double quotes with plain ones.
+
+    The whole string is cleaned with a single regular expression, instead of
+    cleaning each character with clean_char (the result is the same, as the
+    ANSI escape sequences removed by clean_char span several characters, and
+    the remaining replacements are for invalid XML characters).
+    """
     if isinstance(xml_content, bytes):
         xml_content = xml_content.decode()
-    return ''.join([clean_char(c) for c in xml_content])
+    if not isinstance(xml_content, str):
+        return ''.join([clean_char(c) for c in xml_content])
+    xml_content = _ILLEGAL_XML_CHARS_RE.sub(' ', xml_content)
+    if u'\u201c' in xml_content or u'\u201d' in xml_content:
+        xml_content = xml_content.replace(u'\u201c', '"').replace(u'\u201d', '"')
+    return xml_content
 
 
 def invalid_xml_remove(c):
-    # stackoverflow: questions/1707890/fast-way-to-filter-illegal-xml-unicode-chars-in-python
-    illegal_unichrs = [
-        (0x00, 0x08),
-        (0x0B, 0x0C),
-        (0x0E, 0x1F),
-        (0x7F, 0x84),
-        (0x86, 0x9F),
-        (0xFDD0, 0xFDDF),
-        (0xFFFE, 0xFFFF),
-    ]
-    if sys.maxunicode >= 0x10000:  # not narrow build
-        illegal_unichrs.extend(
-            [
-                (0x1FFFE, 0x1FFFF),
-                (0x2FFFE, 0x2FFFF),
-                (0x3FFFE, 0x3FFFF),
-                (0x4FFFE, 0x4FFFF),
-                (0x5FFFE, 0x5FFFF),
-                (0x6FFFE, 0x6FFFF),
-                (0x7FFFE, 0x7FFFF),
-                (0x8FFFE, 0x8FFFF),
-                (0x9FFFE, 0x9FFFF),
-                (0xAFFFE, 0xAFFFF),
-                (0xBFFFE, 0xBFFFF),
-                (0xCFFFE, 0xCFFFF),
-                (0xDFFFE, 0xDFFFF),
-                (0xEFFFE, 0xEFFFF),
-                (0xFFFFE, 0xFFFFF),
-                (0x10FFFE, 0x10FFFF),
-            ]
-        )
-
-    illegal_ranges = [
-        '%s-%s' % (chr(low), chr(high))
-        for (low, high) in illegal_unichrs
-        if low < sys.maxunicode
-    ]
-
-    illegal_xml_re = re.compile(u'[%s]' % u''.join(illegal_ranges))
-    if illegal_xml_re.search(c) is not None:
+    if _ILLEGAL_XML_CHARS_RE.search(c) is not None:
         # Replace with space
         return ' '
     else:
@@ -345,24 +404,10 @@ def clean_char(char):
     # http://stackoverflow.com/questions/1833873/python-regex-escape-characters
     # Variable char has been forced to be a string
     char = str(char)
-    char = re.sub('\x1b[^m]*m', '', char)
+    char = _ANSI_ESCAPE_RE.sub('', char)
     # Clean up invalid xml
     char = invalid_xml_remove(char)
-    replacements = [
-        (u'\u201c', '"'),
-        (u'\u201d', '"'),
-        (u'\u001B', ' '),  # http://www.fileformat.info/info/unicode/char/1b/index.htm
-        (u'\u0019', ' '),  # http://www.fileformat.info/info/unicode/char/19/index.htm
-        (u'\u0016', ' '),  # http://www.fileformat.info/info/unicode/char/16/index.htm
-        (u'\u001C', ' '),  # http://www.fileformat.info/info/unicode/char/1c/index.htm
-        (u'\u0003', ' '),  # http://www.utf8-chartable.de/unicode-utf8-table.pl?utf8=0x
-        (u'\u000C', ' '),
-    ]
-    for rep, new_char in replacements:
-        if char == rep:
-            # print ord(char), char.encode('ascii', 'ignore')
-            return new_char
-    return char
+    return _CHAR_REPLACEMENTS.get(char, char)
 
 
 def normalize_path(text):
@@ -38,6 +38,8 @@ TEXTS = {
             'title': 'This scenario was executed more than once (see @AUTORETRY tag)'
         },
         'filter_status': {'label': 'Status'},
+        'loading_feature': 'Loading scenarios...',
+        'feature_shard_error': 'The scenarios of this feature could not be loaded',
     },
     'steps': {'title': 'Steps', 'description': '', 'modal': {'title': '', 'body': ''}},
     'metrics': {
@@ -53,6 +55,7 @@ TEXTS = {
     'feature': {
         'serial_execution': '\n{0}\nRunning serial features (tagged as @SERIAL).\n{0}\n'.format('*' * 60),
         'running_parallels': '\n{0}\nRunning parallel features.\n{0}\n'.format('*' * 60),
+        'serial_lane': '\n{0}\nRunning serial features (tagged as @SERIAL) while the parallel processes run the rest.\n{0}\n'.format('*' * 60),
         'empty_scenario_descriptions': u'{0}\nThere are features containing scenarios with empty descriptions: \n* {1}.\n{0}\n'.format('*' * 60, {}),
         'run_behave': u"Running feature '{}'.",
         'execution_crashed': 'Execution crashed or was interrupted when executing the feature. No outputs could be generated.'
@@ -60,11 +63,63 @@ TEXTS = {
     'scenario': {
         'serial_execution': u'\n{0}\nRunning serial scenarios (tagged as @SERIAL).\n{0}\n'.format('*' * 60),
         'running_parallels': u'\n{0}\nRunning parallel scenarios\n{0}\n'.format('*' * 60),
+        'serial_lane': u'\n{0}\nRunning serial scenarios (tagged as @SERIAL) while the parallel processes run the rest.\n{0}\n'.format('*' * 60),
         'run_behave': u"Running feature '{}' with scenario '{}'.",
         'duplicated_scenarios': ('{0}\nThere are duplicate scenario names to run.\n'
                                 'Parallel test execution by scenario cannot be performed.\n'
                                 'Duplicated scenario names: \n{1}.\n{0}\n').format('*' * 60, {}),
-        'execution_crashed': 'Execution crashed or was interrupted when executing the scenario. No outputs could be generated.'
+        'execution_crashed': 'Execution crashed or was interrupted when executing the scenario. No outputs could be generated.',
+        'chunks': u'Submitting {0} scenarios in {1} tasks (up to {2} scenarios from the same feature per task).',
+        'execution_timeout': u'Execution timed out after {0:g} seconds. The parallel process running it was terminated.',
+        'timed_out': u"\nTimeout: '{0}' exceeded {1:g} seconds, terminating the parallel process (PID {2}).",
+        'timeouts_unsupported': u'\nError: Scenario timeouts in parallel executions require Python 3.11 or newer '
+                                u'(found {}). Remove them, or run the tests without parallel processes.'
+    },
+    'scheduling': {
+        'longest_first': u'Submitting {0} {1}s longest-first based on durations from {2} report(s) '
+                         u'({3} without history, estimated in {4}s each).'
+    },
+    'persistent_workers': {
+        'summary': u'Persistent workers: {0} of {1} behave runs reused the loaded hooks and step definitions, '
+                   u'saving {2}ms per run ({3} in total).'
+    },
+    'worker_recycling': {
+        'summary': u'Recycled workers: {0} parallel processes were retired and replaced '
+                   u'({1} by number of tasks, {2} by memory usage).',
+        'event': u'  behave_worker-{0} (PID {1}) retired after {2} tasks with {3} of RSS ({4}).',
+        'by_tasks': u'max tasks per worker reached',
+        'by_rss': u'max worker RSS exceeded',
+        'unsupported': u'\nError: Recycling parallel processes requires Python 3.11 or newer. Remove '
+                       u'--max-tasks-per-worker and --max-worker-rss-mb, or run the tests without parallel processes.'
+    },
+    'resource_locks': {
+        'summary': u'Resource locks:',
+        'lock': u'  {0} (capacity {1}): {2} executions, {3} waited for the lock '
+                u'(total wait: {4}, max wait: {5}).',
+    },
+    'dependencies': {
+        'failed': u'Not executed, as a test it depends on did not pass.',
+        'unresolved': u'Not executed, as the tests it depends on could not be executed before it '
+                      u'(circular dependency, or dependency on a serial test executed first).',
+        'missing_tags': u'\nWarning: No tests to run are tagged as {}, the tests depending on them '
+                        u'are executed without waiting.',
+        'scheduling': u'Scheduling {0} {1}s by their dependencies ({2} declared dependencies{3}).',
+        'strict_order': u', waiting for the tests with a lower order',
+    },
+    'sharding': {
+        'summary': u'Shard {0} (of {1} shards): running {2} of {3} {4}s, balanced by {5}.',
+        'by_duration': u'duration ({0}s of {1}s estimated from {2} report(s))',
+        'by_scenarios': u'number of scenarios ({0} of {1} scenarios)',
+    },
+    'merge': {
+        'not_found': u'\nThe report "{}" was not found.\n',
+        'reading': u'Merging {0} reports with {1} features.',
+        'summary': u'Merged {0} reports: {1} features ({2} executed in more than one report), {3} scenarios ({4}).',
+        'html': u'\nHTML output report is located at: {}',
+    },
+    'resume': {
+        'not_found': u'\nThe results journal of the execution to resume was not found: {}',
+        'summary': u'Resuming the execution in "{0}": {1} of {2} scenarios already finished.',
     },
     'folder': {'run_behave': u"Running folder: '{}' and feature '{}'."},
     'path': {'not_found': u'\nThe path "{}" was not found.\n'},
@@ -7,13 +7,18 @@
 from __future__ import absolute_import
 
 import os
+import shutil
 import time
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import csscompressor
 import minify_html
+from markupsafe import Markup
 
-from behavex.conf_mgr import get_env
+from behavex.conf_mgr import (ConfigRun, get_env, get_param,
+                              install_config_snapshot)
 from behavex.global_vars import global_vars
 from behavex.outputs.jinja_mgr import TemplateHandler
 from behavex.outputs.report_utils import (gather_steps_with_definition,
@@ -21,21 +26,84 @@ from behavex.outputs.report_utils import (gather_steps_with_definition,
                                           get_save_function,
                                           retry_file_operation)
 
+# Folder (in the outputs folder) with the feature shards of the sharded HTML report
+FEATURE_SHARDS_FOLDER = 'report_features'
+# Number of features rendered by each task when the features are rendered in parallel
+FEATURES_PER_RENDERING_TASK = 10
 
-def generate_report(output, joined=None, report=None):
+
+def generate_report(output, joined=None, report=None, html_report_mode=None):
+    """Generate the HTML report of the execution.
+
+    Args:
+        output (dict): JSON report of the execution.
+        html_report_mode (str): 'single' (all the scenarios in report.html) or 'sharded' (the scenarios
+            of each feature in a separate file, loaded on demand). By default, --html-report-mode is used.
+    """
     environment_details = get_environment_details()
     features = output['features']
     steps_definition = output['steps_definition']
+    sharded = (html_report_mode or get_param('html_report_mode')) == 'sharded'
 
 
-    all_scenarios = sum((feature['scenarios'] for feature in features), [])
+    all_scenarios = [scenario for feature in features for scenario in feature['scenarios']]
     features.sort(key=lambda feature: feature['name'])
     metrics_variables = get_metrics_variables(all_scenarios)
     html = export_result_to_html(
-        environment_details, features, metrics_variables, steps_definition, joined, report
+        environment_details, features, metrics_variables, steps_definition, joined, report, sharded
     )
     content_to_file = {'report.html': html}
     _create_files_report(content_to_file)
+    if sharded:
+        folder = os.path.join(get_env('OUTPUT'), 'outputs', FEATURE_SHARDS_FOLDER)
+        shutil.rmtree(folder, ignore_errors=True)
+        os.makedirs(folder)
+        render_feature_fragments(features, folder)
+
+
+def render_feature_fragments(features, shards_folder=None):
+    """Render the scenarios of each feature, using a process pool when the execution
+    runs with several parallel processes (the fragments are returned in the same order).
+
+    Args:
+        features (list): Features of the JSON report, in the order they are displayed.
+        shards_folder (str): Folder where the feature shards of the sharded HTML report are
+            written (the shards are named by the position of the feature in report.html).
+
+    Returns:
+        list: HTML fragment of each feature (empty when the feature shards are written).
+    """
+    tasks = [features[index:index + FEATURES_PER_RENDERING_TASK]
+             for index in range(0, len(features), FEATURES_PER_RENDERING_TASK)]
+    processes = min(int(get_param('parallel_processes') or 1), len(tasks))
+    if processes <= 1:
+        return _render_features(features, 1, shards_folder)
+    first_shards = range(1, len(features) + 1, FEATURES_PER_RENDERING_TASK)
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=install_config_snapshot,
+                             initargs=(ConfigRun().snapshot(),)) as process_pool:
+        results = process_pool.map(_render_features, tasks, first_shards, repeat(shards_folder))
+        return [fragment for fragments in results for fragment in fragments]
+
+
+def _render_features(features, first_shard, shards_folder):
+    """Render the scenarios of the given features (also executed by the process pool)."""
+    template_handler = TemplateHandler(global_vars.jinja_templates_path)
+    fragments = []
+    for shard, feature in enumerate(features, first_shard):
+        fragment = template_handler.render_template(
+            global_vars.jinja_templates['feature_fragment'], {'feature': feature}
+        )
+        if not shards_folder:
+            fragments.append(fragment)
+            continue
+        # Only the fragment of a single feature is kept in memory when writing the shards
+        output_text = template_handler.render_template(
+            global_vars.jinja_templates['feature_shard'], {'shard': shard, 'fragment': fragment}
+        )
+        path_file = os.path.join(shards_folder, '{}.js'.format(shard))
+        retry_file_operation(path_file, get_save_function(path_file, output_text))
+    return fragments
 
 
 def _create_manifest(relative, page):
@@ -116,7 +184,7 @@ def get_metrics_variables(scenarios):
 
 
 def export_result_to_html(
-    environment_details, features, metrics_variables, steps_definition, joined=None, report=None
+    environment_details, features, metrics_variables, steps_definition, joined=None, report=None, sharded=False
 ):
     totals, summary = export_to_html_table_summary(features)
     tags, scenarios = get_value_filters(features)
@@ -130,6 +198,9 @@ def export_result_to_html(
         'summary': summary,
         'joined': joined,
         'report': report,
+        'sharded': sharded,
+        'feature_fragments': [] if sharded else [Markup(fragment) for fragment in render_feature_fragments(features)],
+        'shards_path': '/'.join(['outputs', FEATURE_SHARDS_FOLDER]),
         'tags': list(tags),
         'scenarios': scenarios,
         'execution_details': {'parallel_processes': os.getenv('PARALLEL_PROCESSES', '1'),
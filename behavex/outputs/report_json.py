@@ -12,7 +12,6 @@ JSON test execution report.
 # Future added in order to maintain compatibility
 from __future__ import absolute_import
 
-import json
 import multiprocessing
 import os
 import random
@@ -22,6 +21,7 @@ from tempfile import gettempdir
 from behave.model import ScenarioOutline
 from behave.step_registry import registry
 
+from behavex import serializer
 from behavex.conf_mgr import get_env, get_param
 from behavex.global_vars import global_vars
 from behavex.outputs.report_utils import (get_environment_details,
@@ -111,7 +111,7 @@ def generate_json_report(feature_list):
         with open(path_info, 'w') as file_info:
 
             def write_json():
-                file_info.write(json.dumps(output))
+                file_info.write(serializer.dumps(output))
 
             retry_file_operation(path_info, execution=write_json)
         if multiprocessing.current_process().name != 'MainProcess':
@@ -187,9 +187,9 @@ def _processing_scenarios(scenarios, scenario_list, id_feature):
                 scenario_info['start'] = getattr(scenario, 'start')
             if hasattr(scenario, 'stop'):
                 scenario_info['stop'] = getattr(scenario, 'stop')
-            # Convert tags to list for JSON serialization (behave 1.3.0 returns set)
-            tags = getattr(scenario, 'effective_tags')
-            scenario_info['tags'] = list(tags) if isinstance(tags, set) else tags
+            # Convert tags to a list of plain strings (behave 1.3.0 returns a set of Tag objects), as
+            # the report is sent to the main process, where Tag objects cannot be unpickled
+            scenario_info['tags'] = [str(tag) for tag in getattr(scenario, 'effective_tags')]
             scenario_info['filename'] = text(scenario.filename)
             scenario_info['feature'] = scenario.feature.name
             scenario_info['id_feature'] = id_feature
@@ -311,8 +311,9 @@ def process_step_definition(step, step_info):
     definition = registry.find_step_definition(step)
     if definition:
         hash_step = generate_hash(definition.pattern)
-        if hash_step not in global_vars.steps_definitions:
-            global_vars.steps_definitions[hash_step] = definition.pattern
+        # Keys are strings, as in the JSON reports
+        if str(hash_step) not in global_vars.steps_definitions:
+            global_vars.steps_definitions[str(hash_step)] = definition.pattern
         step_info['hash'] = hash_step
     else:
         step_info['hash'] = 0
@@ -14,6 +14,7 @@ Test report utility methods for retrieving summarized test execution information
 from __future__ import absolute_import, print_function
 
 import codecs
+import functools
 import hashlib
 import logging
 import os
@@ -38,42 +39,78 @@ from behavex.global_vars import global_vars
 
 
 def gather_steps_with_definition(features, steps_definition):
-    all_steps = []
-    for feature in features:
-        for scenario in feature['scenarios']:
-            all_steps += scenario['steps']
-            if scenario['background']:
-                all_steps += scenario['background']['steps']
+    """Summarize the executions of the steps of each step definition.
+
+    The executed steps are indexed by the hash of their definition in a single
+    pass over the features, and summarized in the same pass.
+
+    Args:
+        features (list): Features of the JSON report.
+        steps_definition (dict): Step definitions by hash.
+
+    Returns:
+        dict: Summary of the executions of each step definition (see get_summary_definition).
+    """
     result = {}
     if steps_definition:
+        summaries = {}
+        for feature in features:
+            for scenario in feature['scenarios']:
+                steps = scenario['steps']
+                if scenario['background']:
+                    steps = steps + scenario['background']['steps']
+                for step in steps:
+                    summary = summaries.get(step['hash'])
+                    if summary is None:
+                        summary = summaries[step['hash']] = _create_summary_definition()
+                    _add_step_to_summary_definition(summary, step)
         for id_hash, definition in steps_definition.items():
-            result[definition] = {'steps': []}
-            for step in all_steps:
-                if step['hash'] == int(id_hash):
-                    result[definition]['steps'].append(step)
-        for definition, value in result.items():
-            result[definition] = get_summary_definition(value['steps'])
-
+            summary = summaries.get(int(id_hash)) or _create_summary_definition()
+            result[definition] = _complete_summary_definition(summary)
     return result
 
 
 def get_summary_definition(steps):
-    result = {'steps': {}, 'status': []}
+    """Summarize the executions of the steps of a step definition.
+
+    Args:
+        steps (list): Executed steps of the step definition.
+
+    Returns:
+        dict: Executions, appearances, time and status of the steps (by step name and overall),
+            and the average, median (p50), 95th percentile (p95) and maximum durations of the executions.
+    """
+    summary = _create_summary_definition()
     for step in steps:
-        result['status'].append(step['status'])
-        execution = 1 if step['status'] in ('failed', 'passed', 'error') else 0
-        if step['name'] in result['steps']:
-            result['steps'][step['name']]['executions'] += execution
-            result['steps'][step['name']]['time'] += step['duration']
-            result['steps'][step['name']]['status'].append(step['status'])
-            result['steps'][step['name']]['appearances'] += 1
-        else:
-            result['steps'][step['name']] = {
-                'executions': execution,
-                'time': step['duration'],
-                'status': [step['status']],
-                'appearances': 1,
-            }
+        _add_step_to_summary_definition(summary, step)
+    return _complete_summary_definition(summary)
+
+
+def _create_summary_definition():
+    return {'steps': {}, 'status': [], 'durations': []}
+
+
+def _add_step_to_summary_definition(summary, step):
+    summary['status'].append(step['status'])
+    execution = 1 if step['status'] in ('failed', 'passed', 'error') else 0
+    if execution:
+        summary['durations'].append(step['duration'])
+    if step['name'] in summary['steps']:
+        summary['steps'][step['name']]['executions'] += execution
+        summary['steps'][step['name']]['time'] += step['duration']
+        summary['steps'][step['name']]['status'].append(step['status'])
+        summary['steps'][step['name']]['appearances'] += 1
+    else:
+        summary['steps'][step['name']] = {
+            'executions': execution,
+            'time': step['duration'],
+            'status': [step['status']],
+            'appearances': 1,
+        }
+
+
+def _complete_summary_definition(summary):
+    result = {'steps': summary['steps'], 'status': summary['status']}
     total_time = 0.0
     executions = 0
     appearances = 0
@@ -101,9 +138,21 @@ def get_summary_definition(steps):
     result['time'] = total_time
     result['executions'] = executions
     result['appearances'] = appearances
+    durations = sorted(summary['durations'])
+    result['p50'] = get_percentile(durations, 50)
+    result['p95'] = get_percentile(durations, 95)
+    result['max'] = durations[-1] if durations else 0
     return result
 
 
+def get_percentile(sorted_values, percentile):
+    """Return the percentile of a sorted list of values (nearest-rank method), or 0 if it is empty."""
+    if not sorted_values:
+        return 0
+    rank = -(-len(sorted_values) * percentile // 100)
+    return sorted_values[max(int(rank), 1) - 1]
+
+
 def calculate_status(list_status):
     set_status = set(list_status)
     if 'untested' in set_status:
@@ -284,15 +333,84 @@ def get_test_execution_tags():
 
 
 def match_for_execution(tags):
-    # Check filter
-    tag_re = re.compile(r'@?[\w\d\-_.]+')
     tags_filter = get_test_execution_tags()
-    # Eliminate tags put for param dry-rFun
+    # Eliminate tags put for param dry-run
     if get_param('dry_run'):
         if 'BHX_MANUAL_DRY_RUN' in tags:
             tags.remove('BHX_MANUAL_DRY_RUN')
         if 'MANUAL' in tags:
             tags.remove('MANUAL')
+    if not tags_filter:
+        return True
+    return compile_tags_filter(tags_filter)(tags)
+
+
+class CompiledTagsFilter(object):
+    """Predicate built once from the tags filter stored in behave.tags
+    (e.g. "( @TAG1 or @TAG2 ) and ( not @TAG3 )"), with the results
+    memoized by set of scenario tags.
+
+    A filter tag (with or without "@") evaluates to True when the scenario
+    contains it, the same way the original filter evaluation did. Filters
+    that cannot be compiled are evaluated using the original approach.
+    """
+
+    MAX_CACHED_RESULTS = 4096
+
+    def __init__(self, tags_filter):
+        self.tags_filter = tags_filter
+        self._results = {}
+        self._predicate = self._compile(tags_filter)
+
+    def __call__(self, tags):
+        tags_key = frozenset(tags)
+        result = self._results.get(tags_key)
+        if result is None:
+            result = self._predicate(tags_key)
+            if len(self._results) >= self.MAX_CACHED_RESULTS:
+                self._results.clear()
+            self._results[tags_key] = result
+        return result
+
+    @staticmethod
+    def _compile(tags_filter):
+        expression = []
+        for token in tags_filter.split():
+            if token in _TAGS_FILTER_KEYWORDS:
+                expression.append(token)
+            elif _TAGS_FILTER_TAG.match(token):
+                # The filter tag matches the scenario tag with or without "@"
+                names = {token, token[1:]} if token.startswith('@') else {token}
+                expression.append(
+                    '(' + ' or '.join('{!r} in tags'.format(name) for name in sorted(names)) + ')'
+                )
+            else:
+                return functools.partial(_evaluate_tags_filter, tags_filter)
+        try:
+            code = compile('lambda tags: bool({})'.format(' '.join(expression)), '<tags filter>', 'eval')
+        except SyntaxError:
+            return functools.partial(_evaluate_tags_filter, tags_filter)
+        return eval(code, {'__builtins__': {'bool': bool}})  # nosec
+
+
+_TAGS_FILTER_KEYWORDS = ('not', 'and', 'or', '(', ')', 'True', 'False')
+_TAGS_FILTER_TAG = re.compile(r'^@?[\w\d\-_.]+$')
+_compiled_tags_filters = {}
+
+
+def compile_tags_filter(tags_filter):
+    """Return the compiled predicate for a tags filter (compiled only once)."""
+    compiled_filter = _compiled_tags_filters.get(tags_filter)
+    if compiled_filter is None:
+        compiled_filter = CompiledTagsFilter(tags_filter)
+        _compiled_tags_filters[tags_filter] = compiled_filter
+    return compiled_filter
+
+
+def _evaluate_tags_filter(tags_filter, tags):
+    """Original filter evaluation: the scenario tags are replaced by True,
+    all other tags by False, and the resulting expression is evaluated."""
+    tag_re = re.compile(r'@?[\w\d\-_.]+')
     # Set scenario tags in filter
     for tag in tags:
         # Try with and without @
@@ -430,8 +548,8 @@ def text(value, encoding=None, errors=None):
         errors = 'replace'
 
     if isinstance(value, str):
-        # -- PASS-THROUGH UNICODE (efficiency):
-        return value
+        # -- PASS-THROUGH UNICODE (efficiency), converting subclasses (e.g. behave Text) to plain strings
+        return str(value)
     elif isinstance(value, bytes):
         return str(value, encoding, errors)
     elif isinstance(value, bytes):
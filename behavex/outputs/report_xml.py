@@ -7,8 +7,11 @@
 # __future__ has been added in order to maintain compatibility
 from __future__ import absolute_import
 
+import logging
 import os
+import queue
 import re
+import threading
 
 try:
     from behave.model_core import Status
@@ -156,3 +159,73 @@ def _export_feature_to_xml(feature, isobject=True):
 
 def export_feature_to_xml(feature, isobject=True):
     _export_feature_to_xml(feature, isobject)
+
+
+class FeatureReportsAggregator(object):
+    """Aggregates, in the main process, the reports of the scenarios executed in
+    parallel, and exports the JUnit report of each feature as soon as all its
+    scenarios have been reported.
+
+    The reports are added from the done callbacks of the futures, so the JUnit
+    reports are rendered by a dedicated writer thread, instead of delaying the
+    processing of the other completed futures.
+    """
+
+    def __init__(self, scenarios_to_run):
+        """
+        Args:
+            scenarios_to_run (dict): Number of scenarios to run, by feature filename.
+        """
+        self._scenarios_to_run = dict(scenarios_to_run)
+        self._features = {}
+        self._lock = threading.Lock()
+        self._completed_features = queue.Queue()
+        self._writer = threading.Thread(target=self._write_completed_features, name='junit-writer', daemon=True)
+        self._writer.start()
+
+    def add_report(self, json_report):
+        """Add the scenarios of a report, queuing the features that were completed to be exported.
+
+        Args:
+            json_report (dict): JSON report of one or more scenarios from the same feature.
+        """
+        for feature in json_report.get('features', []):
+            with self._lock:
+                filename = feature['filename']
+                aggregated_feature = self._features.get(filename)
+                if aggregated_feature is None:
+                    aggregated_feature = dict(feature, scenarios=list(feature['scenarios']))
+                    self._features[filename] = aggregated_feature
+                else:
+                    aggregated_feature['scenarios'].extend(feature['scenarios'])
+                completed = len(aggregated_feature['scenarios']) >= self._scenarios_to_run.get(filename, 0)
+                if completed:
+                    del self._features[filename]
+            if completed:
+                self._completed_features.put(aggregated_feature)
+
+    def flush(self):
+        """Export the features with scenarios that were not reported (e.g. their process crashed),
+        and wait until all the queued features were exported."""
+        with self._lock:
+            pending_features = list(self._features.values())
+            self._features.clear()
+        for feature in pending_features:
+            self._completed_features.put(feature)
+        self._completed_features.put(None)
+        self._writer.join()
+
+    def _write_completed_features(self):
+        while True:
+            feature = self._completed_features.get()
+            if feature is None:
+                return
+            self._export(feature)
+
+    @staticmethod
+    def _export(feature):
+        try:
+            export_feature_to_xml(feature, False)
+        except Exception as ex:
+            logging.exception('There was a problem generating the JUnit report of "{}": {}'.format(
+                feature.get('filename'), ex))
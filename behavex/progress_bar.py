@@ -1,5 +1,6 @@
 import platform
 import sys
+import threading
 import time
 
 from behavex.global_vars import global_vars
@@ -29,14 +30,17 @@ class ProgressBar:
         self.bar_length = 15
         self.current_iteration = 0
         self.start_time = global_vars.execution_start_time
+        # Updated by the main process (serial executions) and by the parallel execution callbacks
+        self._lock = threading.Lock()
 
     def start(self, start_increment=0):
         self.current_iteration = start_increment
         self._print_progress_bar(new_line=True)
 
     def update(self, increment=1):
-        self.current_iteration += increment
-        self._print_progress_bar()
+        with self._lock:
+            self.current_iteration += increment
+            self._print_progress_bar()
 
     def finish(self, print_if_total_reached=False):
         if print_if_total_reached or self.current_iteration < self.total:
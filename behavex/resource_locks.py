@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Named resource locks for the features/scenarios executed in parallel.
+
+Scenarios that use a shared resource (e.g. a test account, a fixed port or a
+database schema) can be tagged as @LOCK_<name>, so they never run at the same
+time as other scenarios using the same resource, or as @LOCK_<name>:<capacity>
+to allow up to <capacity> of them to run at the same time. Features and
+scenarios holding a lock are only submitted to the process pool when the lock
+is available (see task_scheduler.py), so the parallel processes keep executing
+the rest of the tests in the meantime.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import re
+import threading
+import time
+
+LOCK_TAG_PREFIX = 'LOCK_'
+LOCK_TAG_REGEX = re.compile(r'^@?{}([\w\-.]+?)(?::(\d+))?$'.format(LOCK_TAG_PREFIX))
+
+
+def get_locks_from_tags(tags):
+    """Return the resource locks defined by the LOCK_<name>[:<capacity>] tags.
+
+    Args:
+        tags (list): Scenario tags (including the feature tags).
+
+    Returns:
+        dict: Capacity of each lock, by lock name.
+    """
+    locks = {}
+    for tag in tags:
+        match = LOCK_TAG_REGEX.match(str(tag))
+        if match:
+            capacity = max(int(match.group(2) or 1), 1)
+            locks[match.group(1)] = min(capacity, locks.get(match.group(1), capacity))
+    return locks
+
+
+def merge_locks(locks_list):
+    """Return the locks held by a task executing several scenarios (the locks
+    of all of them, with the lowest capacity defined for each lock)."""
+    merged_locks = {}
+    for locks in locks_list:
+        for name, capacity in locks.items():
+            merged_locks[name] = min(capacity, merged_locks.get(name, capacity))
+    return merged_locks
+
+
+class ResourceLocks(object):
+    """Tracks the resource locks held by the features/scenarios being executed,
+    and how long they waited for each lock."""
+
+    def __init__(self):
+        self.condition = threading.Condition(threading.RLock())
+        self._capacity = {}
+        self._holders = {}
+        # Locks requested by tasks waiting in the main process (they are not
+        # granted to other tasks until then, so these tasks are not starved)
+        self._reserved = {}
+        self.stats = {}
+
+    def register(self, locks):
+        """Register the locks used by a task that will be executed.
+        The lowest capacity defined for each lock is considered."""
+        with self.condition:
+            for name, capacity in locks.items():
+                self._capacity[name] = min(capacity, self._capacity.get(name, capacity))
+                lock_stats = self.stats.setdefault(name, {'tasks': 0, 'waiting_tasks': 0, 'wait_time': 0.0,
+                                                          'max_wait_time': 0.0})
+                lock_stats['tasks'] += 1
+
+    def capacity(self, name):
+        return self._capacity.get(name, 1)
+
+    def unavailable_locks(self, locks, ignore_reservations=False):
+        """Return the locks that cannot be acquired at this moment."""
+        with self.condition:
+            return [name for name in locks
+                    if self._holders.get(name, 0) + (0 if ignore_reservations else self._reserved.get(name, 0))
+                    >= self.capacity(name)]
+
+    def try_acquire(self, locks):
+        with self.condition:
+            if self.unavailable_locks(locks):
+                return False
+            self._hold(locks)
+            return True
+
+    def acquire(self, locks):
+        """Acquire the locks, waiting until all of them are available."""
+        with self.condition:
+            blocked_locks = self.unavailable_locks(locks, ignore_reservations=True)
+            if not blocked_locks:
+                # Reservations only keep the locks requested here from being granted to the parallel tasks
+                self._hold(locks)
+                return
+            start_time = time.time()
+            for name in locks:
+                self._reserved[name] = self._reserved.get(name, 0) + 1
+            try:
+                while self.unavailable_locks(locks, ignore_reservations=True):
+                    self.condition.wait()
+            finally:
+                for name in locks:
+                    self._reserved[name] -= 1
+            self._hold(locks)
+            self.record_wait(blocked_locks, time.time() - start_time)
+
+    def _hold(self, locks):
+        for name in locks:
+            self._holders[name] = self._holders.get(name, 0) + 1
+
+    def release(self, locks):
+        with self.condition:
+            for name in locks:
+                self._holders[name] -= 1
+            self.condition.notify_all()
+
+    def record_wait(self, blocked_locks, wait_time):
+        """Record the time a task waited for the locks that were not available."""
+        with self.condition:
+            for name in blocked_locks:
+                lock_stats = self.stats[name]
+                lock_stats['waiting_tasks'] += 1
+                lock_stats['wait_time'] += wait_time
+                lock_stats['max_wait_time'] = max(lock_stats['max_wait_time'], wait_time)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Results journal of the executions (results.ndjson in the output folder).
+
+The main process appends one JSON record per line as the features/scenarios
+finish, instead of keeping their reports in memory until the end of the
+execution, and the final report is generated from the journal. If the
+execution is interrupted (e.g. the main process is killed), the results of
+the features/scenarios that finished are kept in the journal.
+
+Records:
+    {"record": "start", "time": ..., "parallel_processes": ..., "parallel_scheme": ..., "features_path": ...}
+    {"record": "result", "time": ..., "execution_code": ..., "report": {JSON report of the feature/scenario}}
+    {"record": "end", "time": ...}
+
+The journal can also be followed by external tools to report the progress
+of the execution (the "end" record is written once all the results were added).
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import logging
+import os
+import threading
+import time
+
+from behavex import serializer
+
+RESULTS_JOURNAL_FILENAME = 'results.ndjson'
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+START_RECORD = 'start'
+RESULT_RECORD = 'result'
+END_RECORD = 'end'
+
+
+class ResultsJournal(object):
+    """Appends the results of the executed features/scenarios to the journal file.
+
+    Each record is written with a single unbuffered write, so records are
+    never split or duplicated by processes forked from the main process, and
+    the file is synced to disk at most every fsync_interval seconds.
+    """
+
+    def __init__(self, path, fsync_interval=DEFAULT_FSYNC_INTERVAL):
+        """
+        Args:
+            path (str): Path of the journal file (it is overwritten if it exists).
+            fsync_interval (float): Minimum time (in seconds) between syncs to disk (0 syncs every record).
+        """
+        self.path = path
+        self.fsync_interval = max(fsync_interval, 0.0) if fsync_interval is not None else DEFAULT_FSYNC_INTERVAL
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        self._last_fsync = time.time()
+
+    def start(self, **execution_info):
+        """Write the record of the start of the execution."""
+        self._write(dict(execution_info, record=START_RECORD, time=time.time()))
+
+    def add_result(self, execution_code, json_report):
+        """Write the result of an executed feature/scenario (or chunk of scenarios)."""
+        self._write({'record': RESULT_RECORD, 'time': time.time(), 'execution_code': execution_code,
+                     'report': json_report})
+
+    def close(self):
+        """Write the record of the end of the execution, and sync the journal to disk."""
+        self._write({'record': END_RECORD, 'time': time.time()}, close=True)
+
+    def _write(self, record, close=False):
+        data = serializer.dumps_bytes(record) + b'\n'
+        with self._lock:
+            if self._fd is None:
+                logging.warning('Record added to the closed results journal: {}'.format(record['record']))
+                return
+            while data:
+                data = data[os.write(self._fd, data):]
+            now = time.time()
+            if close or now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._fd)
+                self._last_fsync = now
+            if close:
+                os.close(self._fd)
+                self._fd = None
+
+
+def read_results_journal(path):
+    """Read the records of a results journal. A truncated last record (e.g. if
+    the execution was interrupted while writing it) is ignored.
+
+    Yields:
+        dict: Journal records.
+    """
+    with open(path, 'rb') as journal_file:
+        for line in journal_file:
+            if not line.strip():
+                continue
+            try:
+                yield serializer.loads(line)
+            except ValueError:
+                logging.warning('Incomplete record ignored in the results journal "{}"'.format(path))
+
+
+def read_journal_reports(path):
+    """Read the JSON reports of the features/scenarios stored in a results journal.
+
+    Yields:
+        dict: JSON report of each executed feature/scenario (or chunk of scenarios).
+    """
+    for record in read_results_journal(path):
+        if record.get('record') == RESULT_RECORD:
+            yield record['report']
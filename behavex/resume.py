@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Resume of an interrupted execution from its results journal, using
+--resume <output folder>.
+
+The features/scenarios that finished in the interrupted execution (the ones
+with a result in its results.ndjson journal) are not executed again. Their
+results are added to the journal of the new execution, so the reports are
+generated as if the execution was never interrupted (and the new execution
+can also be resumed). Scenarios are skipped individually when running in
+parallel by scenario, and features are only skipped when all their scenarios
+finished otherwise (as the whole feature is executed).
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+
+from behavex.results_journal import (RESULT_RECORD, RESULTS_JOURNAL_FILENAME,
+                                     read_results_journal)
+from behavex.scheduler import normalize_feature_path
+
+# Scenarios with these statuses were not executed, so they are executed when resuming
+NOT_EXECUTED_STATUSES = ('untested',)
+FAILING_STATUSES = ('failed', 'error', 'undefined')
+
+
+def get_scenario_key(filename, line):
+    """Return the key identifying a scenario in the executions (its feature path and line)."""
+    return normalize_feature_path(filename), int(line)
+
+
+class ResumedExecution(object):
+    """Results of the features/scenarios that finished in an interrupted execution."""
+
+    def __init__(self, output_folder):
+        """
+        Args:
+            output_folder (str): Output folder of the interrupted execution.
+        """
+        self.output_folder = os.path.abspath(output_folder)
+        self.journal_path = os.path.join(self.output_folder, RESULTS_JOURNAL_FILENAME)
+        self.logs_path = os.path.join(self.output_folder, 'outputs', 'logs')
+        self._finished_scenarios = None
+        self._stash_folder = None
+
+    @property
+    def finished_scenarios(self):
+        """Keys of the scenarios that finished (only the keys are kept in memory, the results
+        are read again when adding them to the new execution)."""
+        if self._finished_scenarios is None:
+            self._finished_scenarios = set()
+            for record in read_results_journal(self.journal_path):
+                if record.get('record') != RESULT_RECORD:
+                    continue
+                for feature in record['report'].get('features', []):
+                    for scenario in feature['scenarios']:
+                        if scenario['status'] not in NOT_EXECUTED_STATUSES:
+                            self._finished_scenarios.add(get_scenario_key(feature['filename'], scenario['line']))
+        return self._finished_scenarios
+
+    def is_finished(self, filename, line):
+        return get_scenario_key(filename, line) in self.finished_scenarios
+
+    def stash(self, output_folder):
+        """Move the journal and logs of the interrupted execution to a temporary folder when
+        it is resumed in the same output folder (as the output folder is cleaned up)."""
+        if os.path.abspath(output_folder) != self.output_folder:
+            return
+        # The temporary folder of the executions is located in the output folder
+        self._stash_folder = tempfile.mkdtemp(prefix='.behavex_resume_', dir=os.path.dirname(self.output_folder))
+        stashed_journal_path = os.path.join(self._stash_folder, RESULTS_JOURNAL_FILENAME)
+        shutil.move(self.journal_path, stashed_journal_path)
+        self.journal_path = stashed_journal_path
+        if os.path.isdir(self.logs_path):
+            stashed_logs_path = os.path.join(self._stash_folder, 'logs')
+            shutil.move(self.logs_path, stashed_logs_path)
+            self.logs_path = stashed_logs_path
+
+    def add_results(self, results_journal, skipped_features, skipped_scenarios, output_folder):
+        """Add the results of the features/scenarios that are not executed again to the
+        journal of the new execution, and copy their logs to its output folder.
+
+        Args:
+            results_journal (ResultsJournal): Journal of the new execution.
+            skipped_features (set): Normalized paths of the features that are not executed.
+            skipped_scenarios (set): Keys of the scenarios that are not executed (see get_scenario_key).
+            output_folder (str): Output folder of the new execution.
+
+        Returns:
+            list: Execution codes of the added results.
+        """
+        execution_codes = []
+        logs_path = os.path.join(output_folder, 'outputs', 'logs')
+        for record in read_results_journal(self.journal_path):
+            if record.get('record') != RESULT_RECORD:
+                continue
+            report = record['report']
+            # Results are added by feature, as reports of executions in a single process contain all the features
+            for feature in report.get('features', []):
+                feature = _get_skipped_feature(feature, skipped_features, skipped_scenarios)
+                if not feature:
+                    continue
+                failed = any(scenario['status'] in FAILING_STATUSES for scenario in feature['scenarios'])
+                execution_code = record.get('execution_code', 0) if failed else 0
+                results_journal.add_result(execution_code, dict(report, features=[feature]))
+                execution_codes.append(execution_code)
+                for scenario in feature['scenarios']:
+                    self._copy_logs(scenario.get('identifier_hash'), logs_path)
+        if self._stash_folder:
+            shutil.rmtree(self._stash_folder, ignore_errors=True)
+            self._stash_folder = None
+        return execution_codes
+
+    def _copy_logs(self, identifier_hash, logs_path):
+        """Copy the logs and evidence of a scenario (stored by scenario identifier hash)."""
+        scenario_logs_path = os.path.join(self.logs_path, identifier_hash or '')
+        if identifier_hash and os.path.isdir(scenario_logs_path):
+            shutil.copytree(scenario_logs_path, os.path.join(logs_path, identifier_hash), dirs_exist_ok=True)
+
+
+def _get_skipped_feature(feature, skipped_features, skipped_scenarios):
+    """Return the feature with the scenarios that are not executed again (None if there are none)."""
+    if normalize_feature_path(feature['filename']) in skipped_features:
+        return feature
+    scenarios = [scenario for scenario in feature['scenarios']
+                 if get_scenario_key(feature['filename'], scenario['line']) in skipped_scenarios]
+    if not scenarios:
+        return None
+    if len(scenarios) < len(feature['scenarios']):
+        feature = dict(feature, scenarios=scenarios, status=_get_feature_status(scenarios))
+    return feature
+
+
+def _get_feature_status(scenarios):
+    statuses = [scenario['status'] for scenario in scenarios]
+    if all(status == 'skipped' for status in statuses):
+        return 'skipped'
+    if any(status in ('error', 'undefined') for status in statuses):
+        return 'error'
+    if 'failed' in statuses:
+        return 'failed'
+    return 'passed'
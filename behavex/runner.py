@@ -12,9 +12,10 @@ including setup, execution, and reporting.
 from __future__ import absolute_import, print_function
 
 # Standard library imports
-import codecs
 import concurrent  # pyright: ignore[reportUnusedImport]
 import copy
+import gc
+import itertools
 import json
 import logging
 import logging.config  # pyright: ignore[reportUnusedImport]
@@ -24,12 +25,12 @@ import os.path
 import platform
 import signal
 import sys
+import threading
 import time
 import traceback
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
 from multiprocessing import active_children
-from multiprocessing.managers import DictProxy
 from tempfile import gettempdir
 from typing import Any, Dict
 
@@ -40,13 +41,17 @@ from behave.runner import Runner
 
 # Local imports
 # noinspection PyUnresolvedReferences
-from behavex import conf_mgr
+from behavex import conf_mgr, merge, serializer
 from behavex.arguments import BEHAVE_ARGS, BEHAVEX_ARGS, parse_arguments
-from behavex.conf_mgr import ConfigRun, get_env, get_param
+from behavex.conf_mgr import (ConfigRun, get_env, get_param,
+                              install_config_snapshot)
+from behavex.dependencies import (DependencyGraph, get_dependencies_key,
+                                  get_referenced_tags, get_task_dependencies,
+                                  has_dependencies, merge_dependencies)
 from behavex.environment import extend_behave_hooks
 from behavex.execution_singleton import ExecutionSingleton
+from behavex.feature_cache import install_feature_cache
 from behavex.global_vars import global_vars
-from behavex.outputs import report_xml
 from behavex.outputs.formatter_manager import (DEFAULT_FORMATTER_DIR,
                                                FormatterManager)
 from behavex.outputs.report_json import (generate_execution_info,
@@ -55,23 +60,43 @@ from behavex.outputs.report_utils import (get_overall_status,
                                           match_for_execution,
                                           pretty_print_time,
                                           retry_file_operation, text)
+from behavex.outputs.report_xml import (FeatureReportsAggregator,
+                                        export_feature_to_xml)
 from behavex.progress_bar import ProgressBar
+from behavex.resource_locks import (ResourceLocks, get_locks_from_tags,
+                                    merge_locks)
+from behavex.results_journal import (RESULTS_JOURNAL_FILENAME,
+                                     ResultsJournal, read_journal_reports)
+from behavex.resume import ResumedExecution, get_scenario_key
+from behavex.scheduler import (get_duration_estimator,
+                               normalize_feature_path, sort_longest_first)
+from behavex.sharding import assign_shards
+from behavex.task_scheduler import TaskScheduler
+from behavex.timeouts import (TaskWatchdog, can_replace_processes,
+                              get_task_timeout,
+                              get_timeout_from_tags, init_task_tracking,
+                              task_finished, task_started)
 from behavex.utils import (IncludeNameMatch, IncludePathsMatch, MatchInclude,
-                           cleanup_folders, configure_logging,
-                           copy_bootstrap_html_generator,
+                           add_json_report, cleanup_folders,
+                           configure_logging, copy_bootstrap_html_generator,
                            create_execution_complete_callback_function,
-                           expand_paths, explore_features, generate_reports,
+                           expand_paths, explore_features,
+                           extract_order_from_tags, generate_reports,
                            get_feature_and_scenario_line, get_feature_order,
-                           get_json_results, get_logging_level,
+                           get_logging_level,
                            get_scenario_order, get_scenario_tags,
                            get_scenarios_instances, get_text,
                            join_feature_reports, join_scenario_reports,
-                           len_scenarios, print_env_variables, print_parallel,
+                           print_env_variables, print_parallel,
                            set_behave_tags, set_env_variable,
                            set_environ_config, set_system_paths)
+from behavex.worker import (RECYCLE_BY_TASKS, PersistentRunner,
+                            collect_stats, get_worker_retirement, record_run,
+                            run_worker_teardown, set_stats_queue)
 
 EXIT_OK = 0
 EXIT_ERROR = 1
+MERGE_COMMAND = 'merge'
 EXECUTION_BLOCKED_MSG = (
     'Some of the folders or files are being used by another '
     'program. Please, close them and try again...'
@@ -124,6 +149,9 @@ def run(args):
     global match_include
     global include_path_match
     global include_name_match
+    if args and args[0] == MERGE_COMMAND:
+        # The outputs of several executions are merged instead of running tests
+        return merge.main(args[1:])
     args_parsed = parse_arguments(args)
     set_environ_config(args_parsed)
     ConfigRun().set_args(args_parsed)
@@ -153,6 +181,16 @@ def run(args):
         os.environ['FEATURES_PATH'] = 'features'
     _set_env_variables(args_parsed)
     set_system_paths()
+    if not _check_task_watchdog_arguments():
+        return EXIT_ERROR
+    if args_parsed.resume:
+        resume_journal_path = os.path.join(args_parsed.resume, RESULTS_JOURNAL_FILENAME)
+        if not os.path.isfile(resume_journal_path):
+            print(get_text('resume.not_found').format(resume_journal_path))
+            return EXIT_ERROR
+        global_vars.resumed_execution = ResumedExecution(args_parsed.resume)
+        # The output folder is cleaned up, so the interrupted execution can be resumed in the same folder
+        global_vars.resumed_execution.stash(get_env('OUTPUT'))
     cleanup_folders()
     copy_bootstrap_html_generator()
     configure_logging(args_parsed)
@@ -192,13 +230,22 @@ def setup_running_failures(args_parsed):
         return EXIT_OK, None
 
 
-def init_multiprocessing(idQueue, parallel_delay):
+def init_multiprocessing(idQueue, parallel_delay, stats_queue=None, config_snapshot=None, task_slots=None,
+                         task_events=None, worker_releases=None):
     try:
         signal.signal(signal.SIGINT, signal.SIG_IGN)
+        # The configuration is received once by each process, and used by all the tasks it executes
+        if config_snapshot is not None:
+            install_config_snapshot(config_snapshot)
+        # Load statistics of persistent workers are sent to the main process
+        set_stats_queue(stats_queue)
         # Retrieve one of the unique IDs
         worker_id = idQueue.get()
         # Use the unique ID to name the process
         multiprocessing.current_process().name = f'behave_worker-{worker_id}'
+        # Report the executed tasks to the main process, so it can terminate the ones that time out
+        if task_slots is not None:
+            init_task_tracking(worker_id, task_slots, task_events, worker_releases, idQueue)
         # Add an initial delay to avoid all processes starting at the same time
         if isinstance(parallel_delay, int) and parallel_delay > 0:
             time.sleep(parallel_delay * worker_id / 1000.0)
@@ -234,25 +281,71 @@ def launch_behavex():
     set_behave_tags()
     scenario = False
     notify_missing_features(features_path)
-    features_list = {}
-    for path in features_path.split(','):
-        features_list[path] = explore_features(path)
-    updated_features_list = create_scenario_line_references(features_list)
-    parallel_scheme = '' if not multiprocess else parallel_scheme
-    manager = multiprocessing.Manager()
-    # shared variable to track scenarios that should be run but seems to be removed from execution (using scenarios.remove)
-    shared_removed_scenarios = manager.dict()
-    lock = manager.Lock()
     # Create a queue containing unique IDs from 0 to the number of parallel processes - 1
     # These IDs will be attributed to the process when they will be initialized
-    idQueue = manager.Queue()
+    idQueue = multiprocessing.Queue()
     for i in range(parallel_processes):
         idQueue.put(i)
     parallel_delay = get_param('parallel_delay')
+    persistent_workers = get_param('persistent_workers')
+    stats_queue = multiprocessing.Queue() if persistent_workers and multiprocess else None
+    # Parallel processes report the tasks they start (and when they retire), so the
+    # ones exceeding their timeout can be terminated, and the retired ones replaced
+    task_slots = multiprocessing.Array('i', parallel_processes) if multiprocess else None
+    task_events = multiprocessing.Queue() if multiprocess else None
+    # Retired processes wait until the main process reported their last task to the process pool
+    worker_releases = [multiprocessing.SimpleQueue() for _ in range(parallel_processes)] if multiprocess else None
     process_pool = ProcessPoolExecutor(max_workers=parallel_processes,
                                        initializer=init_multiprocessing,
-                                       initargs=(idQueue, parallel_delay))
+                                       initargs=(idQueue, parallel_delay, stats_queue, ConfigRun().snapshot(),
+                                                 task_slots, task_events, worker_releases))
+    task_watchdog = None
+    if multiprocess and can_replace_processes():
+        task_watchdog = TaskWatchdog(idQueue, task_slots, task_events, worker_releases,
+                                     on_timeout=_notify_task_timeout,
+                                     track_all_tasks=_is_worker_recycling_enabled())
+        task_watchdog.start(process_pool)
+    # Features/scenarios tagged as @LOCK_<name> are only executed when the resource is available
+    resource_locks = ResourceLocks() if multiprocess else None
+    features_list = {}
+    # The garbage collector is disabled while discovering the features, as
+    # all the parsed models are kept (collections would only add overhead)
+    gc.disable()
+    try:
+        for path in features_path.split(','):
+            # Feature files are parsed by the parallel processes (if any)
+            features_list[path] = explore_features(path,
+                                                   process_pool=process_pool if multiprocess else None,
+                                                   parallel_processes=parallel_processes)
+    finally:
+        gc.enable()
+    updated_features_list = create_scenario_line_references(features_list)
+    if multiprocess and not _check_timeout_tags(updated_features_list):
+        process_pool.shutdown(wait=True)
+        return EXIT_ERROR
+    parallel_scheme = '' if not multiprocess else parallel_scheme
+    shard_count = getattr(ConfigRun().args, 'shard_count', None)
+    if shard_count:
+        # Only the features/scenarios assigned to this shard are executed
+        updated_features_list = _select_shard(updated_features_list,
+                                              getattr(ConfigRun().args, 'shard_index', 0),
+                                              shard_count,
+                                              by_scenario=parallel_scheme == 'scenario')
+    resumed_execution = global_vars.resumed_execution
+    skipped_features, skipped_scenarios = set(), set()
+    if resumed_execution:
+        # The features/scenarios that finished in the interrupted execution are not executed again
+        updated_features_list, skipped_features, skipped_scenarios = _skip_finished_scenarios(
+            updated_features_list, resumed_execution, by_scenario=parallel_scheme == 'scenario')
     global_vars.execution_start_time = time.time()
+    # The results are written to the journal as they finish, and the final report is generated from it
+    global_vars.results_journal = _create_results_journal(features_path, parallel_processes, parallel_scheme)
+    resumed_execution_codes = []
+    if resumed_execution:
+        resumed_execution_codes = resumed_execution.add_results(global_vars.results_journal,
+                                                                skipped_features,
+                                                                skipped_scenarios,
+                                                                get_env('OUTPUT'))
     totals = {"features": {"passed": 0, "failed": 0, "error": 0, "skipped": 0, "untested": 0},
               "scenarios": {"passed": 0, "failed": 0, "error": 0, "skipped": 0, "untested": 0}}
     failures = []  # Initialize before try block to ensure it's always defined
@@ -262,7 +355,7 @@ def launch_behavex():
             # Executing without parallel processes
             if get_param('dry_run'):
                 print('Obtaining information about the reporting scope...')
-            if global_vars.rerun_failures:
+            if global_vars.rerun_failures and not (shard_count or resumed_execution):
                 all_paths = features_path.split(",")
             else:
                 all_paths = [key for key in updated_features_list]
@@ -270,38 +363,40 @@ def launch_behavex():
                 execution_codes, json_reports = execute_tests(features_path=all_paths,
                                                                 feature_filename=None,
                                                                 feature_json_skeleton=None,
-                                                                scenarios_to_run_in_feature=None,
                                                                 scenario_line=None,
                                                                 multiprocess=False,
-                                                                config=config,
-                                                                lock=None,
-                                                                shared_removed_scenarios=None)
+                                                                config=config)
+                global_vars.results_journal.add_result(execution_codes, json_reports)
             else:
                 execution_codes, json_reports = (0, [{'environment': [], 'features': [], 'steps_definition': []}])
         elif parallel_scheme == 'scenario':
             execution_codes, json_reports = launch_by_scenario(updated_features_list,
                                                             process_pool,
-                                                            lock,
-                                                            shared_removed_scenarios,
-                                                            show_progress_bar)
+                                                            show_progress_bar,
+                                                            task_watchdog,
+                                                            resource_locks)
             scenario = True
         elif parallel_scheme == 'feature':
             execution_codes, json_reports = launch_by_feature(updated_features_list,
                                                             process_pool,
-                                                            lock,
-                                                            show_progress_bar)
-        wrap_up_process_pools(process_pool, json_reports, scenario)
+                                                            show_progress_bar,
+                                                            task_watchdog,
+                                                            resource_locks)
+        if resumed_execution:
+            execution_codes = (execution_codes if isinstance(execution_codes, list) else [execution_codes]) + \
+                resumed_execution_codes
+        # The merged report is kept in memory, instead of reading report.json again
+        results = wrap_up_process_pools(process_pool, json_reports, scenario)
 
         if get_param('dry_run'):
             print_parallel('execution.dry_run.completed', get_env('OUTPUT'))
 
-        remove_temporary_files(parallel_processes, json_reports)
+        remove_temporary_files(parallel_processes, results)
 
         failing_non_muted_tests = False
         # TODO: Replace logs below with test execution logs when an unexpected error occurs
         # behave_log_file = os.path.join(output_folder, 'behavex', 'logs', str(scenario['id_feature']), 'behave.log')
         # behave_log_file = os.path.join(output_folder, 'behavex', 'logs', str(json_test_configuration['id']), 'behave.log')
-        results = get_json_results()
         processed_feature_filenames = []
         if results:
             for feature in results['features']:
@@ -359,8 +454,16 @@ def launch_behavex():
         except Exception as e:
             print(f"Error during shutdown: {e}")
         exit_code = EXIT_ERROR
+    if task_watchdog:
+        task_watchdog.stop()
     if multiprocess:
         print_execution_summary(totals, failures, results)  # failures initialized above
+    if persistent_workers and multiprocess:
+        print_persistent_workers_summary(collect_stats(stats_queue))
+    if task_watchdog and task_watchdog.retired_workers:
+        print_worker_recycling_summary(task_watchdog.retired_workers)
+    if resource_locks and resource_locks.stats:
+        print_resource_locks_summary(resource_locks)
     if results and results['features'] and not get_param('formatter'):
         print('\nHTML output report is located at: {}'.format(os.path.join(get_env('OUTPUT'), "report.html")))
     print('Exit code: {}'.format(exit_code))
@@ -456,6 +559,110 @@ def print_execution_summary(totals, failures, results):
     print('Took: {}'.format(pretty_print_time(global_vars.execution_end_time - global_vars.execution_start_time)))
 
 
+def print_persistent_workers_summary(stats):
+    """Print the time saved by reusing the hooks and step definitions loaded by each process.
+
+    Args:
+        stats (dict): Load statistics gathered from all processes.
+    """
+    if not stats['runs']:
+        return
+    print_parallel('persistent_workers.summary',
+                   stats['reused_runs'],
+                   stats['runs'],
+                   round(stats['saved_per_run'] * 1000, 1),
+                   pretty_print_time(stats['saved_time']).strip())
+
+
+def print_worker_recycling_summary(retired_workers):
+    """Print the parallel processes that were retired and replaced during the execution.
+
+    Args:
+        retired_workers (list): Retirement information of each retired process.
+    """
+    by_tasks = sum(1 for retirement in retired_workers if retirement['reason'] == RECYCLE_BY_TASKS)
+    print_parallel('worker_recycling.summary', len(retired_workers), by_tasks, len(retired_workers) - by_tasks)
+    for retirement in retired_workers:
+        rss_mb = '{:.0f} MB'.format(retirement['rss_mb']) if retirement['rss_mb'] is not None else 'unknown'
+        reason = ('worker_recycling.by_tasks' if retirement['reason'] == RECYCLE_BY_TASKS
+                  else 'worker_recycling.by_rss')
+        print_parallel('worker_recycling.event',
+                       retirement['worker_id'],
+                       retirement['pid'],
+                       retirement['tasks'],
+                       rss_mb,
+                       get_text(reason))
+
+
+def print_resource_locks_summary(resource_locks):
+    """Print the executions holding each resource lock, and how long they waited for it.
+
+    Args:
+        resource_locks (ResourceLocks): Resource locks used during the execution.
+    """
+    print_parallel('resource_locks.summary')
+    for name, lock_stats in sorted(resource_locks.stats.items()):
+        print_parallel('resource_locks.lock',
+                       name,
+                       resource_locks.capacity(name),
+                       lock_stats['tasks'],
+                       lock_stats['waiting_tasks'],
+                       pretty_print_time(lock_stats['wait_time']).strip(),
+                       pretty_print_time(lock_stats['max_wait_time']).strip())
+
+
+def _check_task_watchdog_arguments():
+    """Check whether the scenario timeouts and worker recycling arguments can be used, as the
+    task watchdog replaces the processes of the process pool (printing an error otherwise).
+
+    Returns:
+        bool: False if any of them was provided for a parallel execution, and the Python version
+            does not support replacing the processes of the process pool.
+    """
+    if can_replace_processes() or get_param('parallel_processes') <= 1 or get_param('dry_run'):
+        return True
+    # Arguments are checked before configuring the logging
+    supported = True
+    if getattr(ConfigRun().args, 'scenario_timeout', None):
+        print(get_text('scenario.timeouts_unsupported').format('--scenario-timeout'))
+        supported = False
+    if _is_worker_recycling_enabled():
+        print(get_text('worker_recycling.unsupported'))
+        supported = False
+    return supported
+
+
+def _check_timeout_tags(features):
+    """Check whether the scenarios to run can be tagged as @TIMEOUT_<seconds> in a parallel
+    execution, as timed out scenarios are terminated by the task watchdog (printing an error otherwise).
+
+    Args:
+        features (dict): Dictionary of features and their scenarios.
+
+    Returns:
+        bool: False if any scenario to run has a timeout tag, and the Python version does not
+            support replacing the processes of the process pool.
+    """
+    if can_replace_processes():
+        return True
+    for scenarios in features.values():
+        for scenario in get_scenarios_instances(scenarios):
+            scenario_tags = get_scenario_tags(scenario)
+            if match_for_execution(scenario_tags) and get_timeout_from_tags(scenario_tags) is not None:
+                print_parallel('scenario.timeouts_unsupported', '@TIMEOUT_<seconds> tags')
+                return False
+    return True
+
+
+def _is_worker_recycling_enabled():
+    """Check whether parallel processes should be retired by number of tasks or memory usage.
+
+    Returns:
+        bool: True if worker recycling is enabled.
+    """
+    return bool(get_param('max_tasks_per_worker') or get_param('max_worker_rss_mb'))
+
+
 def notify_missing_features(features_path):
     """Notify if any features are missing in the specified path.
 
@@ -511,6 +718,115 @@ def create_scenario_line_references(features):
     return updated_features
 
 
+def _select_shard(features, shard_index, shard_count, by_scenario):
+    """Return the features/scenarios assigned to the shard to execute.
+
+    Args:
+        features (dict): Dictionary of features and their scenarios.
+        shard_index (int): Index of the shard to execute.
+        shard_count (int): Number of shards.
+        by_scenario (bool): Whether scenarios are assigned to the shards individually, or
+            together with the rest of the scenarios of their feature.
+
+    Returns:
+        dict: Features and scenarios assigned to the shard.
+    """
+    # Shards are balanced by number of scenarios when there are no durations available
+    duration_estimator = _get_duration_estimator()
+    if duration_estimator and not duration_estimator.scenario_durations:
+        duration_estimator = None
+    weights = {}
+    scenario_keys = {}
+    for features_path, scenarios in features.items():
+        feature_key = normalize_feature_path(features_path)
+        for scenario in get_scenarios_instances(scenarios):
+            key = u'{}:{}'.format(feature_key, scenario.name) if by_scenario else feature_key
+            scenario_keys[id(scenario)] = key
+            weights.setdefault(key, 0.0)
+            # Only the scenarios that will be executed are considered to balance the shards
+            if include_path_match(scenario.filename, scenario.line) and include_name_match(scenario.name) \
+                    and match_for_execution(get_scenario_tags(scenario)):
+                weights[key] += (duration_estimator.scenario_duration(scenario.filename, scenario.name)
+                                 if duration_estimator else 1)
+    assignments, shard_loads = assign_shards(weights, shard_count)
+    shard_features = {}
+    for features_path, scenarios in features.items():
+        shard_scenarios = [scenario for scenario in get_scenarios_instances(scenarios)
+                           if assignments[scenario_keys[id(scenario)]] == shard_index]
+        if shard_scenarios:
+            shard_features[features_path] = shard_scenarios
+    if duration_estimator:
+        balance = get_text('sharding.by_duration').format(round(shard_loads[shard_index], 1),
+                                                          round(sum(shard_loads), 1),
+                                                          duration_estimator.loaded_reports)
+    else:
+        balance = get_text('sharding.by_scenarios').format(int(shard_loads[shard_index]), int(sum(shard_loads)))
+    print_parallel('sharding.summary',
+                   shard_index,
+                   shard_count,
+                   sum(1 for shard in assignments.values() if shard == shard_index),
+                   len(assignments),
+                   'scenario' if by_scenario else 'feature',
+                   balance)
+    return shard_features
+
+
+def _skip_finished_scenarios(features, resumed_execution, by_scenario):
+    """Remove the features/scenarios that finished in the interrupted execution being resumed.
+
+    Args:
+        features (dict): Dictionary of features and their scenarios.
+        resumed_execution (ResumedExecution): Results of the interrupted execution.
+        by_scenario (bool): Whether scenarios are skipped individually, or only together
+            with the rest of the scenarios of their feature.
+
+    Returns:
+        tuple: Features and scenarios to execute, normalized paths of the skipped features,
+            and keys of the skipped scenarios.
+    """
+    remaining_features = {}
+    skipped_features = set()
+    skipped_scenarios = set()
+    total_scenarios = finished_scenarios = 0
+    for features_path, scenarios in features.items():
+        scenarios = get_scenarios_instances(scenarios)
+        # Only the scenarios that will be executed are considered to decide whether a feature finished
+        scenarios_to_run = [scenario for scenario in scenarios
+                            if include_path_match(scenario.filename, scenario.line)
+                            and include_name_match(scenario.name)
+                            and match_for_execution(get_scenario_tags(scenario))]
+        finished = [scenario for scenario in scenarios_to_run
+                    if resumed_execution.is_finished(scenario.filename, scenario.line)]
+        total_scenarios += len(scenarios_to_run)
+        if scenarios_to_run and len(finished) == len(scenarios_to_run):
+            skipped_features.add(normalize_feature_path(features_path))
+            finished_scenarios += len(finished)
+        elif by_scenario and finished:
+            finished_ids = set(id(scenario) for scenario in finished)
+            skipped_scenarios.update(get_scenario_key(scenario.filename, scenario.line) for scenario in finished)
+            remaining_features[features_path] = [scenario for scenario in scenarios if id(scenario) not in finished_ids]
+            finished_scenarios += len(finished)
+        else:
+            remaining_features[features_path] = scenarios
+    print_parallel('resume.summary', resumed_execution.output_folder, finished_scenarios, total_scenarios)
+    return remaining_features, skipped_features, skipped_scenarios
+
+
+def _create_results_journal(features_path, parallel_processes, parallel_scheme):
+    """Create the results journal of the execution (results.ndjson in the output folder).
+
+    Returns:
+        ResultsJournal: Journal where the results of the features/scenarios are written as they finish.
+    """
+    journal_fsync_interval = getattr(ConfigRun().args, 'journal_fsync_interval', None)
+    results_journal = ResultsJournal(os.path.join(get_env('OUTPUT'), RESULTS_JOURNAL_FILENAME),
+                                     journal_fsync_interval)
+    results_journal.start(features_path=features_path,
+                          parallel_processes=parallel_processes,
+                          parallel_scheme=parallel_scheme or None)
+    return results_journal
+
+
 def _wait_for_futures(futures, execution_codes, json_reports):
     """Helper function to wait for futures and handle exceptions"""
     for future in futures:
@@ -530,17 +846,50 @@ def _wait_for_futures(futures, execution_codes, json_reports):
                 execution_codes.append(1)
 
 
+def _get_duration_estimator():
+    """Get the duration estimator used to submit the longest features/scenarios first.
+
+    Returns:
+        DurationEstimator: Duration estimator, or None if no reports were provided.
+    """
+    report_paths = get_param('schedule_by_duration')
+    if not report_paths:
+        return None
+    default_duration = getattr(ConfigRun().args, 'default_duration', None)
+    return get_duration_estimator(report_paths, default_duration)
+
+
+def _sort_by_estimated_duration(items, duration_estimator, element_type):
+    """Sort features/scenarios to be executed in parallel by estimated duration (longest first).
+
+    Args:
+        items (list): Features or scenarios information, containing the "estimated_duration" key.
+        duration_estimator (DurationEstimator): Estimator used to calculate the durations.
+        element_type (str): Type of the elements to sort (feature or scenario).
+    """
+    sort_longest_first(items, lambda item: item["estimated_duration"])
+    unknown_items = sum(1 for item in items if not item["known_duration"])
+    print_parallel('scheduling.longest_first',
+                   len(items),
+                   element_type,
+                   duration_estimator.loaded_reports,
+                   unknown_items,
+                   round(duration_estimator.default_duration, 1))
+
+
 def launch_by_feature(features,
                       process_pool,
-                      lock,
-                      show_progress_bar):
+                      show_progress_bar,
+                      task_watchdog=None,
+                      resource_locks=None):
     """Launch tests by feature in parallel.
 
     Args:
         features (dict): Dictionary of features and their scenarios.
         process_pool (ProcessPoolExecutor): Process pool executor.
-        lock (Lock): Multiprocessing lock.
         show_progress_bar (bool): Whether to show the progress bar.
+        task_watchdog (TaskWatchdog): Terminates the features exceeding their timeout (if any).
+        resource_locks (ResourceLocks): Resource locks held by the features (tagged as @LOCK_<name>).
 
     Returns:
         tuple: Execution codes and JSON reports.
@@ -554,6 +903,7 @@ def launch_by_feature(features,
     # If order_tests_strict is enabled, automatically enable order_tests
     order_tests_enabled = order_tests_enabled or order_tests_strict
     order_tag_prefix = get_param('order_tag_prefix') if order_tests_enabled else None
+    duration_estimator = _get_duration_estimator()
 
     serial_features = []
     parallel_features = []
@@ -565,6 +915,28 @@ def launch_by_feature(features,
         feature_info = {"feature_filename": feature_filename,
                        "feature_json_skeleton": _get_feature_json_skeleton(feature)}
 
+        scenarios_tags = [scenario_tags
+                          for scenario_tags in [get_scenario_tags(scenario)
+                                                for scenario in get_scenarios_instances(features[features_path])]
+                          if match_for_execution(scenario_tags)]
+        feature_info["dependencies"] = get_task_dependencies(scenarios_tags,
+                                                             get_feature_order(feature, get_param('order_tag_prefix')))
+        if task_watchdog:
+            # The feature timeout is the sum of the timeouts of the scenarios to run
+            feature_info["timeout"] = get_task_timeout([_get_scenario_timeout(scenario_tags)
+                                                        for scenario_tags in scenarios_tags])
+        if resource_locks:
+            # The feature holds the locks of all the scenarios to run
+            locks = merge_locks([get_locks_from_tags(scenario_tags) for scenario_tags in scenarios_tags])
+            if locks:
+                feature_info["locks"] = locks
+                resource_locks.register(locks)
+
+        if duration_estimator:
+            feature_info["estimated_duration"] = duration_estimator.feature_duration(feature.filename,
+                                                                                     len(features[features_path]))
+            feature_info["known_duration"] = duration_estimator.is_known_feature(feature.filename)
+
         # Only calculate feature order if ordering is enabled
         if order_tests_enabled:
             # For feature-level execution, use ORDER tags from the feature itself
@@ -574,6 +946,9 @@ def launch_by_feature(features,
             serial_features.append(feature_info)
         else:
             parallel_features.append(feature_info)
+    # Submit the longest features first, so they don't end up running alone at the end of the execution
+    if duration_estimator:
+        _sort_by_estimated_duration(parallel_features, duration_estimator, 'feature')
     # Sort features by execution order if enabled (only the categorized features that will actually run)
     if order_tests_enabled:
         serial_features.sort(key=lambda f: f.get("feature_order", 9999))
@@ -585,71 +960,58 @@ def launch_by_feature(features,
                                                                        total_elements=total_features)
         if global_vars.progress_bar_instance:
             global_vars.progress_bar_instance.start()
-    if serial_features:
-        print_parallel('feature.serial_execution')
-        for serial_feature in serial_features:
-            execution_code, map_json = execute_tests(features_path=None,
-                                                     feature_filename=serial_feature["feature_filename"],
-                                                     feature_json_skeleton=serial_feature["feature_json_skeleton"],
-                                                     scenarios_to_run_in_feature=None,
-                                                     scenario_line=None,
-                                                     multiprocess=True,
-                                                     config=ConfigRun(),
-                                                     lock=None,
-                                                     shared_removed_scenarios=None)
-            json_reports += [map_json]
-            execution_codes.append(execution_code)
-            if global_vars.progress_bar_instance:
-                global_vars.progress_bar_instance.update()
-    print_parallel('feature.running_parallels')
     parallel_processes = []
 
-
-    # Prepare features grouped by order
-    if order_tests_strict:
-        # Each feature gets its own group for strict sequential ordering
-        features_by_order = {}
-        # Sort features by order first
-        sorted_features = sorted(parallel_features, key=lambda f: f.get("feature_order", 9999))
-        for index, parallel_feature in enumerate(sorted_features):
-            features_by_order[index] = [parallel_feature]
-    elif order_tests_enabled:
-        # Sort features by order but allow parallel execution
-        parallel_features.sort(key=lambda f: f.get("feature_order", 9999))
-        features_by_order = {9999: parallel_features}
-    else:
-        # Put all features in a single group for original behavior
-        features_by_order = {9999: parallel_features}
-
-    # Execute features by order groups
-    for order in sorted(features_by_order.keys()):
-        feature_group = features_by_order[order]
-        group_futures = []
-
-        # Submit all features of the current order
-        for parallel_feature in feature_group:
-            feature_filename = parallel_feature["feature_filename"]
-            feature_json_skeleton = parallel_feature["feature_json_skeleton"]
-            future = process_pool.submit(execute_tests,
-                                         features_path=None,
-                                         feature_filename=feature_filename,
-                                         feature_json_skeleton=feature_json_skeleton,
-                                         scenarios_to_run_in_feature=None,
-                                         scenario_line=None,
-                                         multiprocess=True,
-                                         config=ConfigRun(),
-                                         lock=lock,
-                                         shared_removed_scenarios=None)
-            parallel_processes.append(future)
-            future.add_done_callback(create_execution_complete_callback_function(
-                execution_codes,
-                json_reports,
-                global_vars.progress_bar_instance,
-            ))
-            group_futures.append(future)
-
-        # Wait for completion of this order group before proceeding to the next
-        _wait_for_futures(group_futures, execution_codes, json_reports)
+    def track_feature(future):
+        parallel_processes.append(future)
+        future.add_done_callback(create_execution_complete_callback_function(
+            execution_codes,
+            json_reports,
+            global_vars.progress_bar_instance,
+        ))
+        return future
+
+    def submit_feature(parallel_feature):
+        feature_filename = parallel_feature["feature_filename"]
+        feature_json_skeleton = parallel_feature["feature_json_skeleton"]
+        future = _submit_execution(process_pool,
+                                   task_watchdog,
+                                   parallel_feature.get("timeout"),
+                                   features_path=None,
+                                   feature_filename=feature_filename,
+                                   feature_json_skeleton=feature_json_skeleton,
+                                   scenario_line=None,
+                                   multiprocess=True)
+        return track_feature(future)
+
+    def skip_feature(feature_info, reason):
+        return track_feature(_get_untested_future(feature_info, reason))
+
+    # Serial features are executed by the main process while the parallel processes
+    # execute the other features, unless they should be executed before them
+    serial_lane = bool(serial_features) and not _is_serial_execution_strict(order_tests_strict)
+    # Features depending on other features (or waiting for the ones with a lower order, with strict
+    # ordering) are submitted once the features they depend on were executed
+    dependency_graph = _get_dependency_graph(serial_features + parallel_features,
+                                             order_tests_strict,
+                                             'feature',
+                                             executed_first=[] if serial_lane else serial_features)
+    task_scheduler = _get_task_scheduler(parallel_features + serial_features,
+                                         submit_feature,
+                                         skip_feature,
+                                         resource_locks,
+                                         dependency_graph)
+    if serial_features and not serial_lane:
+        print_parallel('feature.serial_execution')
+        _execute_serial_tasks(serial_features, execution_codes, json_reports, task_scheduler=task_scheduler)
+    print_parallel('feature.running_parallels')
+    futures = _submit_tasks(parallel_features, submit_feature, task_scheduler)
+    if serial_lane:
+        print_parallel('feature.serial_lane')
+        _execute_serial_tasks(serial_features, execution_codes, json_reports, task_scheduler=task_scheduler)
+    if task_scheduler:
+        futures = task_scheduler.wait()
+    _wait_for_futures(futures, execution_codes, json_reports)
 
     parallel_processes.clear()
     return execution_codes, json_reports
@@ -657,17 +1019,20 @@ def launch_by_feature(features,
 
 def launch_by_scenario(features,
                        process_pool,
-                       lock,
-                       shared_removed_scenarios,
-                       show_progress_bar):
+                       show_progress_bar,
+                       task_watchdog=None,
+                       resource_locks=None):
     """Launch tests by scenario in parallel.
 
+    The reports of the executed scenarios are aggregated by feature in the main process,
+    which generates the JUnit report of each feature once all its scenarios were executed.
+
     Args:
         features (dict): Dictionary of features and their scenarios.
         process_pool (ProcessPoolExecutor): Process pool executor.
-        lock (Lock): Multiprocessing lock.
-        shared_removed_scenarios (dict): Shared dictionary of removed scenarios.
         show_progress_bar (bool): Whether to show the progress bar.
+        task_watchdog (TaskWatchdog): Terminates the scenarios exceeding their timeout (if any).
+        resource_locks (ResourceLocks): Resource locks held by the scenarios (tagged as @LOCK_<name>).
 
     Returns:
         tuple: Execution codes and JSON reports.
@@ -687,6 +1052,9 @@ def launch_by_scenario(features,
     # If order_tests_strict is enabled, automatically enable order_tests
     order_tests_enabled = order_tests_enabled or order_tests_strict
     order_tag_prefix = get_param('order_tag_prefix') if order_tests_enabled else None
+    # Order tags are also considered by the @AFTER_ORDER_<n> dependencies
+    order_prefix = get_param('order_tag_prefix')
+    duration_estimator = _get_duration_estimator()
     for features_path, scenarios in features.items():
         scenarios_instances = get_scenarios_instances(scenarios)
 
@@ -707,6 +1075,21 @@ def launch_by_scenario(features,
                     # Only calculate scenario order if ordering is enabled
                     if order_tests_enabled:
                         scenario_information["scenario_order"] = get_scenario_order(scenario, order_tag_prefix)
+                    scenario_information["dependencies"] = get_task_dependencies([scenario_tags],
+                                                                                 extract_order_from_tags(scenario_tags,
+                                                                                                         order_prefix))
+                    if task_watchdog:
+                        scenario_information["timeout"] = _get_scenario_timeout(scenario_tags)
+                    if resource_locks:
+                        locks = get_locks_from_tags(scenario_tags)
+                        if locks:
+                            scenario_information["locks"] = locks
+                            resource_locks.register(locks)
+                    if duration_estimator:
+                        scenario_information["estimated_duration"] = duration_estimator.scenario_duration(feature_filename,
+                                                                                                          scenario.name)
+                        scenario_information["known_duration"] = duration_estimator.is_known_scenario(feature_filename,
+                                                                                                      scenario.name)
                     total_scenarios_to_run[feature_filename] = total_scenarios_to_run.setdefault(feature_filename, 0) + 1
                     if 'SERIAL' in scenario_tags:
                         if scenario_information in serial_scenarios:
@@ -730,96 +1113,406 @@ def launch_by_scenario(features,
                        '\n* '.join(features_with_no_scen_desc))
         exit(1)
 
+    # Submit the longest scenarios first, so they don't end up running alone at the end of the execution
+    if duration_estimator:
+        _sort_by_estimated_duration(parallel_scenarios, duration_estimator, 'scenario')
     # Sort scenarios by execution order if enabled (only the filtered scenarios that will actually run)
     if order_tests_enabled:
         serial_scenarios.sort(key=lambda s: s.get("scenario_order", 9999))
         parallel_scenarios.sort(key=lambda s: s.get("scenario_order", 9999))
 
-    if serial_scenarios:
+    feature_reports_aggregator = FeatureReportsAggregator(total_scenarios_to_run)
+    # Set once the report of each scenario was processed (done callbacks run after the futures are completed)
+    reports_processed = []
+    # Scenarios depending on other scenarios (or waiting for the ones with a lower order, with strict
+    # ordering) are submitted once the scenarios they depend on were executed
+    referenced_tags = _get_referenced_tags(serial_scenarios + parallel_scenarios, order_tests_strict)
+    # Scenarios from the same feature are submitted in chunks, to reduce the cost of each submission
+    scenario_chunk_size = _get_scenario_chunk_size()
+    parallel_tasks = parallel_scenarios
+    if parallel_scenarios and scenario_chunk_size > 1:
+        parallel_tasks = _chunk_scenarios(parallel_scenarios, scenario_chunk_size, referenced_tags,
+                                          order_tests_enabled)
+        print_parallel('scenario.chunks', len(parallel_scenarios), len(parallel_tasks), scenario_chunk_size)
+
+    def track_scenario(future, scenario_line):
+        parallel_processes.append(future)
+        future.add_done_callback(create_execution_complete_callback_function(
+            execution_codes,
+            json_reports,
+            global_vars.progress_bar_instance,
+            len(_get_scenario_lines(scenario_line)),
+            feature_reports_aggregator.add_report
+        ))
+        report_processed = threading.Event()
+        future.add_done_callback(lambda _: report_processed.set())
+        reports_processed.append(report_processed)
+        return future
+
+    def submit_scenario(scenario_information):
+        features_path = scenario_information["features_path"]
+        feature_filename = scenario_information["feature_filename"]
+        feature_json_skeleton = scenario_information["feature_json_skeleton"]
+        scenario_line = scenario_information["scenario_line"]
+        future = _submit_execution(process_pool,
+                                   task_watchdog,
+                                   scenario_information.get("timeout"),
+                                   features_path=features_path,
+                                   feature_filename=feature_filename,
+                                   feature_json_skeleton=feature_json_skeleton,
+                                   scenario_line=scenario_line,
+                                   multiprocess=True)
+        return track_scenario(future, scenario_line)
+
+    def skip_scenario(scenario_information, reason):
+        return track_scenario(_get_untested_future(scenario_information, reason), scenario_information["scenario_line"])
+
+    # Serial scenarios are executed by the main process while the parallel processes
+    # execute the other scenarios, unless they should be executed before them
+    serial_lane = bool(serial_scenarios) and bool(parallel_scenarios) and \
+        not _is_serial_execution_strict(order_tests_strict)
+    dependency_graph = None
+    if referenced_tags is not None:
+        dependency_graph = _get_dependency_graph(serial_scenarios + parallel_tasks,
+                                                 order_tests_strict,
+                                                 'scenario',
+                                                 executed_first=[] if serial_lane else serial_scenarios)
+    task_scheduler = _get_task_scheduler(parallel_tasks + serial_scenarios,
+                                         submit_scenario,
+                                         skip_scenario,
+                                         resource_locks,
+                                         dependency_graph)
+    if serial_scenarios and not serial_lane:
         print_parallel('scenario.serial_execution')
-        for scen_info in serial_scenarios:
-            scenarios_to_run_in_feature = total_scenarios_to_run[scen_info["feature_filename"]]
-            execution_code, json_report = execute_tests(features_path=scen_info["features_path"],
-                                                        feature_filename=scen_info["feature_filename"],
-                                                        feature_json_skeleton=scen_info["feature_json_skeleton"],
-                                                        scenarios_to_run_in_feature=scenarios_to_run_in_feature,
-                                                        scenario_line=scen_info["scenario_line"],
-                                                        multiprocess=True,
-                                                        config=ConfigRun(),
-                                                        lock=None,
-                                                        shared_removed_scenarios=shared_removed_scenarios)
-            execution_codes.append(execution_code)
-            json_reports.append(json_report)
-            if global_vars.progress_bar_instance:
-                global_vars.progress_bar_instance.update()
+        _execute_serial_tasks(serial_scenarios, execution_codes, json_reports, feature_reports_aggregator.add_report,
+                              task_scheduler)
     if parallel_scenarios:
         print_parallel('scenario.running_parallels')
+        futures = _submit_tasks(parallel_tasks, submit_scenario, task_scheduler)
+        if serial_lane:
+            print_parallel('scenario.serial_lane')
+            _execute_serial_tasks(serial_scenarios, execution_codes, json_reports,
+                                  feature_reports_aggregator.add_report, task_scheduler)
+        if task_scheduler:
+            futures = task_scheduler.wait()
+        _wait_for_futures(futures, execution_codes, json_reports)
+        parallel_processes.clear()
+    elif task_scheduler:
+        _wait_for_futures(task_scheduler.wait(), execution_codes, json_reports)
+    for report_processed in reports_processed:
+        report_processed.wait()
+    # Features with scenarios that were not reported (e.g. crashed processes) still get their JUnit report
+    feature_reports_aggregator.flush()
+    return execution_codes, json_reports
+
+
+def _is_serial_execution_strict(order_tests_strict):
+    """Check whether the features/scenarios tagged as @SERIAL should be executed before
+    submitting the parallel ones (instead of concurrently with them).
+
+    Args:
+        order_tests_strict (bool): Whether strict execution ordering is enabled.
+
+    Returns:
+        bool: True if serial features/scenarios should be executed first.
+    """
+    # Strict ordering waits for each order group, so serial tests keep running first
+    return bool(get_param('serial_strict') or order_tests_strict)
 
 
-        # Prepare scenarios grouped by order
-        if order_tests_strict:
-            # Each scenario gets its own group for strict sequential ordering
-            scenarios_by_order = {}
-            # Sort scenarios by order first
-            sorted_scenarios = sorted(parallel_scenarios, key=lambda s: s.get("scenario_order", 9999))
-            for index, scenario_info in enumerate(sorted_scenarios):
-                scenarios_by_order[index] = [scenario_info]
-        elif order_tests_enabled:
-            # Sort scenarios by order but allow parallel execution
-            parallel_scenarios.sort(key=lambda s: s.get("scenario_order", 9999))
-            scenarios_by_order = {9999: parallel_scenarios}
+def _execute_serial_tasks(serial_tasks, execution_codes, json_reports, report_callback=None, task_scheduler=None):
+    """Execute the features/scenarios tagged as @SERIAL in the main process, one after another.
+
+    Args:
+        serial_tasks (list): Information of the features/scenarios to execute.
+        execution_codes (list): Execution codes, where the results are added.
+        json_reports (list): JSON reports, where the results are added.
+        report_callback (callable): Function called with the JSON report of each execution.
+        task_scheduler (TaskScheduler): Scheduler of the parallel executions, used to wait for the
+            dependencies and resource locks of the serial executions.
+    """
+    for serial_task in serial_tasks:
+        def execute(serial_task=serial_task):
+            return execute_tests(features_path=serial_task.get("features_path"),
+                                 feature_filename=serial_task["feature_filename"],
+                                 feature_json_skeleton=serial_task["feature_json_skeleton"],
+                                 scenario_line=serial_task.get("scenario_line"),
+                                 multiprocess=True)
+        if task_scheduler:
+            result = task_scheduler.run_in_main_process(serial_task, execute)
+            if result is None:
+                # Reported as untested by the task scheduler
+                continue
+            execution_code, json_report = result
         else:
-            # Put all scenarios in a single group for original behavior
-            scenarios_by_order = {9999: parallel_scenarios}
-
-        # Execute scenarios by order groups
-        for order in sorted(scenarios_by_order.keys()):
-            scenario_group = scenarios_by_order[order]
-            group_futures = []
-
-            # Submit all scenarios of the current order
-            for scenario_information in scenario_group:
-                scenarios_to_run_in_feature = total_scenarios_to_run[scenario_information["feature_filename"]]
-                features_path = scenario_information["features_path"]
-                feature_filename = scenario_information["feature_filename"]
-                feature_json_skeleton = scenario_information["feature_json_skeleton"]
-                scenario_line = scenario_information["scenario_line"]
-                future = process_pool.submit(execute_tests,
-                                            features_path=features_path,
-                                            feature_filename=feature_filename,
-                                            feature_json_skeleton=feature_json_skeleton,
-                                            scenarios_to_run_in_feature=scenarios_to_run_in_feature,
-                                            scenario_line=scenario_line,
-                                            multiprocess=True,
-                                            config=ConfigRun(),
-                                            lock=lock,
-                                            shared_removed_scenarios=shared_removed_scenarios
-                                            )
-                parallel_processes.append(future)
-                future.add_done_callback(create_execution_complete_callback_function(
-                    execution_codes,
-                    json_reports,
-                    global_vars.progress_bar_instance
-                ))
-                group_futures.append(future)
-
-            # Wait for completion of this order group before proceeding to the next
-            _wait_for_futures(group_futures, execution_codes, json_reports)
+            execution_code, json_report = execute()
+        execution_codes.append(execution_code)
+        add_json_report(json_reports, execution_code, json_report)
+        if report_callback:
+            report_callback(json_report)
+        if global_vars.progress_bar_instance:
+            global_vars.progress_bar_instance.update()
 
-        parallel_processes.clear()
-    return execution_codes, json_reports
+
+def _get_referenced_tags(tasks, strict_order):
+    """Get the tags the features/scenarios depend on, if they should be scheduled by their dependencies.
+
+    Args:
+        tasks (list): Information of the features/scenarios to execute.
+        strict_order (bool): Whether strict execution ordering is enabled.
+
+    Returns:
+        set: Tags referenced by @DEPENDS_ON_<tag> tags, or None if there are no dependencies.
+    """
+    if not strict_order and not any(has_dependencies(task["dependencies"]) for task in tasks):
+        return None
+    return get_referenced_tags([task["dependencies"] for task in tasks])
+
+
+def _get_dependency_graph(tasks, strict_order, element_type, executed_first=()):
+    """Get the dependencies between the features/scenarios to execute.
+
+    Args:
+        tasks (list): Information of the features/scenarios to execute (including the serial ones).
+        strict_order (bool): Whether each feature/scenario should wait for the ones with a lower order.
+        element_type (str): Type of the elements to execute (feature or scenario).
+        executed_first (list): Serial features/scenarios executed before submitting the parallel ones,
+            which do not wait for the parallel ones with a lower order.
+
+    Returns:
+        DependencyGraph: Dependency graph, or None if no dependencies were declared.
+    """
+    declared_dependencies = sum(1 for task in tasks if has_dependencies(task["dependencies"]))
+    if not declared_dependencies and not strict_order:
+        return None
+    dependency_graph = DependencyGraph(tasks, lambda task: task["dependencies"], strict_order, executed_first)
+    print_parallel('dependencies.scheduling',
+                   len(tasks),
+                   element_type,
+                   declared_dependencies,
+                   get_text('dependencies.strict_order') if strict_order else '')
+    if dependency_graph.missing_tags:
+        print_parallel('dependencies.missing_tags', ', '.join('@' + tag for tag in dependency_graph.missing_tags))
+    return dependency_graph
+
+
+def _get_task_scheduler(tasks, submit, skip, resource_locks, dependency_graph):
+    """Get the scheduler of the features/scenarios to execute, if any of them holds resource locks
+    or depends on other features/scenarios.
+
+    Args:
+        tasks (list): Information of the features/scenarios to execute.
+        submit (callable): Submits a feature/scenario to the process pool, returning its future.
+        skip (callable): Reports a feature/scenario as untested, returning its future.
+        resource_locks (ResourceLocks): Resource locks held by the features/scenarios (if any).
+        dependency_graph (DependencyGraph): Dependencies between the features/scenarios (if any).
+
+    Returns:
+        TaskScheduler: Task scheduler, or None if the features/scenarios can be submitted at once.
+    """
+    if not dependency_graph and not (resource_locks and any(task.get("locks") for task in tasks)):
+        return None
+    return TaskScheduler(submit, skip, get_param('parallel_processes'), resource_locks, dependency_graph)
+
+
+def _submit_tasks(tasks, submit, task_scheduler):
+    """Submit the features/scenarios to the process pool (through the task scheduler, if any).
+
+    Returns:
+        list: Futures of the submitted features/scenarios (the task scheduler provides them otherwise).
+    """
+    if not task_scheduler:
+        return [submit(task) for task in tasks]
+    task_scheduler.start(tasks)
+    return []
+
+
+def _get_untested_future(task, reason):
+    """Get a future with the results of a feature/scenario that was not executed.
+
+    Args:
+        task (dict): Information of the feature/scenario.
+        reason (str): Reason why it was not executed.
+
+    Returns:
+        Future: Future with the execution code and JSON report of the feature/scenario.
+    """
+    future = Future()
+    future.set_running_or_notify_cancel()
+    future.set_result(_get_untested_report(task["feature_json_skeleton"], task.get("scenario_line"), reason))
+    return future
+
+
+def _get_scenario_chunk_size():
+    """Get the maximum number of scenarios from the same feature to submit as a single task.
+
+    Returns:
+        int: Scenario chunk size (1 if scenarios are submitted individually).
+    """
+    chunk_size = getattr(ConfigRun().args, 'scenario_chunk_size', None)
+    return chunk_size if isinstance(chunk_size, int) and chunk_size > 1 else 1
+
+
+def _chunk_scenarios(scenario_group, chunk_size, referenced_tags=None, order_tests=False):
+    """Group the scenarios to be executed in parallel into chunks of scenarios from the same feature.
+    Each chunk is executed by a single behave run, and returns a single report.
+
+    Args:
+        scenario_group (list): Information of the scenarios to be executed.
+        chunk_size (int): Maximum number of scenarios per chunk.
+        referenced_tags (set): Tags other scenarios depend on, if scheduled by their dependencies
+            (only scenarios with the same dependencies are executed in the same chunk).
+        order_tests (bool): Whether the scenarios are executed by order
+            (only scenarios with the same order are executed in the same chunk).
+
+    Returns:
+        list: Information of the chunks to be executed, containing the list of scenario lines to execute.
+    """
+    scenarios_by_feature = {}
+    for scenario_information in scenario_group:
+        feature_key = (scenario_information["features_path"], scenario_information["feature_filename"])
+        if order_tests:
+            feature_key += (scenario_information.get("scenario_order", 9999),)
+        if referenced_tags is not None:
+            feature_key += get_dependencies_key(scenario_information["dependencies"], referenced_tags)
+        scenarios_by_feature.setdefault(feature_key, []).append(scenario_information)
+    chunks = []
+    for feature_scenarios in scenarios_by_feature.values():
+        for index in range(0, len(feature_scenarios), chunk_size):
+            chunk = feature_scenarios[index:index + chunk_size]
+            if len(chunk) == 1:
+                chunks.append(chunk[0])
+                continue
+            feature_json_skeleton = serializer.loads(chunk[0]["feature_json_skeleton"])
+            for scenario_information in chunk[1:]:
+                feature_json_skeleton["scenarios"] += serializer.loads(
+                    scenario_information["feature_json_skeleton"])["scenarios"]
+            chunk_information = dict(chunk[0],
+                                     feature_json_skeleton=serializer.dumps(feature_json_skeleton),
+                                     scenario_line=[scenario_information["scenario_line"] for scenario_information in chunk])
+            chunk_information["dependencies"] = merge_dependencies([scenario_information["dependencies"]
+                                                                    for scenario_information in chunk])
+            chunk_locks = merge_locks([scenario_information.get("locks", {}) for scenario_information in chunk])
+            if chunk_locks:
+                chunk_information["locks"] = chunk_locks
+            if "timeout" in chunk_information:
+                chunk_information["timeout"] = get_task_timeout([scenario_information["timeout"]
+                                                                 for scenario_information in chunk])
+            if "estimated_duration" in chunk_information:
+                chunk_information["estimated_duration"] = sum(scenario_information["estimated_duration"]
+                                                              for scenario_information in chunk)
+            chunks.append(chunk_information)
+    if all("estimated_duration" in chunk for chunk in chunks):
+        # Keep submitting the longest chunks first when scheduling by duration
+        sort_longest_first(chunks, lambda chunk: chunk["estimated_duration"])
+    return chunks
+
+
+def _get_scenario_timeout(scenario_tags):
+    """Get the timeout of a scenario, from its @TIMEOUT_<seconds> tags or the --scenario-timeout argument.
+
+    Args:
+        scenario_tags (list): Scenario tags (including the feature tags).
+
+    Returns:
+        float: Timeout in seconds, or None if the scenario has no timeout.
+    """
+    return get_timeout_from_tags(scenario_tags, getattr(ConfigRun().args, 'scenario_timeout', None))
+
+
+def _submit_execution(process_pool, task_watchdog, timeout, **execution_args):
+    """Submit the execution of a feature/scenario (or chunk of scenarios) to the process pool.
+    If the execution has a timeout, it is monitored by the task watchdog.
+
+    Args:
+        process_pool (ProcessPoolExecutor): Process pool executor.
+        task_watchdog (TaskWatchdog): Task watchdog (None if timeouts are not supported).
+        timeout (float): Timeout in seconds (None if the execution has no timeout).
+        **execution_args: Arguments of execute_tests.
+
+    Returns:
+        Future: Future of the submitted execution.
+    """
+    if task_watchdog is None or not task_watchdog.tracks(timeout):
+        return process_pool.submit(execute_tests, **execution_args)
+    feature_json_skeleton = execution_args['feature_json_skeleton']
+    scenario_line = execution_args['scenario_line']
+    scenario_lines = _get_scenario_lines(scenario_line)
+    task = task_watchdog.new_task(timeout,
+                                  lambda: _get_timeout_report(feature_json_skeleton, scenario_line, timeout),
+                                  name=':'.join([execution_args['feature_filename']] + scenario_lines))
+    future = process_pool.submit(execute_tests, task_id=task.task_id, **execution_args)
+    task_watchdog.watch(task, future)
+    return future
+
+
+def _get_untested_report(feature_json_skeleton, scenario_line, reason):
+    """Get the execution code and JSON report of a feature/scenario that was not executed,
+    as the features/scenarios it depends on did not pass.
+
+    Args:
+        feature_json_skeleton (str): JSON skeleton of the feature.
+        scenario_line (int or list): Line of the scenario (or lines of a chunk of scenarios), None for features.
+        reason (str): Reason why it was not executed.
+
+    Returns:
+        tuple: Execution code and JSON report.
+    """
+    scenario_lines = _get_scenario_lines(scenario_line)
+    json_output = _get_skeleton_json_output(feature_json_skeleton,
+                                            scenario_lines,
+                                            status='untested',
+                                            scenario_error_msg=reason,
+                                            feature_error_msg=reason)
+    json_report = join_feature_reports(json_output)
+    if not scenario_lines:
+        # The JUnit report of features is exported by the parallel process when the feature finishes
+        for feature in json_report['features']:
+            export_feature_to_xml(feature, False)
+    return 0, json_report
+
+
+def _get_timeout_report(feature_json_skeleton, scenario_line, timeout):
+    """Get the execution code and JSON report of a feature/scenario that exceeded its timeout.
+
+    Args:
+        feature_json_skeleton (str): JSON skeleton of the feature.
+        scenario_line (int or list): Line of the scenario (or lines of a chunk of scenarios), None for features.
+        timeout (float): Timeout in seconds.
+
+    Returns:
+        tuple: Execution code and JSON report.
+    """
+    error_msg = get_text('scenario.execution_timeout').format(timeout)
+    scenario_lines = _get_scenario_lines(scenario_line)
+    json_output = _get_skeleton_json_output(feature_json_skeleton,
+                                            scenario_lines,
+                                            status='error',
+                                            scenario_error_msg=error_msg,
+                                            feature_error_msg=error_msg)
+    # The feature is also reported as an error when only some of its scenarios timed out
+    for skeleton_feature in json_output['features']:
+        skeleton_feature['status'] = 'error'
+    json_report = join_feature_reports(json_output)
+    if not scenario_lines:
+        # The JUnit report of features is exported by the parallel process when the feature finishes
+        for feature in json_report['features']:
+            export_feature_to_xml(feature, False)
+    return 1, json_report
+
+
+def _notify_task_timeout(task):
+    print_parallel('scenario.timed_out', task.name, task.timeout, task.pid)
 
 
 def execute_tests(
         features_path,
         feature_filename,
         feature_json_skeleton,
-        scenarios_to_run_in_feature,
         scenario_line,
         multiprocess,
-        config,
-        lock,
-        shared_removed_scenarios):
+        config=None,
+        task_id=None):
     """
     Execute tests for the given feature or scenario.
 
@@ -827,25 +1520,30 @@ def execute_tests(
         features_path (str): Path to the features.
         feature_filename (str): Name of the feature file.
         feature_json_skeleton (str): JSON skeleton of the feature.
-        scenarios_to_run_in_feature (int): Number of scenarios to run in the feature.
-        scenario_line (int): Line of the scenario.
+        scenario_line (int or list): Line of the scenario (or lines of a chunk of scenarios from the same feature).
         multiprocess (bool): Whether to use multiprocessing.
-        config (ConfigRun): Configuration object.
-        lock (Lock): Multiprocessing lock.
-        shared_removed_scenarios (dict): Shared dictionary of removed scenarios.
+        config (ConfigRun): Configuration object (parallel processes use the one received when initialized).
+        task_id (int): ID of the task monitored by the main process, if the execution has a timeout.
 
     Returns:
         tuple: Execution code and JSON report.
     """
+    task_started(task_id)
     try:
         behave_args = None
-        if multiprocess:
+        scenario_lines = _get_scenario_lines(scenario_line)
+        if multiprocess and config is not None:
             ExecutionSingleton._instances[ConfigRun] = config
+        config = config or ConfigRun()
         extend_behave_hooks()
+        # Behave reuses the feature models stored in the feature cache (if enabled)
+        install_feature_cache()
+        # The skeleton is only parsed once, as it is used to build the report of scenarios not executed
+        skeleton_feature = serializer.loads(feature_json_skeleton) if feature_json_skeleton else {}
         try:
             # Execution ID is only important for multiprocessing so that
             # we can influence where output files end up
-            execution_id = json.loads(feature_json_skeleton or '{}').get('id')
+            execution_id = skeleton_feature.get('id')
             behave_args = _set_behave_arguments(features_path=features_path,
                                                 multiprocess=multiprocess,
                                                 execution_id=execution_id,
@@ -855,61 +1553,99 @@ def execute_tests(
         except Exception as exception:
             traceback.print_exc()
             print(exception)
-        execution_code, generate_report, json_results_str = _launch_behave(behave_args)
+        execution_code, generate_report, json_results = _launch_behave(behave_args)
         # print("pipenv run behave {} --> Execution Code: {} --> Generate Report: {}".format(" ".join(behave_args), execution_code, generate_report))
         if generate_report:
             # print execution code
             if execution_code == 2:
                 # For crashed executions, override with skeleton data if available
                 if feature_json_skeleton:
-                    json_output = {'environment': [],
-                                   'features': [json.loads(feature_json_skeleton)],
-                                   'steps_definition': []}
-                    for skeleton_feature in json_output["features"]:
-                        if scenario_line:
-                            for skeleton_scenario in skeleton_feature["scenarios"]:
-                                if str(skeleton_scenario['line']) == str(scenario_line):
-                                    skeleton_scenario['status'] = 'failed'
-                                    skeleton_scenario['error_msg'] = get_text('scenario.execution_crashed')
-                        else:
-                            skeleton_feature['status'] = 'failed'
-                            skeleton_feature['error_msg'] = 'Execution crashed. No outputs could be generated.'
-                            for skeleton_scenario in skeleton_feature["scenarios"]:
-                                skeleton_scenario['status'] = 'failed'
-                                skeleton_scenario['error_msg'] = get_text('feature.execution_crashed')
+                    crashed_text = 'scenario.execution_crashed' if scenario_lines else 'feature.execution_crashed'
+                    json_output = _get_skeleton_json_output(skeleton_feature,
+                                                            scenario_lines,
+                                                            status='failed',
+                                                            scenario_error_msg=get_text(crashed_text),
+                                                            feature_error_msg='Execution crashed. No outputs could be generated.')
                 else:
                     json_output = {'environment': [], 'features': [], 'steps_definition': []}
             else:
-                # Parse JSON string from _launch_behave (disk-free approach)
-                try:
-                    json_output = json.loads(json_results_str)
-                except (json.JSONDecodeError, ValueError) as e:
-                    logging.error(f"Failed to parse JSON results from _launch_behave: {e}")
-                    logging.error(f"Raw JSON string: {json_results_str}")
-                    # Fallback to empty structure
-                    json_output = {'environment': [], 'features': [], 'steps_definition': []}
-            if scenario_line:
+                # Results are received from _launch_behave (disk-free approach)
+                json_output = json_results
+            if scenario_lines:
                 json_output['features'] = filter_feature_executed(json_output,
                                                                   text(feature_filename),
                                                                   scenario_line=scenario_line)
                 if len(json_output['features']) == 0 or len(json_output['features'][0]['scenarios']) == 0:
                     # Adding scenario data if the test was removed from the execution (setting it as "Untested")
-                    json_output['features'] = [json.loads(feature_json_skeleton)]
-                try:
-                    processing_xml_feature(json_output=json_output,
-                                           scenario_line=scenario_line,
-                                           feature_filename=feature_filename,
-                                           scenarios_to_run_in_feature=scenarios_to_run_in_feature,
-                                           lock=lock,
-                                           shared_removed_scenarios=shared_removed_scenarios)
-                except Exception as ex:
-                    logging.exception("There was a problem processing the xml file: {}".format(ex))
+                    json_output['features'] = [skeleton_feature]
+                elif len(scenario_lines) > 1:
+                    # Adding scenario data for the scenarios of the chunk that were removed from the execution
+                    executed_lines = [str(scenario['line']) for scenario in json_output['features'][0]['scenarios']]
+                    for skeleton_scenario in skeleton_feature['scenarios']:
+                        if str(skeleton_scenario['line']) not in executed_lines:
+                            json_output['features'][0]['scenarios'].append(skeleton_scenario)
         else:
             json_output = {'environment': [], 'features': [], 'steps_definition': []}
-        return execution_code, join_feature_reports(json_output)
+        result = execution_code, join_feature_reports(json_output)
     except Exception as e:
         logging.error(f"Exception in execute_tests: {e}")
+        task_finished(task_id)
         raise
+    # The parallel process sends the result to the main process and exits if it is retired
+    return task_finished(task_id, result, _get_worker_retirement(task_id))
+
+
+def _get_worker_retirement(task_id):
+    """
+    Check whether the parallel process should be retired after executing the task.
+
+    Args:
+        task_id (int): ID of the executed task (None if the task is not tracked by the main process).
+
+    Returns:
+        dict: Information about the retirement, or None if the process should not be retired.
+    """
+    if task_id is None:
+        return None
+    retirement = get_worker_retirement(getattr(ConfigRun().args, 'max_tasks_per_worker', None),
+                                       getattr(ConfigRun().args, 'max_worker_rss_mb', None))
+    if retirement:
+        # Objects shared by the tasks of the process are released by the worker-scoped after_all hook
+        run_worker_teardown()
+    return retirement
+
+
+def _get_skeleton_json_output(feature_json_skeleton, scenario_lines, status, scenario_error_msg, feature_error_msg):
+    """
+    Build the JSON output of an execution that could not generate its outputs, from the feature skeleton.
+
+    Args:
+        feature_json_skeleton (str or dict): JSON skeleton of the feature (or the parsed skeleton, which is updated).
+        scenario_lines (list): Lines of the executed scenarios (empty if the whole feature was executed).
+        status (str): Status of the executed scenarios.
+        scenario_error_msg (str): Error message of the executed scenarios.
+        feature_error_msg (str): Error message of the feature, if the whole feature was executed.
+
+    Returns:
+        dict: JSON output.
+    """
+    json_output = {'environment': [],
+                   'features': [serializer.loads(feature_json_skeleton)
+                                if isinstance(feature_json_skeleton, str) else feature_json_skeleton],
+                   'steps_definition': []}
+    for skeleton_feature in json_output["features"]:
+        if scenario_lines:
+            for skeleton_scenario in skeleton_feature["scenarios"]:
+                if str(skeleton_scenario['line']) in scenario_lines:
+                    skeleton_scenario['status'] = status
+                    skeleton_scenario['error_msg'] = scenario_error_msg
+        else:
+            skeleton_feature['status'] = status
+            skeleton_feature['error_msg'] = feature_error_msg
+            for skeleton_scenario in skeleton_feature["scenarios"]:
+                skeleton_scenario['status'] = status
+                skeleton_scenario['error_msg'] = scenario_error_msg
+    return json_output
 
 
 def filter_feature_executed(json_output, filename, scenario_line):
@@ -919,13 +1655,14 @@ def filter_feature_executed(json_output, filename, scenario_line):
     Args:
         json_output (dict): JSON output of the test execution.
         filename (str): Name of the feature file.
-        scenario_line (str): Line of the scenario.
+        scenario_line (str or list): Line of the scenario (or lines of a chunk of scenarios).
     """
+    scenario_lines = _get_scenario_lines(scenario_line)
     for feature in json_output.get('features', '')[:]:
         if feature.get('filename', '') == filename:
             mapping_scenarios = []
             for scenario in feature['scenarios']:
-                if str(scenario['line']) == str(scenario_line):
+                if str(scenario['line']) in scenario_lines:
                     mapping_scenarios.append(scenario)
             feature['scenarios'] = mapping_scenarios
             return [feature]
@@ -986,11 +1723,11 @@ def _launch_behave(behave_args):
         behave_args (list): List of arguments for Behave.
 
     Returns:
-        tuple: Execution code, whether to generate a report, and JSON string of execution results.
+        tuple: Execution code, whether to generate a report, and JSON results of the execution.
     """
     generate_report = True
     execution_code = 0
-    json_results_str = '{"environment": [], "features": [], "steps_definition": {}}'
+    json_results = {'environment': [], 'features': [], 'steps_definition': {}}
 
     try:
         if behave_args is None:
@@ -998,7 +1735,7 @@ def _launch_behave(behave_args):
             logging.error("behave_args is None - argument parsing may have failed")
             execution_code = 2
             generate_report = True
-            return execution_code, generate_report, json_results_str
+            return execution_code, generate_report, json_results
 
         # Note: stdout_file logic removed since we get execution results directly from runner
 
@@ -1011,16 +1748,20 @@ def _launch_behave(behave_args):
             if not config.format:
                 config.format = ['pretty']
 
-            # Create runner instance
-            runner = Runner(config)
+            # Create runner instance (persistent runners reuse the hooks and steps loaded by previous runs)
+            persistent_workers = get_param('persistent_workers')
+            runner = PersistentRunner(config) if persistent_workers else Runner(config)
 
             # Run the tests (Behave output suppressed via format configuration)
             runner.run()
+            if persistent_workers:
+                record_run(runner)
 
             # Calculate execution code using runner internal state
             execution_code = _calculate_execution_code_from_runner(runner)
 
-            # Extract results directly from runner and serialize to JSON string
+            # Extract results directly from runner (they are not serialized, as they are
+            # sent to the main process by the process pool, or used by the same process)
             try:
                 # Check if runner has features and they contain data
                 if runner and hasattr(runner, 'features') and runner.features:
@@ -1028,9 +1769,8 @@ def _launch_behave(behave_args):
                     json_results = {
                         'environment': get_environment_details(),
                         'features': feature_list,
-                        'steps_definition': global_vars.steps_definitions,
+                        'steps_definition': dict(global_vars.steps_definitions),
                     }
-                    json_results_str = json.dumps(json_results)
                 else:
                     # Fallback for cases where runner doesn't have features or features is empty
                     # This is common in behave 1.2.6 during dry runs
@@ -1042,17 +1782,16 @@ def _launch_behave(behave_args):
                     json_results = {
                         'environment': get_environment_details(),
                         'features': [],
-                        'steps_definition': global_vars.steps_definitions,
+                        'steps_definition': dict(global_vars.steps_definitions),
                     }
-                    json_results_str = json.dumps(json_results)
             except Exception as json_ex:
-                # Robust fallback for any JSON serialization issues
+                # Robust fallback for any issues processing the results
                 logging.error(f"Error processing runner results: {json_ex}")
-                json_results_str = json.dumps({
+                json_results = {
                     'environment': [],
                     'features': [],
                     'steps_definition': {}
-                })
+                }
 
             # Note: stdout file existence check removed since we get execution status directly from runner
         except SystemExit as system_exit:
@@ -1089,7 +1828,7 @@ def _launch_behave(behave_args):
         pass
 
     # Note: stdout file merging removed since we get execution results directly from runner
-    return execution_code, generate_report, json_results_str
+    return execution_code, generate_report, json_results
 
 
 def wrap_up_process_pools(process_pool,
@@ -1100,21 +1839,42 @@ def wrap_up_process_pools(process_pool,
 
     Args:
         process_pool (ProcessPoolExecutor): Process pool executor.
-        json_reports (list): List of JSON reports.
+        json_reports (list or dict): JSON reports not written to the results journal (or the
+            report of the execution in the main process).
         scenario (bool): Whether the execution was by scenario.
+
+    Returns:
+        dict: Merged JSON report (the one written to report.json).
     """
     merged_json = None
     output = os.path.join(get_env('OUTPUT'))
     try:
+        # Worker processes execute their after_all hook (worker-scoped hooks) when finishing
         process_pool.shutdown(wait=True)
     except Exception:
         process_pool.shutdown(wait=False, cancel_futures=True)
-    if type(json_reports) is list:
+    if get_param('worker_scoped_hooks'):
+        # Teardown of the features/scenarios executed by the main process (e.g. serial ones)
+        run_worker_teardown()
+    results_journal = global_vars.results_journal
+    if results_journal:
+        global_vars.results_journal = None
+        results_journal.close()
+        # The report of an execution in the main process is kept in memory, unless it is resumed.
+        # Otherwise, the results written to the journal are merged as they are read from it
+        if type(json_reports) is list or global_vars.resumed_execution:
+            json_reports = itertools.chain(json_reports if type(json_reports) is list else [],
+                                           read_journal_reports(results_journal.path))
+    if isinstance(json_reports, dict):
+        merged_json = json_reports
+    else:
         if scenario:
             json_reports = join_scenario_reports(json_reports)
         merged_json = join_feature_reports(json_reports)
-    else:
-        merged_json = json_reports
+    if global_vars.resumed_execution:
+        # The JUnit reports include the scenarios that finished in the interrupted execution
+        for feature in merged_json['features']:
+            export_feature_to_xml(feature, False)
     if global_vars.progress_bar_instance:
         global_vars.progress_bar_instance.finish()
     status_info = os.path.join(output, global_vars.report_filenames['report_overall'])
@@ -1122,27 +1882,24 @@ def wrap_up_process_pools(process_pool,
         over_status = {'status': get_overall_status(merged_json)}
         file_info.write(json.dumps(over_status))
     path_info = os.path.join(output, global_vars.report_filenames['report_json'])
-    with open(path_info, 'w') as file_info:
-        file_info.write(json.dumps(merged_json))
+    serializer.dump(merged_json, path_info)
     generate_reports(merged_json)
+    return merged_json
 
 
-def remove_temporary_files(parallel_processes, json_reports):
+def remove_temporary_files(parallel_processes, results_json=None):
     """
     Remove temporary files created during the test execution.
 
     Args:
         parallel_processes (int): Number of parallel processes.
-        json_reports (list): List of JSON reports.
+        results_json (dict): Merged JSON report (report.json is read if it is not provided).
     """
-    path_info = os.path.join(
-        os.path.join(get_env('OUTPUT'), global_vars.report_filenames['report_json'])
-    )
-    if os.path.exists(path_info):
-        with open(path_info, 'r') as json_file:
-            results_json = json.load(json_file)
-            if 'features' and results_json['features']:
-                return
+    if results_json is None:
+        path_info = os.path.join(get_env('OUTPUT'), global_vars.report_filenames['report_json'])
+        results_json = serializer.load(path_info) if os.path.exists(path_info) else None
+    if results_json and results_json['features']:
+        return
 
     for i in range(parallel_processes):
         result_temp = os.path.join(gettempdir(), 'result{}.tmp'.format(i + 1))
@@ -1164,95 +1921,6 @@ def remove_temporary_files(parallel_processes, json_reports):
     console_log = logging.StreamHandler(sys.stdout)
     console_log.setLevel(get_logging_level())
     logger.addHandler(console_log)
-    # removing any pending temporary files
-    if type(json_reports) is not list:
-        json_reports = [json_reports]
-    for json_report in json_reports:
-        if 'features' in json_report and json_report['features']:
-            feature_name = os.path.join(get_env('OUTPUT'), u'{}.tmp'.format(json_report['features'][0]['name']))
-            if os.path.exists(feature_name):
-                try:
-                    os.remove(feature_name)
-                except Exception as remove_ex:
-                    print(remove_ex)
-
-
-def processing_xml_feature(json_output, scenario_line, feature_filename,
-                           scenarios_to_run_in_feature=None, lock=None,
-                           shared_removed_scenarios=None):
-    """
-    Process the XML feature and update the JSON output.
-
-    Args:
-        json_output (dict): JSON output of the test execution.
-        scenario (Scenario): Scenario object.
-        feature_filename (str): Name of the feature file.
-        scenarios_to_run_in_feature (int): Number of scenarios to run in the feature.
-        lock (Lock): Multiprocessing lock.
-        shared_removed_scenarios (dict): Shared dictionary of removed scenarios.
-    """
-    if lock:
-        lock.acquire()
-    try:
-        feature_contains_scenarios = True if (json_output['features'] and
-                                              'scenarios' in json_output['features'][0] and
-                                              json_output['features'][0]["scenarios"]) else False
-        if type(shared_removed_scenarios) == DictProxy and not feature_contains_scenarios:
-            # Assuming the scenario was removed from the execution (using scenarios.remove) as it is not in execution
-            if feature_filename not in shared_removed_scenarios:
-                shared_removed_scenarios[feature_filename] = 1
-            else:
-                shared_removed_scenarios[feature_filename] += 1
-        if feature_contains_scenarios:
-            reported_scenarios = json_output['features'][0]['scenarios']
-            executed_scenarios = []
-            for reported_scenario in reported_scenarios:
-                if reported_scenario['line'] == scenario_line:
-                    executed_scenarios.append(reported_scenario)
-            json_output['features'][0]['scenarios'] = executed_scenarios
-            feature_name = os.path.join(
-                get_env('OUTPUT'), u'{}.tmp'.format(os.path.basename(feature_filename))
-            )
-            processed_feature_data = json_output['features'][0]
-            processed_feature_data['scenarios'] = executed_scenarios
-            if os.path.exists(feature_name):
-                for _ in range(0, 10):
-                    try:
-                        processed_feature_data = json.load(open(feature_name, 'r'))
-                        with open(feature_name, 'w') as feature_file:
-                            for executed_scenario in executed_scenarios:
-                                processed_feature_data['scenarios'].append(executed_scenario)
-                            json.dump(processed_feature_data, feature_file)
-                        break
-                    except Exception as ex:
-                        logging.debug(ex)
-                        logging.debug('Retrying reading from {}'.format(feature_name))
-                        time.sleep(1)
-            else:
-                with codecs.open(feature_name, 'w', 'utf8') as feature_file:
-                    json.dump(processed_feature_data, feature_file)
-            # calculate the total number of scenarios that should be executed
-            removed_scenarios = 0
-            if shared_removed_scenarios and feature_filename in shared_removed_scenarios:
-                removed_scenarios = shared_removed_scenarios[feature_filename]
-            if scenarios_to_run_in_feature is None:
-                total_scenarios = len_scenarios(feature_filename) - removed_scenarios
-            else:
-                total_scenarios = scenarios_to_run_in_feature - removed_scenarios
-            if len(processed_feature_data['scenarios']) == total_scenarios:
-                try:
-                    report_xml.export_feature_to_xml(processed_feature_data, False)
-                except Exception as ex:
-                    traceback.print_exc()
-                    print(ex)
-                finally:
-                    path_tmp = u'{}.tmp'.format(feature_name[:-4])
-                    os.remove(path_tmp)
-    except Exception as ex:
-        raise ex
-    finally:
-        if lock:
-            lock.release()
 
 
 def _set_env_variables(args):
@@ -1366,8 +2034,13 @@ def _set_behave_arguments(features_path, multiprocess, execution_id=None, featur
     output_folder = config.get_env('OUTPUT') if config else get_env('OUTPUT')
     if multiprocess:
         updated_features_path = features_path if not feature else feature
-        updated_features_path = updated_features_path if not scenario_line else "{}:{}".format(updated_features_path, scenario_line)
-        arguments.append(updated_features_path)
+        scenario_lines = _get_scenario_lines(scenario_line)
+        if scenario_lines:
+            # Scenarios from the same feature can be executed by a single behave run (scenario chunks)
+            for line in scenario_lines:
+                arguments.append("{}:{}".format(updated_features_path, line))
+        else:
+            arguments.append(updated_features_path)
         arguments.append('--no-summary')
         worker_id = multiprocessing.current_process().name.split('-')[-1]
 
@@ -1454,6 +2127,23 @@ def _set_behave_arguments(features_path, multiprocess, execution_id=None, featur
     return arguments
 
 
+def _get_scenario_lines(scenario_line):
+    """
+    Get the scenario lines to execute, as strings.
+
+    Args:
+        scenario_line (int or list): Scenario line, or list of scenario lines (scenario chunks).
+
+    Returns:
+        list: Scenario lines to execute (empty if the whole feature should be executed).
+    """
+    if not scenario_line:
+        return []
+    if isinstance(scenario_line, (list, tuple)):
+        return [str(line) for line in scenario_line]
+    return [str(scenario_line)]
+
+
 def _get_feature_json_skeleton(behave_element):
     """
     Get the JSON skeleton for the given feature or scenario.
@@ -1472,7 +2162,7 @@ def _get_feature_json_skeleton(behave_element):
     else:
         raise Exception("No feature or scenario to process...")
     execution_info = generate_execution_info([feature])
-    return json.dumps(execution_info[0]) if execution_info else {}
+    return serializer.dumps(execution_info[0]) if execution_info else {}
 
 
 def _get_progress_bar_instance(parallel_scheme, total_elements):
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Scheduling helpers used to decide the order in which features and scenarios
+are submitted to the parallel processes.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import logging
+import os
+
+from behavex import serializer
+
+
+def normalize_feature_path(filename):
+    """Return a machine independent key for a feature filename.
+
+    Reports generated by BehaveX can contain absolute or relative feature paths
+    (depending on how the paths were provided to the runner), so paths located
+    under the current working directory are converted to relative paths.
+
+    Args:
+        filename (str): Feature filename as reported by behave.
+
+    Returns:
+        str: Normalized feature path using forward slashes.
+    """
+    if not filename:
+        return ''
+    filename = str(filename).replace('\\', '/')
+    if os.path.isabs(filename):
+        cwd = os.getcwd().replace('\\', '/')
+        if filename.startswith(cwd.rstrip('/') + '/'):
+            filename = os.path.relpath(filename, cwd).replace('\\', '/')
+    return os.path.normpath(filename).replace('\\', '/')
+
+
+class DurationEstimator:
+    """Estimates the execution time of features and scenarios based on the
+    durations stored in previous BehaveX JSON reports (report.json)."""
+
+    def __init__(self, report_paths=None, default_duration=None):
+        self.feature_durations = {}
+        self.scenario_durations = {}
+        self.loaded_reports = 0
+        for report_path in report_paths or []:
+            self.load_report(report_path)
+        self.default_duration = self._resolve_default_duration(default_duration)
+
+    def load_report(self, report_path):
+        """Load the feature and scenario durations from a report.json file.
+        When the same element is found in more than one report, the longest
+        duration is kept, as it is the safest estimation for scheduling purposes."""
+        try:
+            report = serializer.load(report_path)
+        except (OSError, ValueError) as ex:
+            logging.warning('Durations could not be loaded from "{}": {}'.format(report_path, ex))
+            return
+        for feature in report.get('features', []):
+            feature_key = normalize_feature_path(feature.get('filename'))
+            self._store(self.feature_durations, feature_key, feature.get('duration'))
+            for scenario in feature.get('scenarios', []):
+                scenario_key = (normalize_feature_path(scenario.get('filename', feature_key)),
+                                scenario.get('name'))
+                self._store(self.scenario_durations, scenario_key, scenario.get('duration'))
+        self.loaded_reports += 1
+
+    @staticmethod
+    def _store(durations, key, duration):
+        if not isinstance(duration, (int, float)):
+            return
+        durations[key] = max(durations.get(key, 0.0), float(duration))
+
+    def _resolve_default_duration(self, default_duration):
+        if isinstance(default_duration, (int, float)) and default_duration >= 0:
+            return float(default_duration)
+        # Unknown elements are estimated using the average scenario duration
+        known_durations = list(self.scenario_durations.values())
+        return sum(known_durations) / len(known_durations) if known_durations else 0.0
+
+    def is_known_feature(self, filename):
+        return normalize_feature_path(filename) in self.feature_durations
+
+    def is_known_scenario(self, filename, scenario_name):
+        return (normalize_feature_path(filename), scenario_name) in self.scenario_durations
+
+    def feature_duration(self, filename, total_scenarios=1):
+        """Estimated duration of a feature. Features with no history are
+        estimated as the default duration for each one of their scenarios."""
+        key = normalize_feature_path(filename)
+        if key in self.feature_durations:
+            return self.feature_durations[key]
+        return self.default_duration * max(total_scenarios, 1)
+
+    def scenario_duration(self, filename, scenario_name):
+        key = (normalize_feature_path(filename), scenario_name)
+        return self.scenario_durations.get(key, self.default_duration)
+
+
+def get_duration_estimator(report_paths, default_duration=None):
+    """Create a duration estimator, or return None if no reports were provided."""
+    if not report_paths:
+        return None
+    if isinstance(report_paths, str):
+        report_paths = [report_paths]
+    return DurationEstimator(report_paths, default_duration)
+
+
+def sort_longest_first(items, estimate):
+    """Sort the items so the ones expected to take longer are submitted first.
+    The sort is stable, so elements with the same estimation keep their
+    discovery order, and any ordering applied later (e.g. ORDER tags) has
+    precedence over this one.
+
+    Args:
+        items (list): Elements to sort (sorted in place).
+        estimate (callable): Function returning the estimated duration of an item.
+    """
+    items.sort(key=lambda item: -estimate(item))
+    return items
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+JSON serialization of the execution results (results journal, report.json).
+
+The fastest JSON library installed is used (orjson or msgspec), falling back
+to the standard json module. The library can also be selected with the
+BEHAVEX_JSON_SERIALIZER environment variable (orjson, msgspec or json).
+Values the fast libraries do not support (e.g. dictionaries with keys that
+are not strings) are serialized with the standard json module.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import json
+import os
+
+SERIALIZER_ENV_VARIABLE = 'BEHAVEX_JSON_SERIALIZER'
+
+
+class JsonSerializer(object):
+    """Serializer using the standard json module."""
+
+    name = 'json'
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+    """Serializer using orjson."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj):
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj):
+        try:
+            return self._orjson.dumps(obj)
+        except TypeError:
+            return super(OrjsonSerializer, self).dumps_bytes(obj)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class MsgspecSerializer(JsonSerializer):
+    """Serializer using msgspec."""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj):
+        return self.dumps_bytes(obj).decode('utf-8')
+
+    def dumps_bytes(self, obj):
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, self._msgspec.EncodeError):
+            return super(MsgspecSerializer, self).dumps_bytes(obj)
+
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as ex:
+            # Invalid documents raise ValueError, as with the json module
+            raise ValueError(str(ex))
+
+
+SERIALIZERS = [OrjsonSerializer, MsgspecSerializer, JsonSerializer]
+
+_serializer = None
+
+
+def create_serializer(name=None):
+    """Create the serializer with the given name, or the fastest one installed.
+
+    Args:
+        name (str): Name of the serializer (orjson, msgspec or json).
+
+    Returns:
+        JsonSerializer: Serializer (the json one if the requested library is not installed).
+    """
+    for serializer_class in SERIALIZERS:
+        if name and serializer_class.name != name:
+            continue
+        try:
+            return serializer_class()
+        except ImportError:
+            continue
+    return JsonSerializer()
+
+
+def get_serializer():
+    """Return the serializer used by the executions."""
+    global _serializer
+    if _serializer is None:
+        _serializer = create_serializer(os.environ.get(SERIALIZER_ENV_VARIABLE))
+    return _serializer
+
+
+def dumps(obj):
+    """Serialize an object to a JSON string."""
+    return get_serializer().dumps(obj)
+
+
+def dumps_bytes(obj):
+    """Serialize an object to UTF-8 encoded JSON."""
+    return get_serializer().dumps_bytes(obj)
+
+
+def loads(data):
+    """Deserialize a JSON document (str or bytes)."""
+    return get_serializer().loads(data)
+
+
+def dump(obj, path):
+    """Write an object to a JSON file."""
+    with open(path, 'wb') as json_file:
+        json_file.write(dumps_bytes(obj))
+
+
+def load(path):
+    """Read an object from a JSON file."""
+    with open(path, 'rb') as json_file:
+        return loads(json_file.read())
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Splitting of the features/scenarios to run across several machines (shards),
+using --shard-index and --shard-count.
+
+Each feature/scenario is assigned to a shard by rendezvous hashing of its
+name, so it runs in the same shard in every execution, regardless of the
+rest of the features/scenarios. To keep the shards balanced, shards cannot
+exceed the average shard duration (estimated from previous reports, or the
+number of scenarios) by more than SHARD_BALANCE_TOLERANCE, and the
+features/scenarios that do not fit in their preferred shards are assigned
+to the next ones. The longest ones are assigned first, so only the shortest
+ones are moved to other shards as the suite changes.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import hashlib
+
+SHARD_BALANCE_TOLERANCE = 0.1
+
+
+def get_shard_rank(key, shard_index):
+    """Return the rank of a shard for a feature/scenario (shards with the
+    highest rank are preferred). The rank only depends on the key and the
+    shard, so it does not change between executions or machines."""
+    digest = hashlib.sha1(u'{}\n{}'.format(key, shard_index).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def assign_shards(weights, shard_count, tolerance=SHARD_BALANCE_TOLERANCE):
+    """Assign the features/scenarios to the shards.
+
+    Args:
+        weights (dict): Estimated weight (e.g. duration) of each feature/scenario, by key.
+        shard_count (int): Number of shards.
+        tolerance (float): Load each shard can exceed the average shard load by (0.1 means 10%).
+
+    Returns:
+        tuple: Shard index of each feature/scenario (by key), and the total weight of each shard.
+    """
+    shard_loads = [0.0] * shard_count
+    capacity = (1 + tolerance) * sum(weights.values()) / shard_count
+    assignments = {}
+    for key in sorted(weights, key=lambda key: (-weights[key], key)):
+        weight = weights[key]
+        preferred_shards = sorted(range(shard_count), key=lambda shard: -get_shard_rank(key, shard))
+        shard = next((shard for shard in preferred_shards if shard_loads[shard] + weight <= capacity), None)
+        if shard is None:
+            # Too long to fit in any shard, so it is assigned to the least loaded one
+            shard = min(preferred_shards, key=lambda shard: shard_loads[shard])
+        shard_loads[shard] += weight
+        assignments[key] = shard
+    return assignments, shard_loads
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Scheduler of the features/scenarios submitted to the parallel processes, when
+they hold resource locks (@LOCK_<name>) or depend on other tests
+(@DEPENDS_ON_<tag>, @AFTER_ORDER_<n> or strict execution ordering).
+
+Tasks are kept in the main process until they can be executed, and submitted
+as the parallel processes become available, so the processes keep executing
+the tasks that can run instead of waiting for the rest.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import time
+from concurrent.futures import Future
+
+from behavex.dependencies import BLOCKED, READY
+from behavex.resource_locks import ResourceLocks
+from behavex.utils import get_text
+
+
+class TaskScheduler(object):
+    """Submits tasks to the process pool when they can be executed.
+
+    At most max_running tasks are submitted at the same time (one per parallel
+    process), and each time a process is available, the first pending task
+    whose dependencies were executed and whose locks can be acquired is
+    submitted (keeping the order in which the tasks were provided). Tasks
+    depending on failed tasks are not executed, and reported as untested.
+    """
+
+    def __init__(self, submit, skip, max_running, resource_locks=None, dependency_graph=None):
+        """
+        Args:
+            submit (callable): Submits a task to the process pool, returning its future.
+            skip (callable): Reports a task as untested (with the given reason), returning its future.
+            max_running (int): Maximum number of tasks submitted at the same time.
+            resource_locks (ResourceLocks): Resource locks shared by all the tasks.
+            dependency_graph (DependencyGraph): Dependencies between the tasks (if any).
+        """
+        self._submit = submit
+        self._skip = skip
+        self.max_running = max(max_running, 1)
+        self.resource_locks = resource_locks or ResourceLocks()
+        self.dependency_graph = dependency_graph
+        self._condition = self.resource_locks.condition
+        self._pending = []
+        self._running = 0
+        self._futures = []
+        self._dispatching = False
+        self._dispatch_again = False
+
+    def start(self, tasks):
+        """Start submitting the tasks."""
+        with self._condition:
+            for task in tasks:
+                self._pending.append({'task': task, 'locks': task.get('locks', {}), 'blocked_since': None,
+                                      'blocked_locks': []})
+        self._dispatch()
+
+    def wait(self):
+        """Wait until all the tasks were executed.
+
+        Returns:
+            list: Futures of the executed tasks.
+        """
+        with self._condition:
+            while self._pending or self._running or self._dispatching:
+                if self._pending and not self._running and not self._dispatching:
+                    # None of the pending tasks can be executed (circular dependencies)
+                    break
+                self._condition.wait()
+            unresolved_tasks = [pending_task['task'] for pending_task in self._pending]
+            del self._pending[:]
+        for task in unresolved_tasks:
+            self._skip_task(task, get_text('dependencies.unresolved'))
+        with self._condition:
+            return list(self._futures)
+
+    def run_in_main_process(self, task, execute):
+        """Execute a task in the main process (e.g. a serial task), once its dependencies
+        were executed, holding its resource locks.
+
+        Args:
+            task (dict): Task to execute.
+            execute (callable): Executes the task, returning its execution code and JSON report.
+
+        Returns:
+            tuple: Execution code and JSON report, or None if the task was reported as untested.
+        """
+        locks = task.get('locks', {})
+        reason = None
+        with self._condition:
+            while self.dependency_graph:
+                state = self.dependency_graph.get_state(task)
+                if state == READY:
+                    break
+                if state == BLOCKED:
+                    reason = get_text('dependencies.failed')
+                    break
+                if not self._running and not self._dispatching:
+                    # The tasks it depends on cannot be executed before this one
+                    reason = get_text('dependencies.unresolved')
+                    break
+                self._condition.wait()
+        if reason:
+            self._skip_task(task, reason)
+            return None
+        self.resource_locks.acquire(locks)
+        failed = True
+        try:
+            result = execute()
+            failed = result[0] != 0
+            return result
+        finally:
+            with self._condition:
+                self.resource_locks.release(locks)
+                if self.dependency_graph:
+                    self.dependency_graph.task_done(task, failed)
+            self._dispatch()
+
+    def _dispatch(self):
+        with self._condition:
+            if self._dispatching:
+                # Tasks finishing while submitting (e.g. if the process pool is broken)
+                # are handled by the thread that is already submitting tasks
+                self._dispatch_again = True
+                return
+            self._dispatching = True
+        try:
+            while True:
+                tasks_to_submit, tasks_to_skip = self._get_tasks_to_submit()
+                for task in tasks_to_skip:
+                    self._skip_task(task, get_text('dependencies.failed'))
+                for pending_task in tasks_to_submit:
+                    self._submit_task(pending_task)
+                with self._condition:
+                    if not self._dispatch_again:
+                        return
+                    self._dispatch_again = False
+        finally:
+            with self._condition:
+                self._dispatching = False
+                self._condition.notify_all()
+
+    def _get_tasks_to_submit(self):
+        """Acquire the locks of the pending tasks that can be submitted, and return them
+        together with the tasks that will not be executed as their dependencies failed."""
+        tasks_to_submit = []
+        tasks_to_skip = []
+        with self._condition:
+            now = time.time()
+            for pending_task in list(self._pending):
+                if self._running >= self.max_running:
+                    break
+                state = self.dependency_graph.get_state(pending_task['task']) if self.dependency_graph else READY
+                if state == BLOCKED:
+                    self._pending.remove(pending_task)
+                    tasks_to_skip.append(pending_task['task'])
+                elif state != READY:
+                    continue
+                elif self.resource_locks.try_acquire(pending_task['locks']):
+                    self._pending.remove(pending_task)
+                    self._running += 1
+                    if pending_task['blocked_since'] is not None:
+                        self.resource_locks.record_wait(pending_task['blocked_locks'],
+                                                        now - pending_task['blocked_since'])
+                    tasks_to_submit.append(pending_task)
+                elif pending_task['blocked_since'] is None:
+                    # The task could be executed, but its locks are held by other tasks
+                    pending_task['blocked_since'] = now
+                    pending_task['blocked_locks'] = self.resource_locks.unavailable_locks(pending_task['locks'])
+            if tasks_to_skip:
+                # Skipped tasks can block other tasks
+                self._dispatch_again = True
+        return tasks_to_submit, tasks_to_skip
+
+    def _submit_task(self, pending_task):
+        try:
+            future = self._submit(pending_task['task'])
+        except Exception as ex:
+            # The task is reported as failed (e.g. the process pool is broken)
+            future = Future()
+            future.set_exception(ex)
+        with self._condition:
+            self._futures.append(future)
+        future.add_done_callback(lambda future: self._task_done(pending_task, future))
+
+    def _skip_task(self, task, reason):
+        with self._condition:
+            if self.dependency_graph:
+                self.dependency_graph.task_done(task, failed=True)
+        future = self._skip(task, reason)
+        with self._condition:
+            self._futures.append(future)
+            self._condition.notify_all()
+
+    def _task_done(self, pending_task, future):
+        with self._condition:
+            self._running -= 1
+            self.resource_locks.release(pending_task['locks'])
+            if self.dependency_graph:
+                self.dependency_graph.task_done(pending_task['task'], _has_failed(future))
+        self._dispatch()
+
+
+def _has_failed(future):
+    """Check whether a task failed, from its future (the execution code is the first item of its result)."""
+    if future.cancelled() or future.exception() is not None:
+        return True
+    result = future.result()
+    return not isinstance(result, tuple) or result[0] != 0
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Timeouts for the features/scenarios executed by the parallel processes.
+
+Scenarios can define a timeout using @TIMEOUT_<seconds> tags (or a global
+timeout provided by --scenario-timeout). When a task (scenario, chunk of
+scenarios or feature) exceeds its timeout, the main process reports it as an
+error, terminates the parallel process that is running it, and the process
+pool starts a new process to replace it, so the execution can continue.
+
+Parallel processes can also be retired (recycled) after executing a task, when
+they reach the maximum number of tasks or memory usage. In that case, the
+process sends the task results to the main process and exits, and it is
+replaced the same way.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import inspect
+import itertools
+import logging
+import os
+import queue
+import re
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import process as futures_process
+
+from behavex.worker import flush_stats_queue
+
+TIMEOUT_TAG_PREFIX = 'TIMEOUT_'
+TIMEOUT_TAG_REGEX = re.compile(r'^@?{}(\d+(?:\.\d+)?)$'.format(TIMEOUT_TAG_PREFIX))
+
+# Values of the task slots shared with the parallel processes (other values are task IDs)
+IDLE_SLOT = 0
+EXPIRED_SLOT = -1
+RETIRING_SLOT = -2
+
+# Events sent by the parallel processes to the main process
+TASK_STARTED = 'started'
+WORKER_RETIRED = 'retired'
+
+# Task tracking state of the current parallel process
+_task_tracking = {'worker_id': None, 'task_slots': None, 'task_events': None, 'worker_releases': None,
+                  'id_queue': None}
+
+
+def get_timeout_from_tags(tags, default_timeout=None):
+    """Return the timeout (in seconds) defined by the TIMEOUT_<seconds> tags.
+    If several timeout tags are provided, the lowest one is considered.
+
+    Args:
+        tags (list): Scenario tags (including the feature tags).
+        default_timeout (float): Timeout for scenarios with no timeout tags.
+
+    Returns:
+        float: Timeout in seconds, or None if no timeout applies.
+    """
+    timeouts = []
+    for tag in tags:
+        match = TIMEOUT_TAG_REGEX.match(str(tag))
+        if match:
+            timeouts.append(float(match.group(1)))
+    if timeouts:
+        return min(timeouts)
+    return default_timeout if default_timeout else None
+
+
+def get_task_timeout(timeouts):
+    """Return the timeout of a task executing several scenarios (the sum of
+    the scenario timeouts), or None if any of the scenarios has no timeout."""
+    if not timeouts or any(timeout is None for timeout in timeouts):
+        return None
+    return sum(timeouts)
+
+
+def init_task_tracking(worker_id, task_slots, task_events, worker_releases=None, id_queue=None):
+    """Executed by each parallel process, to report the tasks it executes to the main process.
+
+    Args:
+        worker_id (int): ID of the current parallel process.
+        task_slots (Array): Task executed by each parallel process (by worker ID).
+        task_events (Queue): Queue used to send the task events to the main process.
+        worker_releases (list): Queues used by the main process to release the retired processes (by worker ID).
+        id_queue (Queue): Queue with the worker IDs, where retired processes return their ID.
+    """
+    _task_tracking.update({'worker_id': worker_id, 'task_slots': task_slots, 'task_events': task_events,
+                           'worker_releases': worker_releases, 'id_queue': id_queue})
+
+
+def task_started(task_id):
+    """Report the main process that the current parallel process started executing a task."""
+    task_slots = _task_tracking['task_slots']
+    if task_id is None or task_slots is None:
+        return
+    with task_slots.get_lock():
+        task_slots[_task_tracking['worker_id']] = task_id
+    _task_tracking['task_events'].put((TASK_STARTED, task_id, _task_tracking['worker_id'], os.getpid(), time.time()))
+
+
+def task_finished(task_id, result=None, retirement=None):
+    """Release the slot of the current parallel process once the task was executed.
+
+    If the main process already reported the task as timed out, the process
+    waits here until it is terminated, so it does not send the task results
+    or start executing another task.
+
+    Args:
+        task_id (int): ID of the executed task.
+        result: Result of the task.
+        retirement (dict): Information about the retirement of the process, if
+            it should exit after this task. The result is sent to the main
+            process, which reports it to the process pool, and the process exits.
+
+    Returns:
+        Result of the task.
+    """
+    task_slots = _task_tracking['task_slots']
+    if task_id is None or task_slots is None:
+        return result
+    worker_id = _task_tracking['worker_id']
+    with task_slots.get_lock():
+        expired = task_slots[worker_id] == EXPIRED_SLOT
+        if not expired:
+            task_slots[worker_id] = RETIRING_SLOT if retirement else IDLE_SLOT
+    if expired:
+        # Blocks until the process is terminated by the main process
+        threading.Event().wait()
+    if retirement:
+        _task_tracking['task_events'].put((WORKER_RETIRED, task_id, worker_id, os.getpid(), result, retirement))
+        # Blocks until the main process reported the task results to the process pool
+        _task_tracking['worker_releases'][worker_id].get()
+        _exit_worker()
+    return result
+
+
+def _exit_worker():
+    """Exit the current parallel process (the worker-scoped after_all hook was already executed),
+    once the load statistics of persistent workers were sent to the main process.
+
+    The worker ID is returned here, so the process replacing the current one
+    (which gets the same ID) cannot read the releases of the current process.
+    The queues are flushed before exiting, as a process exiting while sending
+    data through a queue leaves it locked for the remaining processes.
+    """
+    flush_stats_queue()
+    _task_tracking['id_queue'].put(_task_tracking['worker_id'])
+    for process_queue in (_task_tracking['task_events'], _task_tracking['id_queue']):
+        process_queue.close()
+        process_queue.join_thread()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+def can_replace_processes():
+    """Check whether the processes of the process pool can be replaced (see ProcessPoolAdapter)."""
+    return ProcessPoolAdapter.is_supported()
+
+
+class ProcessPoolAdapter(object):
+    """Access to the internals of a ProcessPoolExecutor, required to replace
+    its processes without breaking the pool.
+
+    Processes are replaced the same way the process pool replaces the ones
+    that reach max_tasks_per_child (Python 3.11+): the result of their last
+    task is reported to the pool as sent by the process when exiting, and a
+    new process is started. All the private attributes of the process pool
+    are accessed here, and only if is_supported().
+    """
+
+    def __init__(self, process_pool):
+        self._process_pool = process_pool
+
+    @staticmethod
+    def is_supported():
+        """Check whether the Python version supports replacing the processes of a process pool."""
+        result_item = getattr(futures_process, '_ResultItem', None)
+        return (sys.version_info >= (3, 11) and result_item is not None and
+                'exit_pid' in inspect.signature(result_item).parameters and
+                all(hasattr(futures_process.ProcessPoolExecutor, method)
+                    for method in ('_adjust_process_count', '_spawn_process')))
+
+    def intercept_process_count_adjustments(self, adjust_process_count):
+        """Execute adjust_process_count(default_adjustment) when the process pool adjusts its number
+        of processes (when a process exits, and when submitting tasks)."""
+        default_adjustment = self._process_pool._adjust_process_count
+        self._process_pool._adjust_process_count = lambda: adjust_process_count(default_adjustment)
+
+    def can_spawn_process(self):
+        """Check whether the process pool has less processes than its maximum number of processes."""
+        return len(self._process_pool._processes) < self._process_pool._max_workers
+
+    def spawn_process(self):
+        """Start a new process in the process pool."""
+        self._process_pool._spawn_process()
+
+    def get_work_id(self, future):
+        """Return the ID used by the process pool for the task of a future (None if it is not pending)."""
+        return next((work_id for work_id, work_item in list(self._process_pool._pending_work_items.items())
+                     if work_item.future is future), None)
+
+    def report_process_exit(self, work_id, pid, result):
+        """Report the result of a task to the process pool, as sent by the process running it when
+        exiting, so the process pool stops tracking the process."""
+        self._process_pool._result_queue.put(futures_process._ResultItem(work_id, result=result, exit_pid=pid))
+
+
+class TrackedTask(object):
+
+    def __init__(self, task_id, timeout, get_timeout_result, name=None):
+        self.task_id = task_id
+        self.timeout = timeout
+        self.get_timeout_result = get_timeout_result
+        self.name = name
+        self.future = None
+        self.worker_id = None
+        self.pid = None
+        self.deadline = None
+
+
+class TaskWatchdog(object):
+    """Monitors the tasks executed by the parallel processes, terminates the
+    processes running tasks that exceeded their timeout, and replaces the
+    processes that retired.
+
+    The result of a timed out task (or of the last task executed by a retired
+    process) is sent to the process pool as if it was sent by the process
+    when exiting (the same way processes that reach max_tasks_per_child exit),
+    so the process pool starts a new process to replace it, instead of
+    considering the pool as broken. This is only supported by some Python
+    versions (see ProcessPoolAdapter.is_supported), so the watchdog must not
+    be used otherwise.
+    """
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, id_queue, task_slots, task_events, worker_releases, on_timeout=None, track_all_tasks=False):
+        self.process_pool = None
+        self.id_queue = id_queue
+        self.task_slots = task_slots
+        self.task_events = task_events
+        self.worker_releases = worker_releases
+        self.on_timeout = on_timeout
+        # Tasks with no timeout are also tracked when processes can be retired
+        self.track_all_tasks = track_all_tasks
+        self.timed_out_tasks = 0
+        self.retired_workers = []
+        self._task_ids = itertools.count(1)
+        self._tasks = {}
+        self._starts = {}
+        self._retirements = {}
+        self._pending_replacements = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='behavex_task_watchdog', daemon=True)
+
+    def start(self, process_pool):
+        self.process_pool = ProcessPoolAdapter(process_pool)
+        self.process_pool.intercept_process_count_adjustments(self._replace_exited_processes)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def tracks(self, timeout):
+        """Return whether a task with the given timeout should be tracked."""
+        return self.track_all_tasks or timeout is not None
+
+    def new_task(self, timeout, get_timeout_result, name=None):
+        """Register a task to be monitored, before submitting it.
+
+        Args:
+            timeout (float): Timeout of the task in seconds (None if it has no timeout).
+            get_timeout_result (callable): Returns the result reported for the task if it times out.
+            name (str): Name of the task, to be displayed if it times out.
+        """
+        task = TrackedTask(next(self._task_ids), timeout, get_timeout_result, name)
+        with self._lock:
+            self._tasks[task.task_id] = task
+        return task
+
+    def watch(self, task, future):
+        """Start monitoring a submitted task (until its future is done)."""
+        with self._lock:
+            task.future = future
+            if task.task_id in self._starts:
+                self._set_started(task, *self._starts.pop(task.task_id))
+            retirement = self._retirements.pop(task.task_id, None)
+        if retirement:
+            self._retire(task, *retirement)
+        future.add_done_callback(lambda _: self._forget(task))
+
+    def _forget(self, task):
+        with self._lock:
+            self._tasks.pop(task.task_id, None)
+            self._starts.pop(task.task_id, None)
+            self._retirements.pop(task.task_id, None)
+
+    def _set_started(self, task, worker_id, pid, start_time):
+        task.worker_id = worker_id
+        task.pid = pid
+        if task.timeout is not None:
+            task.deadline = start_time + task.timeout
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._read_task_events()
+            now = time.time()
+            with self._lock:
+                expired_tasks = [task for task in self._tasks.values()
+                                 if task.future is not None and task.deadline is not None and task.deadline <= now]
+            for task in expired_tasks:
+                try:
+                    self._expire(task)
+                except Exception as ex:
+                    logging.warning('Timed out task could not be terminated: {}'.format(ex))
+
+    def _read_task_events(self):
+        task_events = []
+        try:
+            task_events.append(self.task_events.get(timeout=self.POLL_INTERVAL))
+            while True:
+                task_events.append(self.task_events.get_nowait())
+        except queue.Empty:
+            pass
+        except (EOFError, OSError):
+            time.sleep(self.POLL_INTERVAL)
+        retired_tasks = []
+        with self._lock:
+            for event, task_id, *event_data in task_events:
+                task = self._tasks.get(task_id)
+                if task is None:
+                    continue
+                if event == TASK_STARTED and task.future is not None:
+                    self._set_started(task, *event_data)
+                elif event == TASK_STARTED:
+                    # The task started before its future was registered
+                    self._starts[task_id] = tuple(event_data)
+                elif event == WORKER_RETIRED and task.future is not None:
+                    retired_tasks.append((task, event_data))
+                elif event == WORKER_RETIRED:
+                    self._retirements[task_id] = tuple(event_data)
+        for task, event_data in retired_tasks:
+            self._retire(task, *event_data)
+
+    def _expire(self, task):
+        with self.task_slots.get_lock():
+            # The slot is checked and marked as expired atomically, so the process
+            # cannot send the task results (or start another task) after this point.
+            # It is also terminated while holding the lock, so it cannot be holding it
+            if self.task_slots[task.worker_id] != task.task_id or task.future.done():
+                return
+            self.task_slots[task.worker_id] = EXPIRED_SLOT
+            self._forget(task)
+            self.timed_out_tasks += 1
+            if self._replace_process(task, task.pid, task.get_timeout_result()):
+                # The process started to replace the terminated one gets the same worker ID
+                self.id_queue.put(task.worker_id)
+            os.kill(task.pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        if self.on_timeout:
+            self.on_timeout(task)
+
+    def _retire(self, task, worker_id, pid, result, retirement):
+        with self.task_slots.get_lock():
+            self._forget(task)
+            self._replace_process(task, pid, result)
+        # The process exits once it is released (and returns its worker ID to the ID queue)
+        self.worker_releases[worker_id].put(task.task_id)
+        self.retired_workers.append(dict(retirement, worker_id=worker_id, pid=pid))
+
+    def _replace_exited_processes(self, adjust_process_count):
+        """Executed by the process pool when a process exits (and when submitting tasks).
+
+        The pool does not start a new process if it considers that there are idle
+        processes, so a process reported as exited by the watchdog is replaced here
+        once the pool stopped tracking it.
+        """
+        with self._lock:
+            replace = self._pending_replacements > 0 and self.process_pool.can_spawn_process()
+            if replace:
+                self._pending_replacements -= 1
+        if replace:
+            self.process_pool.spawn_process()
+        else:
+            adjust_process_count()
+
+    def _replace_process(self, task, pid, result):
+        """Send the task result to the process pool, reporting that the process exited.
+
+        Returns:
+            bool: True if the result was sent (False if the process pool is not waiting for it).
+        """
+        work_id = self.process_pool.get_work_id(task.future)
+        if work_id is None:
+            return False
+        with self._lock:
+            self._pending_replacements += 1
+        self.process_pool.report_process_exit(work_id, pid, result)
+        return True
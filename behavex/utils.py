@@ -11,7 +11,7 @@ import codecs
 import functools
 import glob
 import hashlib
-import json
+import itertools
 import logging
 import multiprocessing
 import os
@@ -21,15 +21,17 @@ import sys
 import time
 import uuid
 from concurrent.futures.process import BrokenProcessPool
-from functools import reduce
 from tempfile import gettempdir
 
 from behave.model import ScenarioOutline
 from behave.parser import parse_feature, parse_file
 from configobj import ConfigObj
 
+from behavex import serializer
 from behavex.conf_mgr import get_env, get_param, set_env
 from behavex.execution_singleton import ExecutionSingleton
+from behavex.feature_cache import (dumps_feature, get_feature_cache,
+                                   loads_feature)
 from behavex.global_vars import global_vars
 from behavex.outputs import report_html
 from behavex.outputs.output_strings import TEXTS
@@ -51,6 +53,8 @@ ELAPSED_START_TIME = time.time()
 def handle_execution_complete_callback(codes,
                                        json_reports,
                                        progress_bar_instance,
+                                       progress_increment,
+                                       report_callback,
                                        future):
     tuple_values = None
     try:
@@ -60,17 +64,34 @@ def handle_execution_complete_callback(codes,
         codes.append(1)
     if tuple_values:
         execution_code, map_json = tuple_values
-        json_reports += [map_json]
+        add_json_report(json_reports, execution_code, map_json)
         codes.append(execution_code)
+        if report_callback:
+            try:
+                report_callback(map_json)
+            except Exception as ex:
+                logging.warning('Execution report could not be processed: {}'.format(ex))
     if progress_bar_instance:
-        progress_bar_instance.update()
+        progress_bar_instance.update(progress_increment)
+
+
+def add_json_report(json_reports, execution_code, json_report):
+    """Add the JSON report of an execution to the results journal, if there is one
+    (the final report is generated from the journal), or to the JSON reports otherwise."""
+    if global_vars.results_journal:
+        global_vars.results_journal.add_result(execution_code, json_report)
+    else:
+        json_reports.append(json_report)
 
 
 def create_execution_complete_callback_function(codes,
                                                 json_reports,
-                                                progress_bar_instance):
+                                                progress_bar_instance,
+                                                progress_increment=1,
+                                                report_callback=None):
     append_output = functools.partial(handle_execution_complete_callback,
-                                      codes, json_reports, progress_bar_instance)
+                                      codes, json_reports, progress_bar_instance, progress_increment,
+                                      report_callback)
     return append_output
 
 
@@ -85,59 +106,70 @@ def get_logging_level():
 
 # noinspection PyDictCreation
 def join_feature_reports(json_reports):
-    if type(json_reports) is list:
-        if len(json_reports) == 1:
-            merged_json = json_reports[0]
-        else:
-            merged_json = {}
-            merged_json['environment'] = join_list_dict(json_reports, 'environment')
-            merged_json['steps_definition'] = join_step_definitions(json_reports)
-            merged_json['features'] = sum((json_['features'] for json_ in json_reports), [])
-    else:
+    """Merge the JSON reports of several executions into a single report, keeping
+    only the scenarios matching the include filters (--include, --include-paths, --name).
+
+    The reports are merged in a single pass (features are appended and step
+    definitions are updated in place), as there can be one report per scenario.
+    They can also be provided by an iterator (e.g. as they are read from the
+    results journal), so they are merged as they are read.
+    """
+    if isinstance(json_reports, dict):
         merged_json = json_reports
+    else:
+        json_reports = iter(json_reports)
+        first_report = next(json_reports, None)
+        second_report = next(json_reports, None)
+        if first_report is not None and second_report is None:
+            merged_json = first_report
+        else:
+            merged_json = {'environment': [], 'steps_definition': {}, 'features': []}
+            for json_ in itertools.chain(filter(None, (first_report, second_report)), json_reports):
+                if isinstance(json_['environment'], dict):
+                    merged_json['environment'].extend(json_['environment'])
+                # Definitions from later reports take precedence, keeping the order in which they were found
+                if isinstance(json_['steps_definition'], dict):
+                    merged_json['steps_definition'].update(json_['steps_definition'])
+                merged_json['features'].extend(json_['features'])
     if merged_json['features'] and (IncludeNameMatch().bool() or IncludePathsMatch().bool() or MatchInclude().bool()):
-        delete = []
-        for index, feature in enumerate(merged_json['features'][:]):
+        include_name_match = IncludeNameMatch()
+        include_paths_match = IncludePathsMatch()
+        match_include = MatchInclude()
+        features = []
+        for feature in merged_json['features']:
+            if not match_include(feature['filename']):
+                continue
             scenarios = [
                 scenario
                 for scenario in feature['scenarios']
-                if IncludeNameMatch()(scenario['name'])
-                and MatchInclude()(feature['filename'])
-                and IncludePathsMatch()(scenario['filename'], scenario['line'])
+                if include_name_match(scenario['name'])
+                and include_paths_match(scenario['filename'], scenario['line'])
             ]
-            if not scenarios:
-                # create index list for delete after iterated the feature list.
-                delete.append(index - len(delete))
-            else:
-                merged_json['features'][index]['scenarios'] = scenarios
-        if delete:
-            for index in delete:
-                del merged_json['features'][index]
+            if scenarios:
+                feature['scenarios'] = scenarios
+                features.append(feature)
+        merged_json['features'][:] = features
     return merged_json
 
 
 def join_list_dict(json_reports, key):
-    new_list_dict = sum(
-        (json_[key] for json_ in json_reports if isinstance(json_[key], dict)), []
-    )
+    new_list_dict = []
+    for json_ in json_reports:
+        if isinstance(json_[key], dict):
+            new_list_dict.extend(json_[key])
     return new_list_dict
 
 
 def join_step_definitions(json_reports):
-    # the update function forced to return a list
-    def update(x, y):
-        if isinstance(x, dict) and isinstance(y, dict):
-            return dict(list(x.items()) + list(y.items()))
-        elif isinstance(x, dict) and not isinstance(y, dict):
-            return dict(list(x.items()))
-        elif isinstance(y, dict) and not isinstance(x, dict):
-            return dict(list(y.items()))
-        else:
-            return {}
-
     list_definitions = [_json['steps_definition'] for _json in json_reports]
-
-    return {} if not list_definitions else reduce(update, list_definitions)
+    if len(list_definitions) == 1:
+        return list_definitions[0]
+    # Definitions from later reports take precedence, keeping the order in which they were found
+    steps_definition = {}
+    for definitions in list_definitions:
+        if isinstance(definitions, dict):
+            steps_definition.update(definitions)
+    return steps_definition
 
 
 # the join_scenario_reports function forced to return a list
@@ -182,7 +214,7 @@ def join_scenario_reports(json_reports):
     return list(result.values())
 
 
-def explore_features(features_path, features_list=None):
+def explore_features(features_path, features_list=None, process_pool=None, parallel_processes=1):
     if features_list is None:
         features_list = []
     # Normalize path separators
@@ -207,25 +239,72 @@ def explore_features(features_path, features_list=None):
                 else:
                     features_list.extend(feature.scenarios)
     else:
-        try:
-            for node in os.listdir(normalized_features_path):
-                node_path = os.path.join(normalized_features_path, node)
-                if os.path.isdir(node_path):
-                    explore_features(node_path, features_list)
-                elif node.endswith('.feature'):
-                    abs_feature_path = os.path.abspath(node_path)
-                    feature = should_feature_be_run(abs_feature_path)
-                    if feature:
-                        features_list.extend(feature.scenarios)
-        except OSError as e:
-            print(f"Error accessing path {features_path}: {e}")
-            return features_list
+        feature_files = get_feature_files(normalized_features_path)
+        for feature in get_features_to_run(feature_files, process_pool, parallel_processes):
+            features_list.extend(feature.scenarios)
 
     return features_list
 
 
+def get_feature_files(features_path):
+    """Return the feature files located in a folder and its subfolders.
+    Folder entries are sorted by name, so the result does not depend on the
+    order in which the file system lists them."""
+    feature_files = []
+    try:
+        with os.scandir(features_path) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError as e:
+        print(f"Error accessing path {features_path}: {e}")
+        return feature_files
+    for entry in entries:
+        if entry.is_dir():
+            feature_files.extend(get_feature_files(entry.path))
+        elif entry.name.endswith('.feature'):
+            feature_files.append(os.path.abspath(entry.path))
+    return feature_files
+
+
+def get_features_to_run(feature_files, process_pool=None, parallel_processes=1):
+    """Parse the feature files and return the features that should be run,
+    in the same order as the provided files.
+
+    When a process pool is provided, the feature files are parsed and
+    filtered by the parallel processes, and only the features to run are
+    sent back to the main process.
+    """
+    # Parsing in parallel only pays off when the processes can run on different CPUs
+    parsing_processes = min(parallel_processes, os.cpu_count() or 1)
+    if process_pool is None or parsing_processes < 2 or len(feature_files) < 2:
+        features = (should_feature_be_run(feature_file) for feature_file in feature_files)
+        return [feature for feature in features if feature]
+    # Several chunks per process, so the load is balanced when parsing times differ
+    chunk_size = max(1, -(-len(feature_files) // (parsing_processes * 4)))
+    futures = [process_pool.submit(filter_features_to_run, feature_files[index:index + chunk_size])
+               for index in range(0, len(feature_files), chunk_size)]
+    features = []
+    for future in futures:
+        features.extend(loads_feature(model_data) for model_data in future.result())
+    return features
+
+
+def filter_features_to_run(feature_files):
+    """Executed by the parallel processes: return the serialized models of
+    the features that should be run."""
+    features = (should_feature_be_run(feature_file) for feature_file in feature_files)
+    return [dumps_feature(feature) for feature in features if feature]
+
+
 def should_feature_be_run(path_feature):
-    feature = parse_file(path_feature)
+    feature_cache = get_feature_cache()
+    if feature_cache:
+        # The scenario tags are obtained from the cache index, without loading the feature model
+        tags_list = [list(tags) for tags in feature_cache.get_scenarios_tags(path_feature)]
+        if not any(match_for_execution(tags) for tags in tags_list):
+            return False
+        feature = feature_cache.parse_file(path_feature)
+    else:
+        feature = parse_file(path_feature)
     if not feature:
         return False
     else:
@@ -422,12 +501,16 @@ def configure_logging(args_parse):
 
 
 def len_scenarios(feature_file):
-    data = codecs.open(feature_file, encoding='utf8').read()
-    feature = parse_feature(data=data)
+    feature_cache = get_feature_cache()
+    if feature_cache:
+        tags_list = [list(tags) for tags in feature_cache.get_scenarios_tags(feature_file)]
+    else:
+        data = codecs.open(feature_file, encoding='utf8').read()
+        feature = parse_feature(data=data)
+        tags_list = [get_scenario_tags(scenario) for scenario in get_scenarios_instances(feature.scenarios)]
     amount_scenarios = 0
-    scenarios_instances = get_scenarios_instances(feature.scenarios)
-    for scenario in scenarios_instances:
-        if match_for_execution(get_scenario_tags(scenario)):
+    for scenario_tags in tags_list:
+        if match_for_execution(scenario_tags):
             amount_scenarios += 1
     return amount_scenarios
 
@@ -463,7 +546,7 @@ def set_behave_tags():
 
 def get_scenario_tags(scenario, include_outline_example_tags=True):
     if type(scenario) is dict:
-        scenario_tags_set = set(scenario['tags'])
+        scenario_tags = scenario['tags']
     else:
         # Behave 1.2.7+ compatibility: effective_tags may not exist, fallback to tags
         if hasattr(scenario, 'effective_tags'):
@@ -477,9 +560,9 @@ def get_scenario_tags(scenario, include_outline_example_tags=True):
         if include_outline_example_tags and isinstance(scenario, ScenarioOutline):
             for example in scenario.examples:
                 scenario_tags.extend(example.tags)
-        scenario_tags_set = set(scenario_tags)
-    result = list(scenario_tags_set)
-    return result
+    # Duplicated tags are removed keeping their order (instead of using a set), so the
+    # reports are the same regardless of the hash seed of the process generating them
+    return list(dict.fromkeys(scenario_tags))
 
 
 def get_scenarios_instances(scenarios):
@@ -531,8 +614,7 @@ def get_json_results():
     path_json = os.path.join(
         get_env('OUTPUT'), global_vars.report_filenames['report_json']
     )
-    with open(path_json, 'r') as json_file:
-        json_results = json.load(json_file)
+    json_results = serializer.load(path_json)
     return json_results or {}
 
 
@@ -581,12 +663,17 @@ class IncludePathsMatch(metaclass=ExecutionSingleton):
             for path in self.features_paths
             if os.path.isdir(path) and not has_scenario_line_number(path)
         ]
+        # Absolute paths by filename, as all the scenarios of a feature are matched
+        self._absolute_paths = {}
 
     def __call__(self, *args, **kwargs):
         return self.match(*args)
 
     def match(self, filename, scenario=None):
-        filename = os.path.abspath(filename)
+        absolute_path = self._absolute_paths.get(filename)
+        if absolute_path is None:
+            absolute_path = self._absolute_paths[filename] = os.path.abspath(filename)
+        filename = absolute_path
         match_scenario, match_feature = False, False
         if scenario:
             match_scenario = '{}:{}'.format(filename, scenario) in self.scenarios
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+/*
+* BehaveX - Agile test wrapper on top of Behave (BDD)
+*/
+
+Worker process support:
+- Persistent workers: each process loads the behave hooks (environment.py) and
+  step definitions only once, and reuses them for all the features/scenarios
+  it executes.
+- Worker-scoped hooks: the before_all hook is executed once per process, and
+  the after_all hook when the process finishes.
+- Worker recycling: each process is retired (and replaced) after executing a
+  maximum number of tasks, or when its memory usage exceeds a threshold.
+"""
+# __future__ has been added to maintain compatibility
+from __future__ import absolute_import
+
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import sys
+import time
+from types import SimpleNamespace
+
+from behave.runner import Runner
+from behave.runner_util import exec_file
+
+# Hooks loaded in the current process, by hooks file path
+_loaded_hooks = {}
+# Step paths loaded in the current process (the behave step registry is global to the process)
+_loaded_step_paths = set()
+# Queue used by the worker processes to send the load statistics to the main process
+_stats_queue = None
+# Load statistics of the behave runs performed in the current process
+_local_stats = []
+# Objects shared by all the features/scenarios executed by the current process (context.worker_scope)
+_worker_scope = SimpleNamespace()
+# State of the worker-scoped before_all/after_all hooks in the current process (the behave
+# runners are not kept, so their features, context and captured output can be released)
+_worker_hooks = {'initialized': False, 'context_attributes': {}, 'config': None, 'after_all': None}
+# Attribute marking the behave runner that executed the worker-scoped before_all hook
+WORKER_HOOKS_RUNNER_ATTRIBUTE = '_behavex_worker_hooks'
+# Number of tasks executed by the current process
+_executed_tasks = {'count': 0}
+
+RECYCLE_BY_TASKS = 'tasks'
+RECYCLE_BY_RSS = 'rss'
+
+
+class PersistentRunner(Runner):
+    """Behave runner that reuses the hooks and step definitions already loaded
+    by previous runs in the same process."""
+
+    def __init__(self, config):
+        super(PersistentRunner, self).__init__(config)
+        self.load_time = 0.0
+        self.reused = True
+
+    def load_hooks(self, filename=None):
+        start_time = time.time()
+        base_dir = self.base_dir or self.DEFAULT_DIRECTORY
+        filename = filename or self.config.environment_file
+        hooks_path = os.path.abspath(os.path.join(base_dir, filename))
+        if hooks_path not in _loaded_hooks:
+            hooks = {}
+            if os.path.exists(hooks_path):
+                exec_file(hooks_path, hooks)
+            _loaded_hooks[hooks_path] = hooks
+            self.reused = False
+        self.hooks.update(_loaded_hooks[hooks_path])
+        if "before_all" not in self.hooks:
+            self.hooks["before_all"] = self.before_all_default_hook
+        self.load_time += time.time() - start_time
+
+    def load_step_definitions(self, extra_step_paths=None):
+        start_time = time.time()
+        steps_dir = os.path.abspath(os.path.join(self.base_dir, self.config.steps_dir))
+        step_paths = tuple([steps_dir] + [os.path.abspath(path) for path in extra_step_paths or []])
+        if step_paths not in _loaded_step_paths:
+            super(PersistentRunner, self).load_step_definitions(extra_step_paths)
+            _loaded_step_paths.add(step_paths)
+            self.reused = False
+        self.load_time += time.time() - start_time
+
+
+def set_stats_queue(stats_queue):
+    """Set the queue used to send the load statistics to the main process."""
+    global _stats_queue
+    _stats_queue = stats_queue
+
+
+def flush_stats_queue():
+    """Wait until the load statistics recorded by the current process were sent to the main process."""
+    if _stats_queue is not None:
+        _stats_queue.close()
+        _stats_queue.join_thread()
+
+
+def record_run(runner):
+    """Record the time spent loading hooks and step definitions by a behave run."""
+    stats = (runner.load_time, runner.reused)
+    if _stats_queue is not None:
+        _stats_queue.put(stats)
+    else:
+        _local_stats.append(stats)
+
+
+def collect_stats(stats_queue=None):
+    """Gather the load statistics recorded by all processes.
+
+    Returns:
+        dict: Total runs, runs that reused the loaded definitions, and the time
+        saved per reused run (in seconds), estimated from the time spent by the
+        runs that loaded them for the first time.
+    """
+    all_stats = list(_local_stats)
+    while stats_queue is not None:
+        try:
+            all_stats.append(stats_queue.get(timeout=0.1))
+        except (queue.Empty, EOFError, OSError):
+            break
+    first_load_times = [load_time for load_time, reused in all_stats if not reused]
+    reuse_times = [load_time for load_time, reused in all_stats if reused]
+    avg_first_load = sum(first_load_times) / len(first_load_times) if first_load_times else 0.0
+    avg_reuse = sum(reuse_times) / len(reuse_times) if reuse_times else 0.0
+    saved_per_run = max(avg_first_load - avg_reuse, 0.0)
+    return {
+        'runs': len(all_stats),
+        'reused_runs': len(reuse_times),
+        'saved_per_run': saved_per_run,
+        'saved_time': saved_per_run * len(reuse_times),
+    }
+
+
+def run_worker_before_all(runner, context, run_before_all):
+    """Execute the before_all hook only once in the current process.
+
+    The context attributes set by the hook are restored in the context of the
+    following runs, and context.worker_scope is available to share objects
+    between all the features/scenarios executed by the process. If the hook
+    fails, it is executed again by the next run.
+
+    Args:
+        runner (Runner): Behave runner executing the hook.
+        context (Context): Behave context of the runner.
+        run_before_all (callable): Function executing the original before_all hook.
+    """
+    context_root = getattr(context, '_root', None)
+    if context_root is None:
+        run_before_all()
+        return
+    context_root['worker_scope'] = _worker_scope
+    if _worker_hooks['initialized']:
+        context_root.update(_worker_hooks['context_attributes'])
+        return
+    existing_attributes = set(context_root)
+    hook_failures = getattr(runner, 'hook_failures', 0)
+    run_before_all()
+    if getattr(runner, 'hook_failures', 0) > hook_failures or getattr(runner, 'aborted', False):
+        return
+    setattr(runner, WORKER_HOOKS_RUNNER_ATTRIBUTE, True)
+    _worker_hooks['initialized'] = True
+    _worker_hooks['config'] = runner.config
+    _worker_hooks['context_attributes'] = {key: value for key, value in context_root.items()
+                                           if key not in existing_attributes and not key.startswith('@')}
+
+
+def defer_worker_after_all(runner, run_after_all):
+    """Defer the after_all hook until the current process finishes.
+
+    Only the after_all hook of the run that executed before_all is deferred.
+    The hook is executed immediately if before_all was not executed by the
+    worker (e.g. it failed), as behave does. The deferred hook receives a
+    context with the configuration, context.worker_scope and the attributes
+    set by before_all.
+
+    Args:
+        runner (Runner): Behave runner executing the hook.
+        run_after_all (callable): Function executing the original after_all hook.
+    """
+    if not _worker_hooks['initialized']:
+        run_after_all()
+    elif getattr(runner, WORKER_HOOKS_RUNNER_ATTRIBUTE, False) and _worker_hooks['after_all'] is None:
+        _worker_hooks['after_all'] = runner.hooks.get('after_all')
+        if multiprocessing.parent_process() is not None:
+            # Worker processes execute the teardown when the process pool is shut down
+            multiprocessing.util.Finalize(None, run_worker_teardown, exitpriority=10)
+
+
+def run_worker_teardown():
+    """Execute the deferred after_all hook of the current process (if any)."""
+    after_all = _worker_hooks['after_all']
+    context = SimpleNamespace(**dict(_worker_hooks['context_attributes'], config=_worker_hooks['config'],
+                                     worker_scope=_worker_scope))
+    _worker_hooks.update({'initialized': False, 'context_attributes': {}, 'config': None, 'after_all': None})
+    if after_all is None:
+        return
+    try:
+        after_all(context)
+    except Exception as exception:
+        print('HOOK-ERROR in after_all: {}: {}'.format(type(exception).__name__, exception))
+
+
+def get_rss_mb():
+    """Return the resident set size of the current process in MB, or None if it cannot be measured."""
+    try:
+        with open('/proc/self/statm') as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024.0 * 1024.0)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak resident set size (in bytes on macOS, and in kilobytes on other platforms)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else max_rss / 1024.0
+
+
+def get_worker_retirement(max_tasks=None, max_rss_mb=None):
+    """Check, after executing a task, whether the current process should be retired.
+
+    Args:
+        max_tasks (int): Maximum number of tasks executed by a process.
+        max_rss_mb (float): Maximum resident set size of a process (in MB).
+
+    Returns:
+        dict: Reason, executed tasks and resident set size (in MB) of the
+        process, or None if the process should not be retired.
+    """
+    _executed_tasks['count'] += 1
+    if not max_tasks and not max_rss_mb:
+        return None
+    rss_mb = get_rss_mb()
+    if max_tasks and _executed_tasks['count'] >= max_tasks:
+        reason = RECYCLE_BY_TASKS
+    elif max_rss_mb and rss_mb is not None and rss_mb >= max_rss_mb:
+        reason = RECYCLE_BY_RSS
+    else:
+        return None
+    return {'reason': reason, 'tasks': _executed_tasks['count'], 'rss_mb': rss_mb}
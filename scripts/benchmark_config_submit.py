@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of sending the BehaveX configuration to the parallel processes.
+
+Compares the previous approach (pickling the ConfigRun instance with every
+submitted task) with the current one (sending a configuration snapshot once,
+through the process pool initializer).
+
+Usage:
+    python scripts/benchmark_config_submit.py [--tasks 10000] [--processes 4]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.arguments import parse_arguments
+from behavex.conf_mgr import ConfigRun, install_config_snapshot
+
+FEATURE_JSON_SKELETON = '{"id": 1, "name": "Feature", "filename": "features/sample.feature", "scenarios": []}'
+
+
+def execute_task(feature_filename, feature_json_skeleton, scenario_line, config=None):
+    """Task executed by the parallel processes (the configuration is only accessed)."""
+    config = config or ConfigRun()
+    return config.get_param('parallel_scheme') and 0
+
+
+def measure_pickling(tasks, with_config):
+    start_time = time.perf_counter()
+    total_bytes = 0
+    for index in range(tasks):
+        kwargs = {'feature_filename': 'features/sample.feature',
+                  'feature_json_skeleton': FEATURE_JSON_SKELETON,
+                  'scenario_line': index}
+        if with_config:
+            kwargs['config'] = ConfigRun()
+        total_bytes += len(pickle.dumps((execute_task, kwargs)))
+    return time.perf_counter() - start_time, total_bytes
+
+
+def measure_submit(tasks, processes, with_config):
+    initargs = (None,) if with_config else (ConfigRun().snapshot(),)
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=_init_process,
+                             initargs=initargs) as process_pool:
+        start_time = time.perf_counter()
+        futures = []
+        for index in range(tasks):
+            kwargs = {'feature_filename': 'features/sample.feature',
+                      'feature_json_skeleton': FEATURE_JSON_SKELETON,
+                      'scenario_line': index}
+            if with_config:
+                kwargs['config'] = ConfigRun()
+            futures.append(process_pool.submit(execute_task, **kwargs))
+        submit_time = time.perf_counter() - start_time
+        wait(futures)
+        total_time = time.perf_counter() - start_time
+    return submit_time, total_time
+
+
+def _init_process(config_snapshot):
+    if config_snapshot is not None:
+        install_config_snapshot(config_snapshot)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=10000, help='Number of submitted tasks (scenarios)')
+    parser.add_argument('--processes', type=int, default=4, help='Number of parallel processes')
+    args = parser.parse_args()
+
+    ConfigRun().set_args(parse_arguments(['features', '--parallel-processes', str(args.processes)]))
+
+    print('Tasks: {}, parallel processes: {}\n'.format(args.tasks, args.processes))
+    print('{:<28}{:>14}{:>14}{:>14}{:>14}'.format('Approach', 'bytes/task', 'pickle (s)', 'submit (s)', 'total (s)'))
+    for label, with_config in (('ConfigRun per task', True), ('Snapshot via initializer', False)):
+        pickle_time, total_bytes = measure_pickling(args.tasks, with_config)
+        submit_time, total_time = measure_submit(args.tasks, args.processes, with_config)
+        print('{:<28}{:>14.0f}{:>14.3f}{:>14.3f}{:>14.3f}'.format(label,
+                                                                total_bytes / float(args.tasks),
+                                                                pickle_time,
+                                                                submit_time,
+                                                                total_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the feature discovery performed by BehaveX before running the first scenario.
+
+Generates synthetic test suites with the requested number of scenarios, and
+measures the time spent discovering and parsing them in the main process and
+by the parallel processes (optionally using a feature cache). The script
+exits with an error if the discovered scenarios are different or are
+returned in a different order.
+
+Usage:
+    python scripts/benchmark_discovery.py [--scenarios 1000 10000 50000] [--processes 4] [--tags @SMOKE]
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.arguments import parse_arguments
+from behavex.conf_mgr import ConfigRun, install_config_snapshot, set_env
+from behavex.execution_singleton import ExecutionSingleton
+from behavex.utils import explore_features, set_behave_tags
+
+SCENARIOS_PER_FEATURE = 10
+FEATURES_PER_FOLDER = 100
+
+
+def generate_suite(suite_path, total_scenarios):
+    """Generate feature files with SCENARIOS_PER_FEATURE scenarios each (one
+    out of 20 scenarios is tagged as @SMOKE)."""
+    total_features = max(1, total_scenarios // SCENARIOS_PER_FEATURE)
+    for feature_index in range(total_features):
+        folder = os.path.join(suite_path, 'folder_{:04d}'.format(feature_index // FEATURES_PER_FOLDER))
+        os.makedirs(folder, exist_ok=True)
+        lines = ['@FEATURE_{}'.format(feature_index), 'Feature: Feature {}'.format(feature_index), '']
+        for scenario_index in range(SCENARIOS_PER_FEATURE):
+            smoke_tag = ' @SMOKE' if (feature_index * SCENARIOS_PER_FEATURE + scenario_index) % 20 == 0 else ''
+            lines += ['  @SCENARIO_{}{}'.format(scenario_index, smoke_tag),
+                      '  Scenario: Scenario {}'.format(scenario_index),
+                      '    Given a precondition with "{}"'.format(scenario_index),
+                      '    When an action is performed',
+                      '    Then the result is verified',
+                      '']
+        with open(os.path.join(folder, 'feature_{:06d}.feature'.format(feature_index)), 'w') as feature_file:
+            feature_file.write('\n'.join(lines))
+
+
+def configure(suite_path, output_path, tags, feature_cache_dir=None):
+    # The configuration and path matchers are created again for each suite
+    ExecutionSingleton._instances.clear()
+    arguments = [suite_path, '-o', output_path]
+    if feature_cache_dir:
+        arguments += ['--feature-cache-dir', feature_cache_dir]
+    ConfigRun().set_args(parse_arguments(arguments))
+    os.environ['FEATURES_PATH'] = suite_path
+    os.makedirs(os.path.join(output_path, 'behave'), exist_ok=True)
+    set_env('output', output_path)
+    set_env('tags', tags or '')
+    set_env('behave_tags', '')
+    set_behave_tags()
+
+
+def measure_discovery(suite_path, processes):
+    process_pool = None
+    if processes > 1:
+        process_pool = ProcessPoolExecutor(max_workers=processes,
+                                           initializer=install_config_snapshot,
+                                           initargs=(ConfigRun().snapshot(),))
+    start_time = time.perf_counter()
+    gc.disable()
+    try:
+        scenarios = explore_features(suite_path, process_pool=process_pool, parallel_processes=processes)
+    finally:
+        gc.enable()
+    elapsed = time.perf_counter() - start_time
+    if process_pool:
+        process_pool.shutdown()
+    return elapsed, [(scenario.filename, scenario.line) for scenario in scenarios]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', type=int, nargs='+', default=[1000, 10000, 50000],
+                        help='Number of scenarios of each generated test suite')
+    parser.add_argument('--processes', type=int, default=4, help='Number of parallel processes')
+    parser.add_argument('--tags', default='', help='Tags filter (BehaveX syntax), e.g. @SMOKE')
+    args = parser.parse_args()
+
+    work_path = tempfile.mkdtemp(prefix='behavex_discovery_')
+    try:
+        print('Parallel processes: {}, tags: {}\n'.format(args.processes, args.tags or '-'))
+        print('{:>10}{:>10}{:>14}{:>14}{:>16}{:>16}'.format('scenarios', 'selected', 'serial (s)', 'parallel (s)',
+                                                            'cold cache (s)', 'warm cache (s)'))
+        for total_scenarios in args.scenarios:
+            suite_path = os.path.join(work_path, 'suite_{}'.format(total_scenarios))
+            output_path = os.path.join(work_path, 'output_{}'.format(total_scenarios))
+            cache_path = os.path.join(work_path, 'cache_{}'.format(total_scenarios))
+            generate_suite(suite_path, total_scenarios)
+            configure(suite_path, output_path, args.tags)
+            serial_time, serial_scenarios = measure_discovery(suite_path, 1)
+            parallel_time, parallel_scenarios = measure_discovery(suite_path, args.processes)
+            configure(suite_path, output_path, args.tags, feature_cache_dir=cache_path)
+            cold_time, cold_scenarios = measure_discovery(suite_path, args.processes)
+            warm_time, warm_scenarios = measure_discovery(suite_path, args.processes)
+            if not serial_scenarios == parallel_scenarios == cold_scenarios == warm_scenarios:
+                sys.exit('Discovered scenarios differ between the measured approaches')
+            print('{:>10}{:>10}{:>14.2f}{:>14.2f}{:>16.2f}{:>16.2f}'.format(total_scenarios,
+                                                                            len(serial_scenarios),
+                                                                            serial_time,
+                                                                            parallel_time,
+                                                                            cold_time,
+                                                                            warm_time))
+    finally:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
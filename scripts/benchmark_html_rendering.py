@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generation of the HTML report at the end of the execution.
+
+Generates report.html from a synthetic JSON report, rendering the scenarios
+of the features in the main process and in parallel processes (the feature
+fragments are rendered by a process pool and stitched together in order).
+The script exits with an error if the reports are not byte-for-byte identical.
+
+Usage:
+    python scripts/benchmark_html_rendering.py [--features 200 1000] [--processes 1 2 4] [--scenarios-per-feature 10]
+"""
+
+import argparse
+import copy
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.arguments import parse_arguments
+from behavex.conf_mgr import ConfigRun, set_env
+from behavex.execution_singleton import ExecutionSingleton
+from behavex.global_vars import global_vars
+from behavex.outputs import report_html
+from behavex.utils import set_behave_tags
+
+STEPS_PER_SCENARIO = 8
+
+
+def build_report(total_features, scenarios_per_feature, seed=1):
+    """Build a JSON report with the given number of features."""
+    random.seed(seed)
+    features = []
+    steps_definition = {}
+    start = int(time.time() * 1000)
+    for feature_index in range(total_features):
+        filename = 'features/generated/feature_{:05d}.feature'.format(feature_index)
+        scenarios = []
+        for scenario_index in range(scenarios_per_feature):
+            status = random.choice(['passed'] * 8 + ['failed', 'skipped'])
+            steps = []
+            for step_index in range(STEPS_PER_SCENARIO):
+                step_hash = random.randint(0, 500)
+                steps_definition[str(step_hash)] = 'step definition number {}'.format(step_hash)
+                failed = status == 'failed' and step_index == STEPS_PER_SCENARIO - 1
+                steps.append({'name': 'step number {} with a "quoted" value'.format(step_index), 'hash': step_hash,
+                              'status': 'failed' if failed else status, 'duration': random.random(),
+                              'step_type': 'given', 'text': 'None', 'line': 4 + step_index, 'index': step_index,
+                              'table': {'column 1': ['value 1', 'value 2'], 'column 2': ['value 3', 'value 4']},
+                              'error_msg': ['Assertion failed: expected <1> but was <2>'] if failed else [],
+                              'error_lines': ['File "steps.py", line 10, in step'] if failed else []})
+            duration = random.random() * 10
+            scenarios.append({'name': 'Scenario {}'.format(scenario_index), 'line': 3 + scenario_index * 12,
+                              'filename': filename, 'status': status, 'duration': duration,
+                              'start': start, 'stop': start + int(duration * 1000), 'worker_id': '0',
+                              'tags': ['GENERATED', 'SCENARIO_{}'.format(scenario_index)],
+                              'identifier_hash': '{}-{}'.format(feature_index, scenario_index),
+                              'id_hash': '{}{}'.format(feature_index, scenario_index),
+                              'feature': 'Feature {}'.format(feature_index), 'id_feature': feature_index,
+                              'background': {'duration': 0.0, 'steps': []}, 'error_background': False,
+                              'error_msg': [], 'error_lines': [], 'error_step': None, 'steps': steps})
+        features.append({'name': 'Feature {}'.format(feature_index), 'filename': filename, 'id': feature_index,
+                         'status': 'failed' if any(s['status'] == 'failed' for s in scenarios) else 'passed',
+                         'duration': sum(s['duration'] for s in scenarios), 'background': {},
+                         'scenarios': scenarios})
+    return {'environment': [], 'features': features, 'steps_definition': steps_definition}
+
+
+def configure(output_path, processes):
+    ExecutionSingleton._instances.clear()
+    ConfigRun().set_args(parse_arguments(['-o', output_path, '--parallel-processes', str(processes)]))
+    for folder in ('behave', os.path.join('outputs', 'bootstrap', 'css'), os.path.join('outputs', 'logs')):
+        os.makedirs(os.path.join(output_path, folder), exist_ok=True)
+    set_env('output', output_path)
+    set_env('logs', os.path.join(output_path, 'outputs', 'logs'))
+    set_env('tags', '')
+    set_env('behave_tags', '')
+    set_behave_tags()
+
+
+def measure(report, output_path, processes):
+    configure(output_path, processes)
+    start_time = time.perf_counter()
+    report_html.generate_report(copy.deepcopy(report))
+    elapsed_time = time.perf_counter() - start_time
+    with open(os.path.join(output_path, 'report.html'), 'rb') as report_file:
+        return elapsed_time, report_file.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--features', type=int, nargs='+', default=[200, 1000], help='Number of features')
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4], help='Number of rendering processes')
+    parser.add_argument('--scenarios-per-feature', type=int, default=10, help='Number of scenarios per feature')
+    args = parser.parse_args()
+
+    global_vars.execution_start_time = time.time()
+    global_vars.execution_end_time = time.time()
+    output_path = tempfile.mkdtemp(prefix='behavex_benchmark_')
+    print('CPUs: {}\n'.format(os.cpu_count()))
+    print('{:<12}{:>12}{:>14}{:>12}{:>10}'.format('Features', 'processes', 'report (MB)', 'time (s)', 'speedup'))
+    try:
+        for total_features in args.features:
+            report = build_report(total_features, args.scenarios_per_feature)
+            serial_time, serial_html = measure(report, output_path, 1)
+            for processes in args.processes:
+                elapsed_time, html = (serial_time, serial_html) if processes == 1 \
+                    else measure(report, output_path, processes)
+                if html != serial_html:
+                    sys.exit('The report rendered by {} processes differs from the serial one'.format(processes))
+                print('{:<12}{:>12}{:>14.1f}{:>12.3f}{:>9.1f}x'.format(total_features, processes,
+                                                                       len(html) / (1024 * 1024), elapsed_time,
+                                                                       serial_time / elapsed_time))
+    finally:
+        shutil.rmtree(output_path, ignore_errors=True)
+    print('\nThe reports are byte-for-byte identical for all the numbers of processes.')
+
+
+if __name__ == '__main__':
+    main()
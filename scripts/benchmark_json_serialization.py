@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON serialization of the execution results.
+
+Serializes synthetic per-scenario reports the way BehaveX does from the
+parallel processes to the final report.json, comparing the original pipeline
+(reports converted to JSON strings in the parallel processes and parsed by
+the main process, report.json written with the json module and read again
+twice) with the current one (reports returned as objects, appended to the
+results journal and read back from it, and report.json written once), for
+every JSON library installed (json, orjson and msgspec).
+
+Usage:
+    python scripts/benchmark_json_serialization.py [--size-mb 50] [--scenarios-per-feature 10]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.serializer import SERIALIZERS, create_serializer
+
+STEPS_PER_SCENARIO = 8
+# Approximate size of the serialized report of each scenario
+SCENARIO_REPORT_SIZE = 4400
+
+
+def build_reports(size_mb, scenarios_per_feature, seed=1):
+    """Build one report per scenario, as returned by the parallel processes."""
+    random.seed(seed)
+    total_scenarios = max(1, size_mb * 1024 * 1024 // SCENARIO_REPORT_SIZE)
+    reports = []
+    for index in range(total_scenarios):
+        feature_index = index // scenarios_per_feature
+        filename = 'features/generated/feature_{:05d}.feature'.format(feature_index)
+        status = random.choice(['passed'] * 8 + ['failed', 'skipped'])
+        steps = [{'name': 'step number {} of scenario {} with a "quoted" value'.format(step, index),
+                  'hash': random.randint(0, 10 ** 9), 'status': 'passed', 'duration': random.random(),
+                  'step_type': 'given', 'keyword': 'Given', 'table': {'col1': ['á', 'b'], 'col2': ['1', '2']},
+                  'text': 'line of text\n' * 10, 'error_msg': [], 'error_lines': []}
+                 for step in range(STEPS_PER_SCENARIO)]
+        scenario = {'name': 'Scenario {}'.format(index), 'line': 3 + (index % scenarios_per_feature) * 5,
+                    'filename': filename, 'status': status, 'duration': random.random(),
+                    'tags': ['GENERATED', 'SCENARIO_{}'.format(index)], 'identifier_hash': str(index),
+                    'feature': 'Feature {}'.format(feature_index), 'steps': steps}
+        feature = {'name': 'Feature {}'.format(feature_index), 'filename': filename, 'status': status,
+                   'duration': scenario['duration'], 'tags': [], 'scenarios': [scenario]}
+        reports.append({'environment': [],
+                        'steps_definition': {str(step['hash']): step['name'] for step in steps},
+                        'features': [feature]})
+    return reports
+
+
+def merge(reports):
+    """Merge the reports (the cost is the same for both pipelines)."""
+    return {'environment': [], 'features': [report['features'][0] for report in reports],
+            'steps_definition': {key: value for report in reports for key, value in report['steps_definition'].items()}}
+
+
+def original_pipeline(reports, output_folder):
+    """Reports serialized as JSON strings by the parallel processes, and report.json read twice."""
+    results = []
+    for report in reports:
+        # The JSON string was pickled by the process pool, and parsed by the main process
+        results.append(json.loads(pickle.loads(pickle.dumps(json.dumps(report)))))
+    report_path = os.path.join(output_folder, 'report.json')
+    with open(report_path, 'w') as report_file:
+        report_file.write(json.dumps(merge(results)))
+    # The report was read to generate the outputs, and again to remove the temporary files
+    for _ in range(2):
+        with open(report_path, 'r') as report_file:
+            merged_json = json.load(report_file)
+    return merged_json
+
+
+def journal_pipeline(serializer, reports, output_folder):
+    """Reports returned as objects by the parallel processes, and added to the results journal."""
+    journal_path = os.path.join(output_folder, 'results.ndjson')
+    with open(journal_path, 'wb') as journal_file:
+        for report in reports:
+            report = pickle.loads(pickle.dumps(report))
+            journal_file.write(serializer.dumps_bytes({'record': 'result', 'report': report}) + b'\n')
+    with open(journal_path, 'rb') as journal_file:
+        results = [serializer.loads(line)['report'] for line in journal_file]
+    merged_json = merge(results)
+    with open(os.path.join(output_folder, 'report.json'), 'wb') as report_file:
+        report_file.write(serializer.dumps_bytes(merged_json))
+    return merged_json
+
+
+def measure(function, *args):
+    start_time = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start_time, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=50, help='Approximate size of report.json, in MB')
+    parser.add_argument('--scenarios-per-feature', type=int, default=10, help='Number of scenarios per feature file')
+    args = parser.parse_args()
+
+    reports = build_reports(args.size_mb, args.scenarios_per_feature)
+    output_folder = tempfile.mkdtemp(prefix='behavex_benchmark_')
+    try:
+        original_time, original_json = measure(original_pipeline, reports, output_folder)
+        report_size = os.path.getsize(os.path.join(output_folder, 'report.json')) / (1024 * 1024)
+        print('{} scenario reports, report.json of {:.1f} MB\n'.format(len(reports), report_size))
+        print('{:<28}{:>12}{:>10}'.format('Pipeline', 'time (s)', 'speedup'))
+        print('{:<28}{:>12.3f}{:>10}'.format('original (json)', original_time, '-'))
+        for serializer_class in SERIALIZERS:
+            serializer = create_serializer(serializer_class.name)
+            if serializer.name != serializer_class.name:
+                print('{:<28}{:>12}'.format('journal ({})'.format(serializer_class.name), 'not installed'))
+                continue
+            journal_time, merged_json = measure(journal_pipeline, serializer, reports, output_folder)
+            if merged_json != original_json:
+                sys.exit('The report generated using {} differs from the original one'.format(serializer.name))
+            print('{:<28}{:>12.3f}{:>9.1f}x'.format('journal ({})'.format(serializer.name), journal_time,
+                                                    original_time / journal_time))
+    finally:
+        shutil.rmtree(output_folder, ignore_errors=True)
+    print('\nThe reports are identical for all the pipelines.')
+
+
+if __name__ == '__main__':
+    main()
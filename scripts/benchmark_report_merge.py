@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the merge of the JSON reports of the scenarios executed in parallel.
+
+Merges synthetic per-scenario reports the same way BehaveX does at the end of
+parallel executions by scenario (join_scenario_reports + join_feature_reports),
+comparing the original implementation (list concatenation with sum() and step
+definitions rebuilt for every report) with the single-pass accumulator.
+
+Usage:
+    python scripts/benchmark_report_merge.py [--scenarios 1000 10000 50000] [--steps 500] [--scenarios-per-feature 10]
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import sys
+import time
+from functools import reduce
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The include filters are read from the environment when the reports are merged
+os.environ.setdefault('FEATURES_PATH', 'features')
+
+from behavex.utils import (IncludeNameMatch, IncludePathsMatch, MatchInclude,
+                           join_feature_reports, join_scenario_reports)
+
+STEPS_PER_SCENARIO = 6
+
+
+def legacy_join_feature_reports(json_reports):
+    """Original implementation of join_feature_reports."""
+    if type(json_reports) is list:
+        if len(json_reports) == 1:
+            merged_json = json_reports[0]
+        else:
+            merged_json = {}
+            merged_json['environment'] = sum(
+                (json_['environment'] for json_ in json_reports if isinstance(json_['environment'], dict)), [])
+            merged_json['steps_definition'] = legacy_join_step_definitions(json_reports)
+            merged_json['features'] = sum((json_['features'] for json_ in json_reports), [])
+    else:
+        merged_json = json_reports
+    if merged_json['features'] and (IncludeNameMatch().bool() or IncludePathsMatch().bool() or MatchInclude().bool()):
+        delete = []
+        for index, feature in enumerate(merged_json['features'][:]):
+            scenarios = [
+                scenario
+                for scenario in feature['scenarios']
+                if IncludeNameMatch()(scenario['name'])
+                and MatchInclude()(feature['filename'])
+                and IncludePathsMatch()(scenario['filename'], scenario['line'])
+            ]
+            if not scenarios:
+                delete.append(index - len(delete))
+            else:
+                merged_json['features'][index]['scenarios'] = scenarios
+        if delete:
+            for index in delete:
+                del merged_json['features'][index]
+    return merged_json
+
+
+def legacy_join_step_definitions(json_reports):
+    """Original implementation of join_step_definitions."""
+    def update(x, y):
+        if isinstance(x, dict) and isinstance(y, dict):
+            return dict(list(x.items()) + list(y.items()))
+        elif isinstance(x, dict) and not isinstance(y, dict):
+            return dict(list(x.items()))
+        elif isinstance(y, dict) and not isinstance(x, dict):
+            return dict(list(y.items()))
+        else:
+            return {}
+
+    list_definitions = [_json['steps_definition'] for _json in json_reports]
+    return {} if not list_definitions else reduce(update, list_definitions)
+
+
+def build_reports(total_scenarios, total_steps, scenarios_per_feature, seed=1):
+    """Build one report per scenario, as returned by the parallel processes."""
+    random.seed(seed)
+    step_names = ['step definition number {}'.format(index) for index in range(total_steps)]
+    reports = []
+    for index in range(total_scenarios):
+        feature_index = index // scenarios_per_feature
+        filename = os.path.join('features', 'generated', 'feature_{:05d}.feature'.format(feature_index))
+        steps = random.sample(range(total_steps), min(STEPS_PER_SCENARIO, total_steps))
+        scenario = {'name': 'Scenario {}'.format(index),
+                    'line': 3 + (index % scenarios_per_feature) * 5,
+                    'filename': filename,
+                    'status': random.choice(['passed'] * 8 + ['failed', 'skipped']),
+                    'duration': random.random(),
+                    'tags': ['GENERATED'],
+                    'steps': [{'name': step_names[step], 'hash': step, 'status': 'passed', 'duration': 0.01}
+                              for step in steps]}
+        feature = {'name': 'Feature {}'.format(feature_index), 'filename': filename, 'status': scenario['status'],
+                   'duration': scenario['duration'], 'scenarios': [scenario]}
+        reports.append({'environment': [],
+                        'steps_definition': {str(step): step_names[step] for step in steps},
+                        'features': [feature]})
+    return reports
+
+
+def measure(join_features, reports):
+    start_time = time.perf_counter()
+    merged_json = join_features(join_scenario_reports(reports))
+    return time.perf_counter() - start_time, merged_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', type=int, nargs='+', default=[1000, 10000, 50000],
+                        help='Number of merged scenario reports')
+    parser.add_argument('--steps', type=int, default=500, help='Number of different step definitions')
+    parser.add_argument('--scenarios-per-feature', type=int, default=10, help='Number of scenarios per feature file')
+    args = parser.parse_args()
+
+    print('{:<12}{:>16}{:>16}{:>10}'.format('Scenarios', 'original (s)', 'single pass (s)', 'speedup'))
+    for total_scenarios in args.scenarios:
+        reports = build_reports(total_scenarios, args.steps, args.scenarios_per_feature)
+        # The reports are modified while merging them, so each approach merges its own copy
+        legacy_time, legacy_json = measure(legacy_join_feature_reports, copy.deepcopy(reports))
+        merge_time, merged_json = measure(join_feature_reports, reports)
+        if json.dumps(legacy_json) != json.dumps(merged_json):
+            sys.exit('The merged report differs from the one generated by the original implementation')
+        print('{:<12}{:>16.3f}{:>16.3f}{:>9.1f}x'.format(total_scenarios, legacy_time, merge_time,
+                                                          legacy_time / merge_time))
+    print('\nThe merged reports are identical for both implementations.')
+
+
+if __name__ == '__main__':
+    main()
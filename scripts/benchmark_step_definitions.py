@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the summary of the step definitions shown in the HTML report.
+
+Compares the original implementation of gather_steps_with_definition (all the
+executed steps scanned for each step definition) with the current one, which
+indexes the steps by the hash of their definition and summarizes them in a
+single pass. The script exits with an error if both implementations return
+different summaries (the duration percentiles are only computed by the
+current implementation).
+
+Usage:
+    python scripts/benchmark_step_definitions.py [--steps 50000 200000] [--definitions 1500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.outputs.report_utils import gather_steps_with_definition
+
+STEPS_PER_SCENARIO = 8
+SCENARIOS_PER_FEATURE = 10
+PERCENTILE_KEYS = ('p50', 'p95', 'max')
+
+
+def original_gather_steps_with_definition(features, steps_definition):
+    """Original implementation of gather_steps_with_definition."""
+    all_steps = []
+    for feature in features:
+        for scenario in feature['scenarios']:
+            all_steps += scenario['steps']
+            if scenario['background']:
+                all_steps += scenario['background']['steps']
+    result = {}
+    if steps_definition:
+        for id_hash, definition in steps_definition.items():
+            result[definition] = {'steps': []}
+            for step in all_steps:
+                if step['hash'] == int(id_hash):
+                    result[definition]['steps'].append(step)
+        for definition, value in result.items():
+            result[definition] = original_get_summary_definition(value['steps'])
+    return result
+
+
+def original_get_summary_definition(steps):
+    """Original implementation of get_summary_definition (without the duration percentiles)."""
+    result = {'steps': {}, 'status': []}
+    for step in steps:
+        result['status'].append(step['status'])
+        execution = 1 if step['status'] in ('failed', 'passed', 'error') else 0
+        if step['name'] in result['steps']:
+            result['steps'][step['name']]['executions'] += execution
+            result['steps'][step['name']]['time'] += step['duration']
+            result['steps'][step['name']]['status'].append(step['status'])
+            result['steps'][step['name']]['appearances'] += 1
+        else:
+            result['steps'][step['name']] = {
+                'executions': execution,
+                'time': step['duration'],
+                'status': [step['status']],
+                'appearances': 1,
+            }
+    total_time = 0.0
+    executions = 0
+    appearances = 0
+    any_status_failed = False
+    any_status_passed = False
+    for step_instanced in result['steps'].values():
+        total_time += step_instanced['time']
+        executions += step_instanced['executions']
+        appearances += step_instanced['appearances']
+        if 'passed' in step_instanced['status']:
+            any_status_passed = True
+        elif 'failed' in step_instanced['status'] or 'error' in step_instanced['status']:
+            any_status_failed = True
+    if any_status_failed:
+        result['overall_status'] = 'failed'
+    elif any_status_passed:
+        result['overall_status'] = 'passed'
+    else:
+        result['overall_status'] = 'skipped'
+    if executions > 0:
+        avg_time = total_time / executions
+    else:
+        avg_time = 0
+    result['avg'] = avg_time
+    result['time'] = total_time
+    result['executions'] = executions
+    result['appearances'] = appearances
+    return result
+
+
+def build_features(total_steps, total_definitions, seed=1):
+    """Build the features of a JSON report with the given number of executed steps."""
+    random.seed(seed)
+    steps_definition = {str(1000 + index): 'step definition {}'.format(index) for index in range(total_definitions)}
+    total_scenarios = max(1, total_steps // STEPS_PER_SCENARIO)
+    features = []
+    for scenario_index in range(total_scenarios):
+        if scenario_index % SCENARIOS_PER_FEATURE == 0:
+            features.append({'scenarios': []})
+        steps = []
+        for step_index in range(STEPS_PER_SCENARIO):
+            definition_index = random.randint(0, total_definitions - 1)
+            steps.append({'name': 'step {} with value {}'.format(definition_index, random.randint(0, 3)),
+                          'hash': 1000 + definition_index, 'duration': random.random(),
+                          'status': random.choice(['passed'] * 8 + ['failed', 'skipped', 'untested'])})
+        features[-1]['scenarios'].append({'steps': steps, 'background': {}})
+    return features, steps_definition
+
+
+def measure(function, features, steps_definition):
+    start_time = time.perf_counter()
+    result = function(features, steps_definition)
+    return time.perf_counter() - start_time, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--steps', type=int, nargs='+', default=[50000, 200000], help='Number of executed steps')
+    parser.add_argument('--definitions', type=int, default=1500, help='Number of step definitions')
+    args = parser.parse_args()
+
+    print('{:<12}{:>14}{:>16}{:>16}{:>10}'.format('Steps', 'definitions', 'original (s)', 'current (s)', 'speedup'))
+    for total_steps in args.steps:
+        features, steps_definition = build_features(total_steps, args.definitions)
+        original_time, original_result = measure(original_gather_steps_with_definition, features, steps_definition)
+        current_time, current_result = measure(gather_steps_with_definition, features, steps_definition)
+        for summary in current_result.values():
+            for key in PERCENTILE_KEYS:
+                summary.pop(key)
+        if current_result != original_result or list(current_result) != list(original_result):
+            sys.exit('The summaries of both implementations differ')
+        print('{:<12}{:>14}{:>16.3f}{:>16.3f}{:>9.0f}x'.format(total_steps, args.definitions, original_time,
+                                                               current_time, original_time / current_time))
+    print('\nThe summaries of both implementations are identical.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark the evaluation of the tags filter (match_for_execution).
+
+Compares the original evaluation (regex substitutions and eval() for every
+call) with the compiled predicate, which parses the filter once and memoizes
+the results by set of scenario tags.
+
+Usage:
+    python scripts/benchmark_tag_matching.py [--scenarios 100000] [--tags "@SMOKE,@REGRESSION;~@SKIP"]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.outputs.report_utils import (CompiledTagsFilter,
+                                          _evaluate_tags_filter)
+
+SCENARIO_TAGS = ['SMOKE', 'REGRESSION', 'SKIP', 'MANUAL', 'SLOW', 'API', 'UI', 'JIRA-1234', 'ORDER_001']
+
+
+def build_tags_filter(tags_argument):
+    """Build the tags filter the same way BehaveX stores it in behave.tags."""
+    groups = []
+    for tag_param in tags_argument.split(';'):
+        groups.append('( ' + ' or '.join(tag.strip() for tag in tag_param.split(',')) + ' )')
+    return ' and '.join(groups).replace('~', 'not ')
+
+
+def build_scenarios(total, seed=1):
+    random.seed(seed)
+    return [random.sample(SCENARIO_TAGS, random.randint(0, 4)) for _ in range(total)]
+
+
+def measure(predicate, scenarios):
+    start_time = time.perf_counter()
+    results = [predicate(tags) for tags in scenarios]
+    return time.perf_counter() - start_time, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', type=int, default=100000, help='Number of evaluated scenarios')
+    parser.add_argument('--tags', default='@SMOKE,@REGRESSION;~@SKIP;~@MANUAL', help='Tags argument (BehaveX syntax)')
+    args = parser.parse_args()
+
+    tags_filter = build_tags_filter(args.tags)
+    scenarios = build_scenarios(args.scenarios)
+    print('Filter: {}\nScenarios: {}\n'.format(tags_filter, args.scenarios))
+
+    legacy_time, legacy_results = measure(lambda tags: bool(_evaluate_tags_filter(tags_filter, tags)), scenarios)
+    compile_start = time.perf_counter()
+    compiled_filter = CompiledTagsFilter(tags_filter)
+    compile_time = time.perf_counter() - compile_start
+    compiled_time, compiled_results = measure(compiled_filter, scenarios)
+    if legacy_results != compiled_results:
+        sys.exit('Results of the compiled predicate differ from the original evaluation')
+
+    print('{:<24}{:>12}{:>16}'.format('Approach', 'total (s)', 'per call (us)'))
+    for label, elapsed in (('Original (eval)', legacy_time), ('Compiled + memoized', compiled_time + compile_time)):
+        print('{:<24}{:>12.3f}{:>16.2f}'.format(label, elapsed, elapsed * 1e6 / args.scenarios))
+    print('\nSpeedup: {:.1f}x (same results for all scenarios)'.format(legacy_time / (compiled_time + compile_time)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the loading of the report templates in new processes.
+
+Each process rendering reports (e.g. the parallel processes exporting the
+JUnit reports of the features) creates its own template environment. The
+script starts the requested number of processes that load the templates of
+the HTML and JUnit reports, without the bytecode cache (templates compiled by
+every process), with an empty cache and with a populated one (templates
+loaded from the cache).
+
+Usage:
+    python scripts/benchmark_template_cache.py [--processes 20]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess  # nosec
+import sys
+import tempfile
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.global_vars import global_vars
+from behavex.outputs.jinja_mgr import TEMPLATES_CACHE_ENV_VARIABLE
+
+TEMPLATES = ['main', 'xml', 'xml_json']
+
+LOAD_TEMPLATES = '''
+import sys, time
+sys.path.insert(0, {root!r})
+from behavex.global_vars import global_vars
+from behavex.outputs.jinja_mgr import TemplateHandler
+start_time = time.perf_counter()
+template_handler = TemplateHandler(global_vars.jinja_templates_path)
+for template in {templates!r}:
+    template_handler.get_template(global_vars.jinja_templates[template])
+print(time.perf_counter() - start_time)
+'''
+
+
+def load_templates(processes, cache_dir):
+    """Load the templates in new processes, returning the time spent by each one of them."""
+    code = LOAD_TEMPLATES.format(root=os.path.dirname(global_vars.execution_path), templates=TEMPLATES)
+    env = dict(os.environ, **{TEMPLATES_CACHE_ENV_VARIABLE: cache_dir})
+    return [float(subprocess.check_output([sys.executable, '-c', code], env=env))  # nosec
+            for _ in range(processes)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=20, help='Number of processes loading the templates')
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix='behavex_benchmark_')
+    try:
+        print('{:<24}{:>12}{:>16}{:>10}'.format('Bytecode cache', 'total (s)', 'per process (s)', 'speedup'))
+        results = [('disabled', load_templates(args.processes, 'none')),
+                   ('empty', load_templates(1, cache_dir)),
+                   ('populated', load_templates(args.processes, cache_dir))]
+        disabled_time = sum(results[0][1]) / len(results[0][1])
+        for name, times in results:
+            per_process = sum(times) / len(times)
+            print('{:<24}{:>12.3f}{:>16.4f}{:>9.1f}x'.format(name, sum(times), per_process,
+                                                              disabled_time / per_process))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
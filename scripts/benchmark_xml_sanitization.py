@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cleaning of invalid XML characters (the CIXC template filter).
+
+Compares the original implementation (clean_char called for every character,
+building the list of illegal unicode ranges and the regular expressions for
+each one of them) with the current one, which cleans the whole string with
+a precompiled regular expression. The script exits with an error if both
+implementations return different results.
+
+Usage:
+    python scripts/benchmark_xml_sanitization.py [--size-mb 1 5] [--invalid-ratio 0.001]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+# Add the parent directory to the path so we can import behavex
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from behavex.outputs.jinja_mgr import clean_invalid_xml_chars
+
+LOG_LINE = 'File "/project/features/steps/steps.py", line {}, in step_impl: assert <{}> == <{}> "done" ñ €\n'
+INVALID_CHARS = ['\x00', '\x03', '\x0c', '\x1b', '\x1f', '\x7f', '\x85', '﷐', '￾', '\U0001fffe',
+                 '“', '”', '\x1b[31m']
+
+
+def original_clean_invalid_xml_chars(xml_content):
+    """Original implementation of clean_invalid_xml_chars (per character)."""
+    if isinstance(xml_content, bytes):
+        xml_content = xml_content.decode()
+    return ''.join([original_clean_char(c) for c in xml_content])
+
+
+def original_invalid_xml_remove(c):
+    illegal_unichrs = [(0x00, 0x08), (0x0B, 0x0C), (0x0E, 0x1F), (0x7F, 0x84), (0x86, 0x9F), (0xFDD0, 0xFDDF),
+                       (0xFFFE, 0xFFFF)]
+    if sys.maxunicode >= 0x10000:
+        illegal_unichrs.extend([(plane + 0xFFFE, plane + 0xFFFF) for plane in range(0x10000, 0x110000, 0x10000)])
+    illegal_ranges = ['%s-%s' % (chr(low), chr(high)) for (low, high) in illegal_unichrs if low < sys.maxunicode]
+    illegal_xml_re = re.compile(u'[%s]' % u''.join(illegal_ranges))
+    if illegal_xml_re.search(c) is not None:
+        return ' '
+    else:
+        return c
+
+
+def original_clean_char(char):
+    char = str(char)
+    char = re.sub('\x1b[^m]*m', '', char)
+    char = original_invalid_xml_remove(char)
+    replacements = [(u'“', '"'), (u'”', '"'), (u'\u001B', ' '), (u'\u0019', ' '), (u'\u0016', ' '),
+                    (u'\u001C', ' '), (u'\u0003', ' '), (u'\u000C', ' ')]
+    for rep, new_char in replacements:
+        if char == rep:
+            return new_char
+    return char
+
+
+def build_log(size_mb, invalid_ratio, seed=1):
+    """Build a log of (approximately) the given size, with a ratio of invalid characters."""
+    random.seed(seed)
+    lines = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        line = LOG_LINE.format(len(lines), random.randint(0, 1000), random.randint(0, 1000))
+        if random.random() < invalid_ratio * len(line):
+            position = random.randint(0, len(line))
+            line = line[:position] + random.choice(INVALID_CHARS) + line[position:]
+        lines.append(line)
+        size += len(line)
+    return ''.join(lines)
+
+
+def measure(function, log):
+    start_time = time.perf_counter()
+    result = function(log)
+    return time.perf_counter() - start_time, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, nargs='+', default=[1, 5], help='Size of the logs, in MB')
+    parser.add_argument('--invalid-ratio', type=float, default=0.001, help='Ratio of invalid characters in the logs')
+    args = parser.parse_args()
+
+    print('{:<12}{:>16}{:>16}{:>10}'.format('Log (MB)', 'original (s)', 'current (s)', 'speedup'))
+    for size_mb in args.size_mb:
+        log = build_log(size_mb, args.invalid_ratio)
+        original_time, original_result = measure(original_clean_invalid_xml_chars, log)
+        current_time, current_result = measure(clean_invalid_xml_chars, log)
+        if current_result != original_result:
+            sys.exit('The logs cleaned by both implementations differ')
+        print('{:<12}{:>16.3f}{:>16.4f}{:>9.0f}x'.format(size_mb, original_time, current_time,
+                                                         original_time / current_time))
+    print('\nThe logs cleaned by both implementations are identical.')
+
+
+if __name__ == '__main__':
+    main()
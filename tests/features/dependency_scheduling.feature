@@ -0,0 +1,47 @@
+Feature: Dependency Scheduling
+
+  @DEPENDENCY_SCHEDULING
+  Scenario: Execute each scenario as soon as the scenarios it depends on were executed
+    Given I have installed behavex
+    When I run the behavex command with dependent tests using "4" parallel processes and parallel scheme set as "scenario"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                   |
+    | Scheduling 8 scenarios by their dependencies                  |
+    | 5 scenarios passed, 1 failed, 0 skipped, 2 untested           |
+    And I should not see exception messages in the output
+    And I should see the HTML report was generated and contains "8" scenarios
+    And I should see the "Use the account" test started after the "Create the account" test finished
+    And I should see the "Scenario after the ordered ones" test started after the "First ordered scenario" test finished
+    And I should see the "Independent scenario" test started before the "Create the account" test finished
+    And I should see the following scenarios reported as untested
+    | scenario_name                                                 |
+    | Sell an item                                                  |
+    | Refund the sale                                               |
+
+  @DEPENDENCY_SCHEDULING
+  Scenario: Report the features depending on failing features as untested
+    Given I have installed behavex
+    When I run the behavex command with dependent tests using "4" parallel processes and parallel scheme set as "feature"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                   |
+    | Scheduling 3 features by their dependencies                   |
+    | 4 scenarios passed, 1 failed, 0 skipped, 3 untested           |
+    And I should not see exception messages in the output
+    And I should see the HTML report was generated and contains "8" scenarios
+    And I should see the following scenarios reported as untested
+    | scenario_name                                                 |
+    | Use the account                                               |
+    | Sell an item                                                  |
+    | Refund the sale                                               |
+
+  @DEPENDENCY_SCHEDULING
+  Scenario: Execute the scenarios with the same order at the same time with strict ordering
+    Given I have installed behavex
+    When I run the behavex command with dependent tests using "4" parallel processes and parallel scheme set as "scenario" and strict execution ordering
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                   |
+    | waiting for the tests with a lower order                      |
+    | 5 scenarios passed, 1 failed, 0 skipped, 2 untested           |
+    And I should not see exception messages in the output
+    And I should see the "Independent scenario" test started after the "First ordered scenario" test finished
+    And I should see the "Create the account" test started before the "Independent scenario" test finished
@@ -0,0 +1,13 @@
+Feature: Dependent Tests
+
+  @DEPENDS_ON_CREATE_ACCOUNT
+  Scenario: Use the account
+    Given a step that takes "0.3" seconds
+
+  @DEPENDS_ON_CREATE_INVENTORY @SELL_ITEM
+  Scenario: Sell an item
+    Given a step that takes "0.3" seconds
+
+  @DEPENDS_ON_SELL_ITEM
+  Scenario: Refund the sale
+    Given a step that takes "0.3" seconds
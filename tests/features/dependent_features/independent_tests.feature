@@ -0,0 +1,12 @@
+Feature: Independent Tests
+
+  Scenario: Independent scenario
+    Given a step that takes "0.3" seconds
+
+  @ORDER_001
+  Scenario: First ordered scenario
+    Given a step that takes "0.5" seconds
+
+  @AFTER_ORDER_1
+  Scenario: Scenario after the ordered ones
+    Given a step that takes "0.3" seconds
@@ -0,0 +1,9 @@
+Feature: Setup Tests
+
+  @CREATE_ACCOUNT
+  Scenario: Create the account
+    Given a step that takes "1" seconds
+
+  @CREATE_INVENTORY
+  Scenario: Create the inventory
+    Given a step that fails
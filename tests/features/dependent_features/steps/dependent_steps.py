@@ -0,0 +1,18 @@
+import time
+
+from behave import given
+
+
+@given('a step that takes "{seconds}" seconds')
+def given_step_taking_seconds(context, seconds):
+    start_time = time.time()
+    time.sleep(float(seconds))
+    executions_log = context.config.userdata.get('executions_log', '')
+    if executions_log:
+        with open(executions_log, 'a') as executions_log_file:
+            executions_log_file.write('{}|{}|{}\n'.format(context.scenario.name, start_time, time.time()))
+
+
+@given('a step that fails')
+def given_step_that_fails(context):
+    assert False, 'This step fails on purpose'
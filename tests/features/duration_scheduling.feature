@@ -0,0 +1,26 @@
+Feature: Duration Based Scheduling
+
+  @DURATION_SCHEDULING
+  Scenario Outline: Schedule the longest tests first by <parallel_scheme> using durations from a previous execution
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "<parallel_scheme>"
+    And I run the behavex command again scheduling by the durations of the previous execution with parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs
+    | output_line                                                          |
+    | <parallel_scheme>s longest-first based on durations from 1 report(s) |
+    | PARALLEL_SCHEME     \| <parallel_scheme>                             |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports
+    Examples:
+      | parallel_scheme |
+      | scenario        |
+      | feature         |
+
+  @DURATION_SCHEDULING
+  Scenario: Schedule the longest tests first when the durations report does not exist
+    Given I have installed behavex
+    When I run the behavex command scheduling by the durations of a missing report
+    Then I should see the following behavex console outputs
+    | output_line                         |
+    | based on durations from 0 report(s) |
+    And I should see the same number of scenarios in the reports
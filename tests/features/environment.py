@@ -1,3 +1,6 @@
+import sys
+
+
 
 def before_all(context):
     # Configure behavex-images to always attach images to reports
@@ -11,6 +14,11 @@ def before_all(context):
 
 def before_scenario(context, scenario):
     context.progress_bar = False
+    # Scenarios covering features that depend on the Python version are only executed by those versions
+    if 'PYTHON_3_11_OR_NEWER' in scenario.effective_tags and sys.version_info < (3, 11):
+        scenario.skip('Requires Python 3.11 or newer')
+    elif 'PYTHON_BEFORE_3_11' in scenario.effective_tags and sys.version_info >= (3, 11):
+        scenario.skip('Requires a Python version before 3.11')
 
 
 def after_feature(context, feature):
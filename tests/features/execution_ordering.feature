@@ -75,3 +75,14 @@ Feature: Test Execution Ordering
       | parallel_scheme | parallel_processes |
       | scenario        | 3                  |
       | feature         | 3                  |
+
+  @ORDER_TESTS @SCENARIO_CHUNKS
+  Scenario: Validate that scenarios with different execution order are not executed in the same chunk
+    Given I have installed behavex
+    When I run the behavex command with execution ordering enabled using "2" parallel processes and scenario chunks of "4" scenarios
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                                     |
+    | Submitting 4 scenarios in 4 tasks (up to 4 scenarios from the same feature per task) |
+    | Exit code: 0                                                                    |
+    And I should not see error messages in the output
+    And I should see the scenarios executed in the correct order for "scenario" scheme
@@ -0,0 +1,29 @@
+Feature: Feature Cache
+
+  @FEATURE_CACHE
+  Scenario Outline: Reuse the parsed features cached by a previous execution by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with a feature cache using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    And I run the behavex command again with the same feature cache
+    Then I should see the following behavex console outputs
+    | output_line         |
+    | 43 scenarios passed |
+    And I should not see exception messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the same execution summary in both executions
+    And I should see the feature cache contains the parsed feature files
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 1                  | scenario        |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @FEATURE_CACHE
+  Scenario: Filter features by tags using the feature cache
+    Given I have installed behavex
+    When I run the behavex command with a feature cache using "2" parallel processes and parallel scheme set as "scenario"
+    And I run the behavex command again with the same feature cache and the tag "@PASSING_TAG_1"
+    Then I should see the following behavex console outputs
+    | output_line                              |
+    | 1 scenario passed, 0 failed, 0 skipped   |
+    And I should not see exception messages in the output
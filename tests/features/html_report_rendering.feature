@@ -0,0 +1,14 @@
+Feature: HTML Report Rendering
+
+  @HTML_REPORT_RENDERING
+  Scenario Outline: HTML report rendered by "<parallel_processes>" parallel processes is identical to the one rendered by the main process
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "scenario"
+    And I render the HTML report of the execution with "1" parallel processes
+    And I render the HTML report of the execution with "<parallel_processes>" parallel processes
+    Then I should see the HTML reports rendered with "1" and "<parallel_processes>" parallel processes are identical
+
+    Examples:
+      | parallel_processes |
+      | 2                  |
+      | 3                  |
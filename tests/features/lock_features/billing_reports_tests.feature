@@ -0,0 +1,9 @@
+Feature: Billing Reports Tests
+
+  @LOCK_billing_db
+  Scenario: Generate the monthly billing report
+    Given a step that takes "0.5" seconds
+
+  @SERIAL @LOCK_billing_db
+  Scenario: Rebuild the billing report indexes
+    Given a step that takes "0.5" seconds
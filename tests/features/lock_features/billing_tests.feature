@@ -0,0 +1,8 @@
+@LOCK_billing_db
+Feature: Billing Tests
+
+  Scenario: Create an invoice
+    Given a step that takes "0.5" seconds
+
+  Scenario: Cancel an invoice
+    Given a step that takes "0.5" seconds
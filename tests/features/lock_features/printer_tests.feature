@@ -0,0 +1,17 @@
+Feature: Printer Tests
+
+  @LOCK_printer:2
+  Scenario: Print a document
+    Given a step that takes "0.5" seconds
+
+  @LOCK_printer:2
+  Scenario: Print a label
+    Given a step that takes "0.5" seconds
+
+  @LOCK_printer:2
+  Scenario: Print a receipt
+    Given a step that takes "0.5" seconds
+
+  @LOCK_printer:2
+  Scenario: Print a report
+    Given a step that takes "0.5" seconds
@@ -0,0 +1,15 @@
+import time
+
+from behave import given
+
+
+@given('a step that takes "{seconds}" seconds')
+def given_step_taking_seconds(context, seconds):
+    start_time = time.time()
+    time.sleep(float(seconds))
+    executions_log = context.config.userdata.get('executions_log', '')
+    if executions_log:
+        locks = [tag for tag in context.scenario.effective_tags if tag.startswith('LOCK_')] or ['none']
+        with open(executions_log, 'a') as executions_log_file:
+            for lock in locks:
+                executions_log_file.write('{} {} {}\n'.format(lock, start_time, time.time()))
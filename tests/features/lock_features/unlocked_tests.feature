@@ -0,0 +1,10 @@
+Feature: Unlocked Tests
+
+  Scenario: First unlocked scenario
+    Given a step that takes "0.5" seconds
+
+  Scenario: Second unlocked scenario
+    Given a step that takes "0.5" seconds
+
+  Scenario: Third unlocked scenario
+    Given a step that takes "0.5" seconds
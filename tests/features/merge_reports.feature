@@ -0,0 +1,28 @@
+Feature: Merge Reports
+
+  @MERGE_REPORTS
+  Scenario Outline: Merge the outputs of the shards executed by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "<parallel_scheme>"
+    And I run the behavex command for each one of "2" shards with parallel scheme set as "<parallel_scheme>"
+    And I merge the outputs of the shards
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                   |
+    | Merging 2 reports with        |
+    | HTML output report is located |
+    And I should see the merged report contains the scenarios of the execution without shards
+    And I should see the HTML report was generated and contains scenarios
+    And I should see the same number of scenarios in the reports
+
+    Examples:
+      | parallel_scheme |
+      | scenario        |
+      | feature         |
+
+  @MERGE_REPORTS
+  Scenario: Merge a missing output
+    Given I have installed behavex
+    When I merge the output "missing_output"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                   |
+    | missing_output" was not found |
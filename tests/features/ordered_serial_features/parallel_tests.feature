@@ -0,0 +1,8 @@
+@ORDER_001
+Feature: Ordered Parallel Tests
+
+  Scenario: First ordered parallel scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Second ordered parallel scenario
+    Given a step that takes "1" seconds
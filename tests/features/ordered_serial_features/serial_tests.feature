@@ -0,0 +1,9 @@
+@SERIAL
+Feature: Ordered Serial Tests
+
+  @ORDER_002
+  Scenario: Ordered serial scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Unordered serial scenario
+    Given a step that takes "1" seconds
@@ -0,0 +1,18 @@
+import os
+import time
+
+from behave import given
+
+
+@given('a step that takes "{seconds}" seconds')
+def given_step_taking_seconds(context, seconds):
+    start_time = time.time()
+    time.sleep(float(seconds))
+    executions_log = context.config.userdata.get('executions_log', '')
+    if executions_log:
+        serial = 'SERIAL' in context.scenario.effective_tags
+        with open(executions_log, 'a') as executions_log_file:
+            executions_log_file.write('{} {} {} {}\n'.format('serial' if serial else 'parallel',
+                                                             start_time,
+                                                             time.time(),
+                                                             os.getpid()))
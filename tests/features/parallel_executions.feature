@@ -38,3 +38,37 @@ Feature: Parallel executions
       | scenario        | 2                  | -t=@PASSING_TAG_3 -t=~@PASSING_TAG_3_1 |
       | feature         | 3                  | -t=@PASSING_TAG_3 -t=@PASSING_TAG_3_1  |
       | feature         | 2                  | -t=@PASSING_TAG_3 -t=~@PASSING_TAG_3_1 |
+
+
+  @PARALLEL @PERSISTENT_WORKERS
+  Scenario Outline: Parallel executions by <parallel_scheme> with persistent workers
+    Given I have installed behavex
+    When I run the behavex command with persistent workers using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                         |
+    | PARALLEL_SCHEME     \| <parallel_scheme>                            |
+    | behave runs reused the loaded hooks and step definitions, saving    |
+    | Exit code: 1                                                        |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports and the console output
+    Examples:
+      | parallel_scheme | parallel_processes |
+      | scenario        | 3                  |
+      | feature         | 2                  |
+
+
+  @PARALLEL @SCENARIO_CHUNKS
+  Scenario Outline: Parallel executions by scenario submitting chunks of <scenario_chunk_size> scenarios
+    Given I have installed behavex
+    When I run the behavex command with "<parallel_processes>" parallel processes and scenario chunks of "<scenario_chunk_size>" scenarios
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                               |
+    | scenarios in                                                              |
+    | (up to <scenario_chunk_size> scenarios from the same feature per task)    |
+    | Exit code: 1                                                              |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports and the console output
+    Examples:
+      | parallel_processes | scenario_chunk_size |
+      | 3                  | 4                   |
+      | 2                  | 100                 |
@@ -0,0 +1,31 @@
+Feature: Resource Locks
+
+  @RESOURCE_LOCKS
+  Scenario Outline: Execute the tests holding the same resource lock one at a time by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with resource locks using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                   |
+    | 11 scenarios passed, 0 failed, 0 skipped                      |
+    | Resource locks:                                               |
+    | billing_db (capacity 1): <billing_executions> executions      |
+    | printer (capacity 2): <printer_executions> executions         |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the tests holding each resource lock did not exceed its capacity
+    Examples:
+      | parallel_processes | parallel_scheme | billing_executions | printer_executions |
+      | 3                  | scenario        | 4                  | 4                  |
+      | 3                  | feature         | 2                  | 1                  |
+
+  @RESOURCE_LOCKS
+  Scenario: Ignore the resource locks when running without parallel processes
+    Given I have installed behavex
+    When I run the behavex command with resource locks using "1" parallel processes and parallel scheme set as "scenario"
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                   |
+    | 11 scenarios passed, 0 failed, 0 skipped                      |
+    And I should not see the following behavex console outputs
+    | output_line                                                   |
+    | Resource locks:                                               |
+    And I should not see error messages in the output
@@ -0,0 +1,15 @@
+Feature: Results Journal
+
+  @RESULTS_JOURNAL
+  Scenario Outline: Results journal written by the executions with parallel scheme set as "<parallel_scheme>"
+    Given I have installed behavex
+    When I run the behavex command syncing the results journal every "<interval>" seconds with "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the results journal contains the scenarios of the report
+    And I should see the HTML report was generated and contains scenarios
+    And I should see the same number of scenarios in the reports
+
+    Examples:
+      | parallel_processes | parallel_scheme | interval |
+      | 1                  | scenario        | 0        |
+      | 2                  | scenario        | 0        |
+      | 2                  | feature         | 1        |
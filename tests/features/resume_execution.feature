@@ -0,0 +1,28 @@
+Feature: Resume Execution
+
+  @RESUME_EXECUTION
+  Scenario Outline: Resume an interrupted execution with <parallel_processes> parallel processes by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    And I interrupt the execution after its first "<results>" results
+    And I resume the execution with "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs
+    | output_line                   |
+    | scenarios already finished    |
+    | HTML output report is located |
+    And I should see the report contains the scenarios of the execution without interruption
+    And I should see the HTML report was generated and contains scenarios
+    And I should see the same number of scenarios in the reports
+
+    Examples:
+      | parallel_processes | parallel_scheme | results |
+      | 2                  | scenario        | 20      |
+      | 2                  | feature         | 8       |
+
+  @RESUME_EXECUTION
+  Scenario: Resume a missing execution
+    Given I have installed behavex
+    When I resume the execution in the output "missing_output"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                 |
+    | The results journal of the execution to resume was not found |
@@ -0,0 +1,50 @@
+Feature: Scenario Timeouts
+
+  @SCENARIO_TIMEOUT @PYTHON_3_11_OR_NEWER
+  Scenario Outline: Terminate the parallel processes running scenarios that exceed their timeout tag by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with hanging scenarios tagged with a timeout using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                              |
+    | 3 scenarios passed, 2 failed, 0 skipped  |
+    | Exit code: 1                             |
+    And I should not see exception messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the generated HTML report contains the "Execution timed out after" string
+    And I should see the JUnit reports contain the "Execution timed out after" string
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @SCENARIO_TIMEOUT @PYTHON_3_11_OR_NEWER
+  Scenario: Terminate the parallel processes running scenarios that exceed the scenario timeout argument
+    Given I have installed behavex
+    When I run the behavex command with hanging scenarios and a scenario timeout of "2" seconds
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                  |
+    | 3 scenarios passed, 1 failed, 0 skipped      |
+    | exceeded 2 seconds, terminating the parallel process |
+    | Exit code: 1                                 |
+    And I should not see exception messages in the output
+    And I should see the generated HTML report contains the "Execution timed out after 2 seconds" string
+
+  @SCENARIO_TIMEOUT @PYTHON_BEFORE_3_11
+  Scenario: Fail when scenarios to run in parallel are tagged with a timeout and the Python version cannot terminate them
+    Given I have installed behavex
+    When I run the behavex command with hanging scenarios tagged with a timeout using "2" parallel processes and parallel scheme set as "scenario"
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                                   |
+    | Error: Scenario timeouts in parallel executions require Python 3.11 or newer  |
+    | (found @TIMEOUT_<seconds> tags)                                               |
+    And I should not see exception messages in the output
+
+  @SCENARIO_TIMEOUT @PYTHON_BEFORE_3_11
+  Scenario: Fail when the scenario timeout argument is provided and the Python version cannot terminate the parallel processes
+    Given I have installed behavex
+    When I run the behavex command with hanging scenarios and a scenario timeout of "2" seconds
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                                   |
+    | Error: Scenario timeouts in parallel executions require Python 3.11 or newer  |
+    | (found --scenario-timeout)                                                    |
+    And I should not see exception messages in the output
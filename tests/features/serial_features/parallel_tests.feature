@@ -0,0 +1,13 @@
+Feature: Parallel Tests
+
+  Scenario: First parallel scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Second parallel scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Third parallel scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Fourth parallel scenario
+    Given a step that takes "1" seconds
@@ -0,0 +1,8 @@
+@SERIAL
+Feature: Serial Tests
+
+  Scenario: First serial scenario
+    Given a step that takes "1" seconds
+
+  Scenario: Second serial scenario
+    Given a step that takes "1" seconds
@@ -0,0 +1,50 @@
+Feature: Serial Lane
+
+  @SERIAL_LANE
+  Scenario Outline: Execute the serial tests while the parallel processes execute the rest by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with serial tests using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                   |
+    | 6 scenarios passed, 0 failed, 0 skipped                       |
+    | while the parallel processes run the rest                     |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the serial tests were executed while the parallel tests were running
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @SERIAL_LANE
+  Scenario Outline: Execute the serial tests before the parallel tests by <parallel_scheme> when strict serial execution is requested
+    Given I have installed behavex
+    When I run the behavex command with serial tests using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>" and strict serial execution
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                   |
+    | 6 scenarios passed, 0 failed, 0 skipped                       |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the serial tests were executed before the parallel tests
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @SERIAL_LANE
+  Scenario Outline: Execute the ordered serial tests before the parallel tests by <parallel_scheme> when strict execution ordering is requested
+    Given I have installed behavex
+    When I run the behavex command with ordered serial tests using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>" and strict execution ordering
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                                                   |
+    | 4 scenarios passed, 0 failed, 0 skipped                       |
+    And I should not see the following behavex console outputs
+    | output_line                                                   |
+    | untested                                                      |
+    And I should not see error messages in the output
+    And I should see the same number of scenarios in the reports
+    And I should see the serial tests were executed before the parallel tests
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 2                  | scenario        |
+      | 2                  | feature         |
@@ -0,0 +1,23 @@
+Feature: Sharded HTML Report
+
+  @SHARDED_HTML_REPORT
+  Scenario Outline: Sharded HTML report generated by the executions with parallel scheme set as "<parallel_scheme>"
+    Given I have installed behavex
+    When I run the behavex command with "<parallel_processes>" parallel processes, parallel scheme set as "<parallel_scheme>" and HTML report mode set as "sharded"
+    Then I should see the HTML report was generated and contains "0" scenarios
+    And I should see the feature shards of the HTML report contain the scenarios of the report
+
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 1                  | scenario        |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @SHARDED_HTML_REPORT
+  Scenario: Sharded HTML report generated when merging outputs
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "scenario"
+    And I run the behavex command for each one of "2" shards with parallel scheme set as "scenario"
+    And I merge the outputs of the shards with HTML report mode set as "sharded"
+    Then I should see the HTML report was generated and contains "0" scenarios
+    And I should see the feature shards of the HTML report contain the scenarios of the report
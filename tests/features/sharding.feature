@@ -0,0 +1,33 @@
+Feature: Sharding
+
+  @SHARDING
+  Scenario Outline: Split the tests across shards by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "<parallel_scheme>"
+    And I run the behavex command for each one of "3" shards with parallel scheme set as "<parallel_scheme>"
+    Then I should see each scenario was executed by exactly one shard
+    And I should see the following behavex console outputs in each shard
+    | output_line                                         |
+    | of 3 shards): running                               |
+    | <parallel_scheme>s, balanced by number of scenarios |
+    Examples:
+      | parallel_scheme |
+      | scenario        |
+      | feature         |
+
+  @SHARDING
+  Scenario: Split the tests across shards balanced by the durations from a previous execution
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and parallel scheme set as "scenario"
+    And I run the behavex command for each one of "2" shards scheduling by the durations of the previous execution
+    Then I should see each scenario was executed by exactly one shard
+    And I should see the following behavex console outputs in each shard
+    | output_line                |
+    | balanced by duration       |
+    | estimated from 1 report(s) |
+
+  @SHARDING
+  Scenario: Shard index out of range
+    Given I have installed behavex
+    When I run the behavex command for the shard "3" of "3" shards
+    Then I should see the behavex command failed with exit code "2" and the error "--shard-index must be between 0 and --shard-count - 1"
@@ -4,6 +4,7 @@ import os
 import random
 import re
 import subprocess
+import sys
 import time
 
 from behave import given, then, when
@@ -117,6 +118,20 @@ def when_run_with_parallel_config(context, parallel_processes, parallel_scheme):
     execute_command(context, execution_args)
 
 
+@when('I run the behavex command with persistent workers using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_persistent_workers(context, parallel_processes, parallel_scheme):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'), '-o', context.output_path, '--parallel-processes', parallel_processes, '--parallel-scheme', parallel_scheme, '--persistent-workers']
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command with "{parallel_processes}" parallel processes and scenario chunks of "{scenario_chunk_size}" scenarios')
+def when_run_with_scenario_chunks(context, parallel_processes, scenario_chunk_size):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'), '-o', context.output_path, '--parallel-processes', parallel_processes, '--parallel-scheme', 'scenario', '--scenario-chunk-size', scenario_chunk_size]
+    execute_command(context, execution_args)
+
+
 @when('I setup the behavex command with "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
 def when_setup_parallel_config(context, parallel_processes, parallel_scheme):
     context.parallel_processes = parallel_processes
@@ -187,6 +202,12 @@ def then_see_console_outputs(context, expected_exit_code=None):
         assert row['output_line'] in context.result.stdout, f"Unexpected output when checking console outputs: {context.result.stdout}\n\nOutput line not found: {row['output_line']}\n"
 
 
+@then('I should not see the following behavex console outputs')
+def then_not_see_console_outputs(context):
+    for row in context.table:
+        assert row['output_line'] not in context.result.stdout, f"Unexpected output when checking console outputs: {context.result.stdout}\n\nOutput line found: {row['output_line']}\n"
+
+
 @then('I should not see error messages in the output')
 def then_no_error_messages(context):
     error_messages = ["error", "exception", "traceback"]
@@ -591,6 +612,20 @@ def when_run_with_execution_ordering(context, parallel_processes, parallel_schem
     execute_command(context, execution_args)
 
 
+@when('I run the behavex command with execution ordering enabled using "{parallel_processes}" parallel processes and scenario chunks of "{scenario_chunk_size}" scenarios')
+def when_run_ordering_with_scenario_chunks(context, parallel_processes, scenario_chunk_size):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features', 'ordered_tests.feature'),
+                      '-t', '@ORDERED_TEST',
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', 'scenario',
+                      '--scenario-chunk-size', scenario_chunk_size,
+                      '--order-tests']
+    execute_command(context, execution_args)
+
+
 @when('I run the behavex command with execution ordering enabled using custom prefix "{prefix}" with "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
 def when_run_with_custom_prefix_ordering(context, prefix, parallel_processes, parallel_scheme):
     context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
@@ -912,3 +947,596 @@ def then_see_strict_execution_order(context, parallel_scheme):
             f"started at {next_scenario['start_time']}. With --order-tests-strict, scenarios must complete before the next starts!"
 
     logging.info(f"✅ Strict sequential execution verified for {parallel_scheme} scheme with --order-tests-strict")
+
+
+# ---------- Duration Based Scheduling Test Steps ----------
+
+@when('I run the behavex command again scheduling by the durations of the previous execution with parallel scheme set as "{parallel_scheme}"')
+def when_run_scheduling_by_previous_durations(context, parallel_scheme):
+    previous_report = os.path.join(context.output_path, 'report.json')
+    assert os.path.exists(previous_report), f"Report JSON file not found at {previous_report}"
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', '2',
+                      '--parallel-scheme', parallel_scheme,
+                      '--schedule-by-duration', previous_report]
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command scheduling by the durations of a missing report')
+def when_run_scheduling_by_missing_report(context):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features', 'passing_tests.feature'),
+                      '-o', context.output_path,
+                      '--parallel-processes', '2',
+                      '--parallel-scheme', 'scenario',
+                      '--schedule-by-duration', os.path.join(context.output_path, 'missing_report.json'),
+                      '--default-duration', '1']
+    execute_command(context, execution_args)
+
+
+# ---------- Worker Scoped Hooks Test Steps ----------
+
+@when('I run the behavex command with worker scoped hooks using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+@when('I run the behavex command with worker scoped hooks using "{parallel_processes}" parallel processes and up to "{max_tasks_per_worker}" tasks per worker')
+def when_run_with_worker_scoped_hooks(context, parallel_processes, parallel_scheme='scenario', max_tasks_per_worker=None):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    os.makedirs(context.output_path, exist_ok=True)
+    context.hooks_log = os.path.abspath(os.path.join(context.output_path, 'hooks.log'))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'worker_scoped_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '--worker-scoped-hooks',
+                      '-D', 'hooks_log={}'.format(context.hooks_log)]
+    if max_tasks_per_worker:
+        execution_args += ['--max-tasks-per-worker', max_tasks_per_worker]
+    execute_command(context, execution_args)
+
+
+@then('I should see the before_all and after_all hooks were executed once per process')
+def then_hooks_executed_once_per_process(context):
+    with open(context.hooks_log, 'r') as hooks_log_file:
+        hook_executions = [line.split() for line in hooks_log_file.read().splitlines() if line.strip()]
+    before_all_pids = [pid for hook_name, pid in hook_executions if hook_name == 'before_all']
+    after_all_pids = [pid for hook_name, pid in hook_executions if hook_name == 'after_all']
+    logging.info('Hook executions: {}'.format(hook_executions))
+    assert len(before_all_pids) == len(set(before_all_pids)), 'before_all was executed more than once by a process'
+    assert sorted(before_all_pids) == sorted(after_all_pids), 'after_all was not executed once by each process'
+
+
+# ---------- Feature Cache Test Steps ----------
+
+@when('I run the behavex command with a feature cache using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_feature_cache(context, parallel_processes, parallel_scheme):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    context.feature_cache_dir = os.path.join(context.output_path, 'feature_cache')
+    context.feature_cache_args = ['--parallel-processes', parallel_processes,
+                                  '--parallel-scheme', parallel_scheme,
+                                  '--feature-cache-dir', context.feature_cache_dir]
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path] + context.feature_cache_args
+    execute_command(context, execution_args)
+    context.previous_result = context.result
+
+
+@when('I run the behavex command again with the same feature cache')
+@when('I run the behavex command again with the same feature cache and the tag "{tag}"')
+def when_run_again_with_feature_cache(context, tag=None):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path] + context.feature_cache_args
+    if tag:
+        execution_args += ['-t', tag]
+    execute_command(context, execution_args)
+
+
+@then('I should see the same execution summary in both executions')
+def then_same_execution_summary(context):
+    summary_re = re.compile(r'^\d+ (features?|scenarios?|steps?) passed, .*$', re.MULTILINE)
+    previous_summary = [match.group(0) for match in summary_re.finditer(context.previous_result.stdout)]
+    current_summary = [match.group(0) for match in summary_re.finditer(context.result.stdout)]
+    assert previous_summary, 'Execution summary not found in the first execution output'
+    assert previous_summary == current_summary, f"Expected the same execution summary, but found {previous_summary} and {current_summary}"
+
+
+@then('I should see the feature cache contains the parsed feature files')
+def then_feature_cache_contains_features(context):
+    feature_files = [name for name in os.listdir(os.path.join(tests_features_path, 'secondary_features'))
+                     if name.endswith('.feature')]
+    cache_entries = [name for name in os.listdir(context.feature_cache_dir) if name.endswith('.pickle')]
+    assert len(cache_entries) == len(feature_files), f"Expected {len(feature_files)} feature cache entries, but found {len(cache_entries)}"
+
+
+# ---------- Scenario Timeout Test Steps ----------
+
+@when('I run the behavex command with hanging scenarios tagged with a timeout using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_hanging_scenarios(context, parallel_processes, parallel_scheme):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'timeout_features', 'hanging_tests.feature'),
+                      os.path.join(tests_features_path, 'timeout_features', 'passing_tests.feature'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme]
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command with hanging scenarios and a scenario timeout of "{scenario_timeout}" seconds')
+def when_run_with_scenario_timeout(context, scenario_timeout):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'timeout_features', 'untagged_hanging_tests.feature'),
+                      os.path.join(tests_features_path, 'timeout_features', 'passing_tests.feature'),
+                      '-o', context.output_path,
+                      '--parallel-processes', '2',
+                      '--scenario-timeout', scenario_timeout]
+    execute_command(context, execution_args)
+
+
+@then('I should see the JUnit reports contain the "{string_to_search}" string')
+def then_junit_reports_contain_string(context, string_to_search):
+    junit_folder = os.path.abspath(os.path.join(context.output_path, 'behave'))
+    junit_contents = ''
+    for file in os.listdir(junit_folder):
+        if file.endswith('.xml'):
+            with open(os.path.join(junit_folder, file), 'r') as junit_file:
+                junit_contents += junit_file.read()
+    assert string_to_search in junit_contents, f"Expected the JUnit reports to contain the string '{string_to_search}'"
+
+
+# ---------- Worker Recycling Test Steps ----------
+
+@when('I run the behavex command with "{parallel_processes}" parallel processes, parallel scheme set as "{parallel_scheme}" and up to "{max_tasks_per_worker}" tasks per worker')
+def when_run_with_max_tasks_per_worker(context, parallel_processes, parallel_scheme, max_tasks_per_worker):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '--max-tasks-per-worker', max_tasks_per_worker]
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command with "{parallel_processes}" parallel processes and a maximum worker memory usage of "{max_worker_rss_mb}" MB')
+def when_run_with_max_worker_rss(context, parallel_processes, max_worker_rss_mb):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', 'scenario',
+                      '--max-worker-rss-mb', max_worker_rss_mb]
+    execute_command(context, execution_args)
+
+
+# ---------- Serial Lane Test Steps ----------
+
+@when('I run the behavex command with serial tests using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_serial_tests(context, parallel_processes, parallel_scheme, serial_strict=False,
+                               features_folder='serial_features', order_tests_strict=False):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    os.makedirs(context.output_path, exist_ok=True)
+    context.executions_log = os.path.abspath(os.path.join(context.output_path, 'executions.log'))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, features_folder),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '-D', 'executions_log={}'.format(context.executions_log)]
+    if serial_strict:
+        execution_args.append('--serial-strict')
+    if order_tests_strict:
+        execution_args.append('--order-tests-strict')
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command with serial tests using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}" and strict serial execution')
+def when_run_with_strict_serial_tests(context, parallel_processes, parallel_scheme):
+    when_run_with_serial_tests(context, parallel_processes, parallel_scheme, serial_strict=True)
+
+
+@when('I run the behavex command with ordered serial tests using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}" and strict execution ordering')
+def when_run_with_ordered_serial_tests(context, parallel_processes, parallel_scheme):
+    when_run_with_serial_tests(context, parallel_processes, parallel_scheme,
+                               features_folder='ordered_serial_features', order_tests_strict=True)
+
+
+def get_serial_and_parallel_executions(context):
+    with open(context.executions_log, 'r') as executions_log_file:
+        executions = [line.split() for line in executions_log_file.read().splitlines() if line.strip()]
+    logging.info('Executions: {}'.format(executions))
+    serial = [(float(start), float(end)) for lane, start, end, _ in executions if lane == 'serial']
+    parallel = [(float(start), float(end)) for lane, start, end, _ in executions if lane == 'parallel']
+    return serial, parallel
+
+
+@then('I should see the serial tests were executed while the parallel tests were running')
+def then_serial_tests_executed_concurrently(context):
+    serial, parallel = get_serial_and_parallel_executions(context)
+    assert serial and parallel, 'Expected serial and parallel executions'
+    assert min(start for start, _ in serial) < max(end for _, end in parallel) and \
+        min(start for start, _ in parallel) < max(end for _, end in serial), \
+        'Expected the serial tests to be executed while the parallel tests were running'
+    for (start, end), (next_start, _) in zip(sorted(serial), sorted(serial)[1:]):
+        assert end <= next_start, 'Expected the serial tests to be executed one after another'
+
+
+@then('I should see the serial tests were executed before the parallel tests')
+def then_serial_tests_executed_first(context):
+    serial, parallel = get_serial_and_parallel_executions(context)
+    assert serial and parallel, 'Expected serial and parallel executions'
+    assert max(end for _, end in serial) <= min(start for start, _ in parallel), \
+        'Expected the serial tests to be executed before the parallel tests'
+
+
+# ---------- Resource Locks Test Steps ----------
+
+@when('I run the behavex command with resource locks using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_resource_locks(context, parallel_processes, parallel_scheme):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    os.makedirs(context.output_path, exist_ok=True)
+    context.executions_log = os.path.abspath(os.path.join(context.output_path, 'executions.log'))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'lock_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '-D', 'executions_log={}'.format(context.executions_log)]
+    execute_command(context, execution_args)
+
+
+@then('I should see the tests holding each resource lock did not exceed its capacity')
+def then_resource_locks_capacity_not_exceeded(context):
+    with open(context.executions_log, 'r') as executions_log_file:
+        executions = [line.split() for line in executions_log_file.read().splitlines() if line.strip()]
+    logging.info('Executions: {}'.format(executions))
+    for lock, capacity in [('LOCK_billing_db', 1), ('LOCK_printer:2', 2)]:
+        intervals = [(float(start), float(end)) for name, start, end in executions if name == lock]
+        assert intervals, 'Expected executions holding the {} lock'.format(lock)
+        for start, _ in intervals:
+            running = sum(1 for other_start, other_end in intervals if other_start <= start < other_end)
+            assert running <= capacity, \
+                'Expected at most {} executions holding the {} lock at the same time'.format(capacity, lock)
+
+
+# ---------- Dependency Scheduling Test Steps ----------
+
+@when('I run the behavex command with dependent tests using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_dependent_tests(context, parallel_processes, parallel_scheme, order_tests_strict=False):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    os.makedirs(context.output_path, exist_ok=True)
+    context.executions_log = os.path.abspath(os.path.join(context.output_path, 'executions.log'))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'dependent_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '-D', 'executions_log={}'.format(context.executions_log)]
+    if order_tests_strict:
+        execution_args.append('--order-tests-strict')
+    execute_command(context, execution_args)
+
+
+@when('I run the behavex command with dependent tests using "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}" and strict execution ordering')
+def when_run_with_dependent_tests_strict_order(context, parallel_processes, parallel_scheme):
+    when_run_with_dependent_tests(context, parallel_processes, parallel_scheme, order_tests_strict=True)
+
+
+def get_test_executions(context):
+    with open(context.executions_log, 'r') as executions_log_file:
+        executions = [line.split('|') for line in executions_log_file.read().splitlines() if line.strip()]
+    logging.info('Executions: {}'.format(executions))
+    return {name: (float(start), float(end)) for name, start, end in executions}
+
+
+@then('I should see the "{test_name}" test started after the "{other_test_name}" test finished')
+def then_test_started_after_other_test(context, test_name, other_test_name):
+    executions = get_test_executions(context)
+    assert executions[test_name][0] >= executions[other_test_name][1], \
+        'Expected "{}" to start after "{}" finished'.format(test_name, other_test_name)
+
+
+@then('I should see the "{test_name}" test started before the "{other_test_name}" test finished')
+def then_test_started_before_other_test(context, test_name, other_test_name):
+    executions = get_test_executions(context)
+    assert executions[test_name][0] < executions[other_test_name][1], \
+        'Expected "{}" to start before "{}" finished'.format(test_name, other_test_name)
+
+
+@then('I should see the following scenarios reported as untested')
+def then_scenarios_reported_as_untested(context):
+    with open(os.path.join(context.output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    statuses = {scenario['name']: scenario['status']
+                for feature in report['features'] for scenario in feature['scenarios']}
+    for row in context.table:
+        assert statuses.get(row['scenario_name']) == 'untested', \
+            'Expected "{}" to be reported as untested, got: {}'.format(row['scenario_name'], statuses)
+
+
+
+# ---------- Sharding Test Steps ----------
+
+@when('I run the behavex command for each one of "{shard_count}" shards with parallel scheme set as "{parallel_scheme}"')
+def when_run_each_shard(context, shard_count, parallel_scheme, extra_args=()):
+    context.previous_report = os.path.join(context.output_path, 'report.json')
+    context.shard_outputs = []
+    for shard_index in range(int(shard_count)):
+        context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+        execution_args = ['behavex',
+                          os.path.join(tests_features_path, 'secondary_features'),
+                          '-o', context.output_path,
+                          '--parallel-processes', '2',
+                          '--parallel-scheme', parallel_scheme,
+                          '--shard-index', str(shard_index),
+                          '--shard-count', shard_count] + list(extra_args)
+        execute_command(context, execution_args)
+        context.shard_outputs.append((context.result.stdout, context.output_path))
+
+
+@when('I run the behavex command for each one of "{shard_count}" shards scheduling by the durations of the previous execution')
+def when_run_each_shard_by_durations(context, shard_count):
+    previous_report = os.path.join(context.output_path, 'report.json')
+    assert os.path.exists(previous_report), f"Report JSON file not found at {previous_report}"
+    when_run_each_shard(context, shard_count, 'scenario', extra_args=['--schedule-by-duration', previous_report])
+
+
+@when('I run the behavex command for the shard "{shard_index}" of "{shard_count}" shards')
+def when_run_shard(context, shard_index, shard_count):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex',
+                      os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--shard-index', shard_index,
+                      '--shard-count', shard_count]
+    execute_command(context, execution_args)
+
+
+def get_executed_scenarios(output_path):
+    with open(os.path.join(output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    return [(feature['filename'], scenario['name'])
+            for feature in report['features'] for scenario in feature['scenarios']]
+
+
+@then('I should see each scenario was executed by exactly one shard')
+def then_each_scenario_executed_by_one_shard(context):
+    all_scenarios = get_executed_scenarios(os.path.dirname(context.previous_report))
+    shard_scenarios = [scenario for _, output_path in context.shard_outputs
+                       for scenario in get_executed_scenarios(output_path)]
+    assert len(shard_scenarios) == len(set(shard_scenarios)), \
+        'Expected each scenario to be executed by a single shard: {}'.format(shard_scenarios)
+    assert sorted(shard_scenarios) == sorted(all_scenarios), \
+        'Expected the shards to execute all the scenarios: {}'.format(set(all_scenarios) ^ set(shard_scenarios))
+    for _, output_path in context.shard_outputs:
+        assert get_executed_scenarios(output_path), 'Expected all the shards to execute scenarios'
+
+
+@then('I should see the following behavex console outputs in each shard')
+def then_see_console_outputs_in_each_shard(context):
+    for stdout, _ in context.shard_outputs:
+        for row in context.table:
+            assert row['output_line'] in stdout, \
+                f"Unexpected output when checking console outputs: {stdout}\n\nOutput line not found: {row['output_line']}\n"
+
+
+@then('I should see the behavex command failed with exit code "{expected_exit_code}" and the error "{error_message}"')
+def then_command_failed_with_error(context, expected_exit_code, error_message):
+    assert int(context.result.returncode) == int(expected_exit_code), "Behavex exit code is not expected"
+    assert error_message in context.result.stderr, \
+        f"Unexpected error output: {context.result.stderr}\n\nError not found: {error_message}\n"
+
+
+# ---------- Merge Reports Test Steps ----------
+
+@when('I merge the outputs of the shards')
+def when_merge_shard_outputs(context):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', 'merge'] + [output_path for _, output_path in context.shard_outputs] + \
+                     ['-o', context.output_path]
+    execute_command(context, execution_args)
+
+
+@when('I merge the output "{output_name}"')
+def when_merge_output(context, output_name):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', 'merge', os.path.join(context.output_path, output_name), '-o', context.output_path]
+    execute_command(context, execution_args)
+
+
+@then('I should see the merged report contains the scenarios of the execution without shards')
+def then_merged_report_contains_all_scenarios(context):
+    def get_scenario_statuses(output_path):
+        with open(os.path.join(output_path, 'report.json'), 'r') as report_file:
+            report = json.load(report_file)
+        return sorted((feature['filename'], scenario['name'], scenario['status'])
+                      for feature in report['features'] for scenario in feature['scenarios'])
+    expected_scenarios = get_scenario_statuses(os.path.dirname(context.previous_report))
+    merged_scenarios = get_scenario_statuses(context.output_path)
+    assert merged_scenarios == expected_scenarios, \
+        'Expected the merged report to contain the scenarios of the execution without shards: {}'.format(
+            set(merged_scenarios) ^ set(expected_scenarios))
+    logs_path = os.path.join(context.output_path, 'outputs', 'logs')
+    for _, output_path in context.shard_outputs:
+        shard_logs_path = os.path.join(output_path, 'outputs', 'logs')
+        for log_folder in filter(lambda name: os.path.isdir(os.path.join(shard_logs_path, name)),
+                                 os.listdir(shard_logs_path)):
+            assert os.path.isdir(os.path.join(logs_path, log_folder)), \
+                'Expected the scenario logs to be copied to the merged output: {}'.format(log_folder)
+
+
+# ---------- Results Journal Test Steps ----------
+
+@when('I run the behavex command syncing the results journal every "{interval}" seconds with "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_run_with_journal_fsync_interval(context, interval, parallel_processes, parallel_scheme):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '--journal-fsync-interval', interval]
+    execute_command(context, execution_args)
+
+
+@then('I should see the results journal contains the scenarios of the report')
+def then_results_journal_contains_report_scenarios(context):
+    def get_scenarios(reports):
+        return sorted((feature['filename'], scenario['name'], scenario['status'])
+                      for report in reports for feature in report['features'] for scenario in feature['scenarios'])
+    journal_path = os.path.join(context.output_path, 'results.ndjson')
+    assert os.path.exists(journal_path), f"Results journal not found at {journal_path}"
+    with open(journal_path, 'r') as journal_file:
+        records = [json.loads(line) for line in journal_file]
+    assert records[0]['record'] == 'start', 'Expected the journal to start with a "start" record'
+    assert records[-1]['record'] == 'end', 'Expected the journal to end with an "end" record'
+    journal_reports = [record['report'] for record in records if record['record'] == 'result']
+    assert journal_reports, 'Expected the journal to contain the results of the execution'
+    with open(os.path.join(context.output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    journal_scenarios = get_scenarios(journal_reports)
+    report_scenarios = get_scenarios([report])
+    assert set(report_scenarios) <= set(journal_scenarios), \
+        'Expected the report scenarios to be in the results journal: {}'.format(
+            set(report_scenarios) - set(journal_scenarios))
+
+
+# ---------- Resume Execution Test Steps ----------
+
+@when('I interrupt the execution after its first "{results}" results')
+def when_interrupt_execution(context, results):
+    with open(os.path.join(context.output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    context.expected_scenarios = sorted((feature['filename'], scenario['line'], scenario['status'])
+                                        for feature in report['features'] for scenario in feature['scenarios'])
+    # The journal is left as if the execution was killed while writing the next result
+    journal_path = os.path.join(context.output_path, 'results.ndjson')
+    with open(journal_path, 'r') as journal_file:
+        records = journal_file.readlines()
+    with open(journal_path, 'w') as journal_file:
+        journal_file.writelines(records[:int(results) + 1] + [records[int(results) + 1][:50]])
+    os.remove(os.path.join(context.output_path, 'report.json'))
+
+
+@when('I resume the execution with "{parallel_processes}" parallel processes and parallel scheme set as "{parallel_scheme}"')
+def when_resume_execution(context, parallel_processes, parallel_scheme):
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '--resume', context.output_path]
+    execute_command(context, execution_args)
+
+
+@when('I resume the execution in the output "{output_name}"')
+def when_resume_missing_execution(context, output_name):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--resume', os.path.join(context.output_path, output_name)]
+    execute_command(context, execution_args)
+
+
+@then('I should see the report contains the scenarios of the execution without interruption')
+def then_report_contains_scenarios_without_interruption(context):
+    with open(os.path.join(context.output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    scenarios = sorted((feature['filename'], scenario['line'], scenario['status'])
+                       for feature in report['features'] for scenario in feature['scenarios'])
+    assert scenarios == context.expected_scenarios, \
+        'Expected the resumed report to contain the scenarios of the execution without interruption: {}'.format(
+            set(scenarios) ^ set(context.expected_scenarios))
+
+
+# ---------- Sharded HTML Report Test Steps ----------
+
+@when('I run the behavex command with "{parallel_processes}" parallel processes, parallel scheme set as "{parallel_scheme}" and HTML report mode set as "{html_report_mode}"')
+def when_run_with_html_report_mode(context, parallel_processes, parallel_scheme, html_report_mode):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', os.path.join(tests_features_path, 'secondary_features'),
+                      '-o', context.output_path,
+                      '--parallel-processes', parallel_processes,
+                      '--parallel-scheme', parallel_scheme,
+                      '--html-report-mode', html_report_mode]
+    execute_command(context, execution_args)
+
+
+@when('I merge the outputs of the shards with HTML report mode set as "{html_report_mode}"')
+def when_merge_shard_outputs_with_html_report_mode(context, html_report_mode):
+    context.output_path = os.path.join('output', 'output_{}'.format(get_random_number(6)))
+    execution_args = ['behavex', 'merge'] + [output_path for _, output_path in context.shard_outputs] + \
+                     ['-o', context.output_path, '--html-report-mode', html_report_mode]
+    execute_command(context, execution_args)
+
+
+@then('I should see the feature shards of the HTML report contain the scenarios of the report')
+def then_feature_shards_contain_report_scenarios(context):
+    with open(os.path.join(context.output_path, 'report.json'), 'r') as report_file:
+        report = json.load(report_file)
+    total_scenarios = sum(len(feature['scenarios']) for feature in report['features'])
+    shards_path = os.path.join(context.output_path, 'outputs', 'report_features')
+    shards = sorted(os.listdir(shards_path))
+    assert len(shards) == len(report['features']), \
+        'Expected one shard per feature ({}), but found {}'.format(len(report['features']), len(shards))
+    total_scenarios_in_shards = 0
+    for shard in shards:
+        with open(os.path.join(shards_path, shard), 'r') as shard_file:
+            total_scenarios_in_shards += shard_file.read().count('data-scenario-tags=')
+    assert total_scenarios_in_shards == total_scenarios, \
+        'Expected the shards to contain {} scenarios, but found {}'.format(total_scenarios, total_scenarios_in_shards)
+    with open(os.path.join(context.output_path, 'report.html'), 'r') as report_file:
+        referenced_shards = re.findall(r'data-feature-shard="(\d+)"', report_file.read())
+    assert sorted('{}.js'.format(shard) for shard in referenced_shards) == shards, \
+        'Expected the HTML report to reference the {} shards'.format(len(shards))
+
+
+# Renders the HTML report from a report.json file (arguments: report path, output folder and parallel processes)
+RENDER_HTML_REPORT = '''
+import os, sys
+from behavex import serializer
+from behavex.arguments import parse_arguments
+from behavex.conf_mgr import ConfigRun, set_env
+from behavex.global_vars import global_vars
+from behavex.outputs import report_html
+from behavex.utils import set_behave_tags
+report_path, output_path, parallel_processes = sys.argv[1:]
+ConfigRun().set_args(parse_arguments(['-o', output_path, '--parallel-processes', parallel_processes]))
+for folder in ('behave', os.path.join('outputs', 'bootstrap', 'css'), os.path.join('outputs', 'logs')):
+    os.makedirs(os.path.join(output_path, folder), exist_ok=True)
+set_env('output', output_path)
+set_env('logs', os.path.join(output_path, 'outputs', 'logs'))
+set_env('tags', '')
+set_env('behave_tags', '')
+set_behave_tags()
+# Fixed execution times, so the reports rendered by each command are comparable
+global_vars.execution_start_time = global_vars.execution_end_time = 1700000000
+report_html.generate_report(serializer.load(report_path))
+'''
+
+
+@when('I render the HTML report of the execution with "{parallel_processes}" parallel processes')
+def when_render_html_report(context, parallel_processes):
+    if not hasattr(context, 'rendered_reports'):
+        context.rendered_reports = {}
+    output_path = os.path.join(context.output_path, 'rendered_{}'.format(parallel_processes))
+    result = subprocess.run([sys.executable, '-c', RENDER_HTML_REPORT, os.path.join(context.output_path, 'report.json'),
+                             output_path, parallel_processes], capture_output=True, text=True)
+    assert result.returncode == 0, 'The HTML report could not be rendered: {}'.format(result.stderr)
+    with open(os.path.join(output_path, 'report.html'), 'rb') as report_file:
+        context.rendered_reports[parallel_processes] = report_file.read()
+
+
+@then('I should see the HTML reports rendered with "{first_processes}" and "{second_processes}" parallel processes are identical')
+def then_rendered_html_reports_identical(context, first_processes, second_processes):
+    first_report = context.rendered_reports[first_processes]
+    second_report = context.rendered_reports[second_processes]
+    assert first_report, 'The rendered HTML report is empty'
+    assert first_report == second_report, \
+        'The HTML reports rendered with {} and {} parallel processes differ'.format(first_processes, second_processes)
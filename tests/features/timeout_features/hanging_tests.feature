@@ -0,0 +1,10 @@
+@TIMEOUT_2
+Feature: Hanging Tests
+
+  Scenario: First hanging scenario should be terminated
+    Given a condition to hang the scenario
+    Then I perform the condition
+
+  Scenario: Second hanging scenario should be terminated
+    Given a condition to hang the scenario
+    Then I perform the condition
@@ -0,0 +1,13 @@
+Feature: Passing Tests
+
+  Scenario: First passing scenario
+    Given a passing condition
+    Then I perform the condition
+
+  Scenario: Second passing scenario
+    Given a passing condition
+    Then I perform the condition
+
+  Scenario: Third passing scenario
+    Given a passing condition
+    Then I perform the condition
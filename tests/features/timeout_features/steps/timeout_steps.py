@@ -0,0 +1,19 @@
+import time
+
+from behave import given, then
+
+
+@given('a condition to hang the scenario')
+def given_hanging_condition(context):
+    context.condition = 'hang'
+
+@given('a passing condition')
+def given_passing_condition(context):
+    context.condition = 'pass'
+
+@then('I perform the condition')
+def then_perform_condition(context):
+    if context.condition == 'hang':
+        # This step never finishes, so the scenario exceeds its timeout
+        while True:
+            time.sleep(1)
@@ -0,0 +1,5 @@
+Feature: Untagged Hanging Tests
+
+  Scenario: Hanging scenario with no timeout tag should be terminated
+    Given a condition to hang the scenario
+    Then I perform the condition
@@ -0,0 +1,49 @@
+Feature: Worker Recycling
+
+  @WORKER_RECYCLING @PYTHON_3_11_OR_NEWER
+  Scenario Outline: Retire and replace the parallel processes after a number of tasks by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with "<parallel_processes>" parallel processes, parallel scheme set as "<parallel_scheme>" and up to "2" tasks per worker
+    Then I should see the following behavex console outputs
+    | output_line                                 |
+    | 43 scenarios passed, 7 failed, 1 skipped    |
+    | Recycled workers:                           |
+    | (max tasks per worker reached)              |
+    And I should not see exception messages in the output
+    And I should see the same number of scenarios in the reports
+    Examples:
+      | parallel_processes | parallel_scheme |
+      | 2                  | scenario        |
+      | 2                  | feature         |
+
+  @WORKER_RECYCLING @PYTHON_3_11_OR_NEWER
+  Scenario: Retire and replace the parallel processes exceeding the maximum memory usage
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes and a maximum worker memory usage of "1" MB
+    Then I should see the following behavex console outputs
+    | output_line                                 |
+    | 43 scenarios passed, 7 failed, 1 skipped    |
+    | Recycled workers:                           |
+    | (max worker RSS exceeded)                   |
+    And I should not see exception messages in the output
+    And I should see the same number of scenarios in the reports
+
+  @WORKER_RECYCLING @PYTHON_3_11_OR_NEWER
+  Scenario: Execute the worker-scoped hooks of the retired parallel processes
+    Given I have installed behavex
+    When I run the behavex command with worker scoped hooks using "2" parallel processes and up to "2" tasks per worker
+    Then I should see the following behavex console outputs
+    | output_line                                 |
+    | 6 scenarios passed, 0 failed, 0 skipped     |
+    | Recycled workers:                           |
+    And I should not see exception messages in the output
+    And I should see the before_all and after_all hooks were executed once per process
+
+  @WORKER_RECYCLING @PYTHON_BEFORE_3_11
+  Scenario: Fail when recycling the parallel processes is requested and the Python version cannot replace them
+    Given I have installed behavex
+    When I run the behavex command with "2" parallel processes, parallel scheme set as "scenario" and up to "2" tasks per worker
+    Then I should see the following behavex console outputs and exit code "1"
+    | output_line                                                              |
+    | Error: Recycling parallel processes requires Python 3.11 or newer        |
+    And I should not see exception messages in the output
@@ -0,0 +1,19 @@
+import os
+
+
+def log_hook_execution(context, hook_name):
+    hooks_log = context.config.userdata.get('hooks_log', '')
+    if hooks_log:
+        with open(hooks_log, 'a') as hooks_log_file:
+            hooks_log_file.write('{} {}\n'.format(hook_name, os.getpid()))
+
+
+def before_all(context):
+    log_hook_execution(context, 'before_all')
+    context.worker_resource = 'ready'
+    if hasattr(context, 'worker_scope'):
+        context.worker_scope.setup_pid = os.getpid()
+
+
+def after_all(context):
+    log_hook_execution(context, 'after_all')
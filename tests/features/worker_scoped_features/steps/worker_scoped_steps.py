@@ -0,0 +1,13 @@
+import os
+
+from behave import given, then
+
+
+@given('the resource created in before_all is available')
+def given_resource_available(context):
+    assert context.worker_resource == 'ready', 'The resource created in before_all is not available'
+
+
+@then('the worker scope was initialized by the current process')
+def then_worker_scope_initialized(context):
+    assert context.worker_scope.setup_pid == os.getpid(), 'The worker scope was not initialized by the current process'
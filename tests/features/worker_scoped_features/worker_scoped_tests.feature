@@ -0,0 +1,31 @@
+Feature: Worker Scoped Hooks Tests
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 1
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 2
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 3
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 4
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 5
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
+
+  @WORKER_SCOPED
+  Scenario: Worker scoped scenario 6
+    Given the resource created in before_all is available
+    Then the worker scope was initialized by the current process
@@ -0,0 +1,16 @@
+Feature: Worker Scoped Hooks
+
+  @WORKER_SCOPED_HOOKS
+  Scenario Outline: The before_all and after_all hooks are executed once per process by <parallel_scheme>
+    Given I have installed behavex
+    When I run the behavex command with worker scoped hooks using "<parallel_processes>" parallel processes and parallel scheme set as "<parallel_scheme>"
+    Then I should see the following behavex console outputs and exit code "0"
+    | output_line                              |
+    | scenarios passed, 0 failed, 0 skipped    |
+    | Exit code: 0                             |
+    And I should not see error messages in the output
+    And I should see the before_all and after_all hooks were executed once per process
+    Examples:
+      | parallel_scheme | parallel_processes |
+      | scenario        | 2                  |
+      | scenario        | 1                  |